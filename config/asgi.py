@@ -3,14 +3,37 @@ ASGI config for interview project.
 
 It exposes the ASGI callable as a module-level variable named ``application``.
 
+``/orders/events/`` is served directly as a server-sent event stream; every
+other request goes to Django.
+
 For more information on this file, see
 https://docs.djangoproject.com/en/4.1/howto/deployment/asgi/
 """
 
 import os
 
+from django.conf import settings
 from django.core.asgi import get_asgi_application
+from django.urls import get_resolver
+
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'config.settings.local')
+
+django_application = get_asgi_application()
+# See config/wsgi.py.
+get_resolver().url_patterns
+
+from interview.core.bitmaps import bitmap_index  # noqa: E402
+from interview.order.events import order_events  # noqa: E402
+
+if settings.BITMAP_INDEX:
+    bitmap_index.build()
+
+streams = {
+    '/orders/events/': order_events,
+}
 
-os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'interview.settings')
 
-application = get_asgi_application()
+async def application(scope, receive, send):
+    if scope['type'] == 'http' and scope['path'] in streams:
+        return await streams[scope['path']](scope, receive, send)
+    return await django_application(scope, receive, send)
@@ -42,10 +42,13 @@ INSTALLED_APPS = [
     'rest_framework',
     'interview.core',
     'interview.inventory',
-    'interview.order'
+    'interview.order',
+    'interview.jobs',
 ]
 
 MIDDLEWARE = [
+    # Fails requests over their view's max_queries while DEBUG is on.
+    'interview.core.querybudget.QueryBudgetMiddleware',
     'django.middleware.security.SecurityMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
     'django.middleware.common.CommonMiddleware',
@@ -132,3 +135,20 @@ STATIC_ROOT = 'interview/static'
 # https://docs.djangoproject.com/en/4.1/ref/settings/#default-auto-field
 
 DEFAULT_AUTO_FIELD = 'django.db.models.BigAutoField'
+
+
+# Pub/sub used to push events (e.g. /orders/events/) to streaming clients
+
+EVENT_BROKER = 'interview.core.pubsub.InProcessBroker'
+
+
+# Directory the file-based jobs (imports and exports) read and write under.
+# Job payload paths are relative to it and cannot leave it.
+
+JOB_FILES_DIR = BASE_DIR.parent / 'job_files'
+
+
+# Answer tag/type/language list filters from in-process bitmaps (see
+# interview.core.bitmaps), built when a worker boots. Costs memory per worker.
+
+BITMAP_INDEX = False
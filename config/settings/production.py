@@ -0,0 +1,115 @@
+"""
+Production settings, tuned for throughput.
+
+Secrets and hosts come from the environment. The cache backend is shared by
+every worker process, which the generation counters in ``interview.core.cache``
+rely on: set ``REDIS_URL`` (needs the ``redis`` package) or run
+``manage.py createcachetable`` for the database-backed fallback.
+"""
+import os
+
+from .base import *  # noqa: F401,F403
+from .base import DATABASES, MIDDLEWARE, TEMPLATES
+
+
+DEBUG = False
+
+SECRET_KEY = os.environ['DJANGO_SECRET_KEY']
+
+ALLOWED_HOSTS = [host for host in os.environ.get('DJANGO_ALLOWED_HOSTS', '').split(',') if host]
+
+
+# Database
+# Keep connections open between requests instead of reconnecting every time.
+
+DATABASES['default'].update({
+    'NAME': os.environ.get('DATABASE_NAME', DATABASES['default']['NAME']),
+    'USER': os.environ.get('DATABASE_USER', DATABASES['default']['USER']),
+    'PASSWORD': os.environ.get('DATABASE_PASSWORD', DATABASES['default']['PASSWORD']),
+    'HOST': os.environ.get('DATABASE_HOST', DATABASES['default']['HOST']),
+    'PORT': os.environ.get('DATABASE_PORT', DATABASES['default']['PORT']),
+    'CONN_MAX_AGE': int(os.environ.get('DATABASE_CONN_MAX_AGE', 60)),
+    'CONN_HEALTH_CHECKS': True,
+})
+
+
+# Cache
+#
+# Redis (the redis package is in requirements.txt) when REDIS_URL is set. The
+# DatabaseCache fallback has no atomic incr(), so generation bumps take a lock
+# on it (see interview.core.cache.bump_generation) and every cache hit is a
+# query; use it only for single-host deployments.
+
+if os.environ.get('REDIS_URL'):
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.redis.RedisCache',
+            'LOCATION': os.environ['REDIS_URL'],
+        }
+    }
+else:
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.db.DatabaseCache',
+            'LOCATION': 'django_cache',
+        }
+    }
+
+
+# Bitmap index of tags, types and languages for list filters; see base.py.
+
+BITMAP_INDEX = os.environ.get('BITMAP_INDEX', '') == '1'
+
+
+# Where import/export jobs read and write; see base.py.
+
+JOB_FILES_DIR = os.environ.get('JOB_FILES_DIR', JOB_FILES_DIR)
+
+
+# Templates (admin only): compile once per process.
+
+TEMPLATES[0]['APP_DIRS'] = False
+TEMPLATES[0]['OPTIONS']['loaders'] = [
+    ('django.template.loaders.cached.Loader', [
+        'django.template.loaders.filesystem.Loader',
+        'django.template.loaders.app_directories.Loader',
+    ]),
+]
+TEMPLATES[0]['OPTIONS']['context_processors'] = [
+    processor for processor in TEMPLATES[0]['OPTIONS']['context_processors']
+    if processor != 'django.template.context_processors.debug'
+]
+
+
+# Compress large responses (brotli or gzip); first, so it sees the final body.
+
+MIDDLEWARE = [
+    'interview.core.middleware.CompressionMiddleware',
+    *(middleware for middleware in MIDDLEWARE if middleware != 'interview.core.querybudget.QueryBudgetMiddleware'),
+]
+
+
+# Django REST framework
+
+REST_FRAMEWORK = {
+    # Only JSON: the browsable API renders a full HTML page (and runs extra
+    # queries for its forms) whenever a browser asks.
+    'DEFAULT_RENDERER_CLASSES': [
+        'rest_framework.renderers.JSONRenderer',
+    ],
+    # Opt-in ?limit=&offset= on every list view; PAGE_SIZE stays unset so the
+    # response shape matches the other environments.
+    'DEFAULT_PAGINATION_CLASS': 'interview.core.pagination.LimitOffsetPagination',
+    # Token buckets in the shared cache, per client; views with a
+    # ``throttle_scope`` get an extra bucket per client for that scope.
+    'DEFAULT_THROTTLE_CLASSES': [
+        'interview.core.throttling.AnonTokenBucketThrottle',
+        'interview.core.throttling.UserTokenBucketThrottle',
+        'interview.core.throttling.ScopedTokenBucketThrottle',
+    ],
+    'DEFAULT_THROTTLE_RATES': {
+        'anon': os.environ.get('THROTTLE_ANON_RATE', '600/min'),
+        'user': os.environ.get('THROTTLE_USER_RATE', '3000/min'),
+        'orders': os.environ.get('THROTTLE_ORDERS_RATE', '120/min'),
+    },
+}
@@ -16,8 +16,12 @@ Including another URLconf
 from django.contrib import admin
 from django.urls import include, path
 
+from interview.core.views import ChangeFeedView
+
 urlpatterns = [
     path('admin/', admin.site.urls),
+    path('changes/', ChangeFeedView.as_view(), name='changes'),
     path('inventory/', include('interview.inventory.urls')),
-    path('orders/', include('interview.order.urls'))
+    path('orders/', include('interview.order.urls')),
+    path('jobs/', include('interview.jobs.urls')),
 ]
@@ -9,8 +9,20 @@ https://docs.djangoproject.com/en/4.1/howto/deployment/wsgi/
 
 import os
 
+from django.conf import settings
 from django.core.wsgi import get_wsgi_application
+from django.urls import get_resolver
 
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'config.settings.local')
 
 application = get_wsgi_application()
+
+# Load the URLconf, and with it every view and serializer, while the worker boots
+# rather than during the first request it serves; otherwise that request pays
+# for the import (about 115ms on PostgreSQL).
+get_resolver().url_patterns
+
+if settings.BITMAP_INDEX:
+    from interview.core.bitmaps import bitmap_index
+
+    bitmap_index.build()
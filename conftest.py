@@ -0,0 +1,50 @@
+import pytest
+from django.core.cache import cache
+
+from interview.core.querybudget import QueryBudgetMiddleware, max_queries as max_queries_context
+
+
+@pytest.fixture(autouse=True)
+def query_budgets(monkeypatch):
+    """Enforce every view's ``max_queries`` in tests, whatever ``DEBUG`` is set to."""
+    monkeypatch.setattr(QueryBudgetMiddleware, 'enforce', True)
+
+
+@pytest.fixture(autouse=True)
+def cold_cache():
+    """Start every test from an empty cache, so query counts are the uncached worst case."""
+    cache.clear()
+    yield
+    cache.clear()
+
+
+@pytest.fixture
+def max_queries():
+    """
+    Budget a block of test code: ``with max_queries(3): ...`` fails with a
+    report of the duplicated SQL when the block runs more than 3 queries.
+    """
+    return max_queries_context
+
+
+@pytest.fixture
+def inventory(db):
+    from interview.inventory.models import Inventory, InventoryLanguage, InventoryTag, InventoryType
+
+    inventory = Inventory.objects.create(
+        name='The Matrix',
+        type=InventoryType.objects.create(name='Movie'),
+        language=InventoryLanguage.objects.create(name='English'),
+        metadata={'year': 1999, 'actors': ['Keanu Reeves'], 'imdb_rating': 8.7, 'rotten_tomatoes_rating': 83},
+    )
+    inventory.tags.add(InventoryTag.objects.create(name='Action'))
+    return inventory
+
+
+@pytest.fixture
+def order(inventory):
+    from interview.order.models import Order, OrderTag
+
+    order = Order.objects.create(inventory=inventory, start_date='2030-01-01', embargo_date='2030-02-01')
+    order.tags.add(OrderTag.objects.create(name='Priority'))
+    return order
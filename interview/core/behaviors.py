@@ -1,5 +1,10 @@
+from datetime import datetime
+
 from django.core.exceptions import ObjectDoesNotExist
 from django.db import models
+from django.utils import timezone
+
+from interview.core.cache import bump_generation
 
 
 class UUIDModel(models.Model):
@@ -23,6 +28,19 @@ class TimestampedModel(models.Model):
     class Meta:
         abstract = True
 
+    @classmethod
+    def update_if_unmodified(cls, pk: int, updated_at: datetime, **fields) -> bool:
+        fields['updated_at'] = timezone.now()
+        updated = cls.objects.filter(pk=pk, updated_at=updated_at).update(**fields) == 1
+        if updated:
+            bump_generation(cls)
+        return updated
+
+    @classmethod
+    def delete_if_unmodified(cls, pk: int, updated_at: datetime) -> bool:
+        deleted, _ = cls.objects.filter(pk=pk, updated_at=updated_at).delete()
+        return deleted > 0
+
 
 class IsActiveModel(models.Model):
     is_active = models.BooleanField(default=True)
@@ -33,10 +51,12 @@ class IsActiveModel(models.Model):
     @classmethod
     def activate(cls, pk: int):
         cls.objects.filter(pk=pk).update(is_active=False)
+        bump_generation(cls)
     
     @classmethod
     def deactivate(cls, pk: int):
         cls.objects.filter(pk=pk).update(is_active=True)
+        bump_generation(cls)
         
 
 class NameModel(models.Model):
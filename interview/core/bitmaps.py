@@ -0,0 +1,381 @@
+import threading
+from datetime import timedelta
+from functools import reduce
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+from django.contrib.postgres.fields import ArrayField
+from django.core.cache import cache
+from django.db.models import QuerySet
+from django.utils import timezone
+
+from interview.core.cache import get_generation
+from interview.core.changes import change_feed
+
+
+# Ids are split into chunks of 2**16 by their high bits, each chunk an int used as a bitset.
+CHUNK_BITS = 16
+CHUNK_MASK = (1 << CHUNK_BITS) - 1
+
+
+class Bitmap:
+    """
+    A set of ids as chunked bitsets: only chunks holding at least one id are
+    stored, and ``&``, ``|`` and ``-`` work chunk by chunk on Python ints.
+    """
+    __slots__ = ('chunks',)
+
+    def __init__(self, chunks: Optional[Dict[int, int]] = None):
+        self.chunks = chunks or {}
+
+    @classmethod
+    def from_ids(cls, ids: Iterable[int]) -> 'Bitmap':
+        buffers = {}
+        for pk in ids:
+            buffer = buffers.get(pk >> CHUNK_BITS)
+            if buffer is None:
+                buffer = buffers[pk >> CHUNK_BITS] = bytearray(1 << (CHUNK_BITS - 3))
+            buffer[(pk & CHUNK_MASK) >> 3] |= 1 << (pk & 7)
+        return cls({key: int.from_bytes(buffer, 'little') for key, buffer in buffers.items()})
+
+    def copy(self) -> 'Bitmap':
+        return Bitmap(dict(self.chunks))
+
+    def add(self, pk: int) -> None:
+        key = pk >> CHUNK_BITS
+        self.chunks[key] = self.chunks.get(key, 0) | (1 << (pk & CHUNK_MASK))
+
+    def discard(self, pk: int) -> None:
+        key = pk >> CHUNK_BITS
+        chunk = self.chunks.get(key, 0) & ~(1 << (pk & CHUNK_MASK))
+        if chunk:
+            self.chunks[key] = chunk
+        else:
+            self.chunks.pop(key, None)
+
+    def difference_update(self, other: 'Bitmap') -> None:
+        for key, chunk in other.chunks.items():
+            remaining = self.chunks.get(key, 0) & ~chunk
+            if remaining:
+                self.chunks[key] = remaining
+            else:
+                self.chunks.pop(key, None)
+
+    def __contains__(self, pk: int) -> bool:
+        return bool(self.chunks.get(pk >> CHUNK_BITS, 0) >> (pk & CHUNK_MASK) & 1)
+
+    def __and__(self, other: 'Bitmap') -> 'Bitmap':
+        chunks = {}
+        for key, chunk in self.chunks.items():
+            chunk &= other.chunks.get(key, 0)
+            if chunk:
+                chunks[key] = chunk
+        return Bitmap(chunks)
+
+    def __or__(self, other: 'Bitmap') -> 'Bitmap':
+        chunks = dict(self.chunks)
+        for key, chunk in other.chunks.items():
+            chunks[key] = chunks.get(key, 0) | chunk
+        return Bitmap(chunks)
+
+    def __sub__(self, other: 'Bitmap') -> 'Bitmap':
+        chunks = {}
+        for key, chunk in self.chunks.items():
+            chunk &= ~other.chunks.get(key, 0)
+            if chunk:
+                chunks[key] = chunk
+        return Bitmap(chunks)
+
+    def __len__(self) -> int:
+        return sum(chunk.bit_count() for chunk in self.chunks.values())
+
+    def __bool__(self) -> bool:
+        return bool(self.chunks)
+
+    def __iter__(self) -> Iterator[int]:
+        return iter(self.select(0, None))
+
+    def select(self, offset: int, limit: Optional[int]) -> List[int]:
+        """The ids from the ``offset``-th smallest on, at most ``limit`` of them, ascending."""
+        ids = []
+        for key in sorted(self.chunks):
+            if limit is not None and len(ids) >= limit:
+                break
+            chunk = self.chunks[key]
+            count = chunk.bit_count()
+            if offset >= count:
+                offset -= count
+                continue
+            if offset:
+                chunk = skip_bits(chunk, offset)
+                offset = 0
+            base = key << CHUNK_BITS
+            while chunk and (limit is None or len(ids) < limit):
+                lowest = chunk & -chunk
+                ids.append(base + lowest.bit_length() - 1)
+                chunk ^= lowest
+        return ids
+
+
+def skip_bits(chunk: int, count: int) -> int:
+    """Clear the ``count`` lowest set bits of ``chunk``."""
+    low, high = 0, chunk.bit_length()
+    while low < high:
+        middle = (low + high) // 2
+        if (chunk & ((1 << middle) - 1)).bit_count() < count:
+            low = middle + 1
+        else:
+            high = middle
+    return chunk >> low << low
+
+
+class Expression:
+    """Filter over a model's bitmaps; combine with ``&`` (AND), ``|`` (OR) and ``~`` (NOT)."""
+
+    def evaluate(self, bitmaps: 'ModelBitmaps') -> Bitmap:
+        raise NotImplementedError
+
+    def __and__(self, other: 'Expression') -> 'Expression':
+        return All(self, other)
+
+    def __or__(self, other: 'Expression') -> 'Expression':
+        return Any(self, other)
+
+    def __invert__(self) -> 'Expression':
+        return Not(self)
+
+
+class Term(Expression):
+    """Rows whose ``dimension`` has ``value``, e.g. ``Term('tags', 3)``."""
+
+    def __init__(self, dimension: str, value: int):
+        self.dimension = dimension
+        self.value = value
+
+    def evaluate(self, bitmaps: 'ModelBitmaps') -> Bitmap:
+        return bitmaps.get(self.dimension, self.value)
+
+
+class All(Expression):
+    """Rows matching every expression; all rows when there are none."""
+
+    def __init__(self, *expressions: Expression):
+        self.expressions = expressions
+
+    def evaluate(self, bitmaps: 'ModelBitmaps') -> Bitmap:
+        return reduce(lambda result, expression: result & expression.evaluate(bitmaps), self.expressions, bitmaps.universe.copy())
+
+
+class Any(Expression):
+    """Rows matching at least one expression; no rows when there are none."""
+
+    def __init__(self, *expressions: Expression):
+        self.expressions = expressions
+
+    def evaluate(self, bitmaps: 'ModelBitmaps') -> Bitmap:
+        return reduce(lambda result, expression: result | expression.evaluate(bitmaps), self.expressions, Bitmap())
+
+
+class Not(Expression):
+    def __init__(self, expression: Expression):
+        self.expression = expression
+
+    def evaluate(self, bitmaps: 'ModelBitmaps') -> Bitmap:
+        return bitmaps.universe - self.expression.evaluate(bitmaps)
+
+
+class ModelBitmaps:
+    """
+    One bitmap of row ids per value of each indexed column of a model, plus
+    one of every row.
+
+    Writes in this process are applied by the signal receivers in
+    ``interview.core.signals``. Writes by other processes are noticed through
+    the model's cache generation: the rows updated, and the tombstones written,
+    since the last sync are then re-read, as the change feed does.
+    """
+    settle = timedelta(seconds=2)
+    chunk_size = 10000
+
+    def __init__(self, model, dimensions: Dict[str, str]):
+        self.model = model
+        self.dimensions = dimensions
+        self.columns = list(dimensions.values())
+        self.arrays = {column for column in self.columns if isinstance(model._meta.get_field(column), ArrayField)}
+        self.universe = Bitmap()
+        self.bitmaps: Dict[Tuple[str, int], Bitmap] = {}
+        self.generation = None
+        self.synced_at = None
+        self.lock = threading.RLock()
+
+    @property
+    def is_built(self) -> bool:
+        return self.generation is not None
+
+    def get(self, dimension: str, value: int) -> Bitmap:
+        return self.bitmaps.get((dimension, value), Bitmap())
+
+    def evaluate(self, expression: Expression) -> Bitmap:
+        self.ensure_current()
+        with self.lock:
+            return expression.evaluate(self)
+
+    def ensure_current(self) -> None:
+        if self.generation == get_generation(self.model):
+            return
+        with self.lock:
+            if not self.is_built:
+                self.build()
+            elif self.generation != get_generation(self.model):
+                self.catch_up()
+
+    def build(self) -> None:
+        generation = get_generation(self.model)
+        synced_at = timezone.now()
+        ids = []
+        ids_by_key: Dict[Tuple[str, int], List[int]] = {}
+        rows = self.model._base_manager.values_list('pk', *self.columns).iterator(chunk_size=self.chunk_size)
+        for pk, *values in rows:
+            ids.append(pk)
+            for key in self.get_keys(values):
+                ids_by_key.setdefault(key, []).append(pk)
+
+        with self.lock:
+            self.universe = Bitmap.from_ids(ids)
+            self.bitmaps = {key: Bitmap.from_ids(key_ids) for key, key_ids in ids_by_key.items()}
+            self.generation = generation
+            self.synced_at = synced_at
+
+    def catch_up(self) -> None:
+        generation = get_generation(self.model)
+        synced_at = timezone.now()
+        since = self.synced_at - self.settle
+        pks = set(self.model._base_manager.filter(updated_at__gte=since).values_list('pk', flat=True))
+        stream = change_feed.get_stream_name(self.model)
+        if stream is not None:
+            from interview.core.models import Tombstone
+
+            pks.update(
+                Tombstone.objects.filter(deleted_at__gte=since, stream=stream).values_list('object_id', flat=True)
+            )
+        self.refresh(pks)
+        self.generation = generation
+        self.synced_at = synced_at
+
+    def refresh(self, pks: Iterable[int]) -> None:
+        """Re-read the rows ``pks`` from the database; ids no longer there are dropped."""
+        pks = list(pks)
+        if not pks:
+            return
+        rows = list(self.model._base_manager.filter(pk__in=pks).values_list('pk', *self.columns))
+        with self.lock:
+            self.remove(pks)
+            for pk, *values in rows:
+                self.universe.add(pk)
+                for key in self.get_keys(values):
+                    self.bitmaps.setdefault(key, Bitmap()).add(pk)
+
+    def remove(self, pks: Iterable[int]) -> None:
+        with self.lock:
+            removed = Bitmap.from_ids(pks) & self.universe
+            if not removed:
+                return
+            self.universe.difference_update(removed)
+            for key, bitmap in list(self.bitmaps.items()):
+                bitmap.difference_update(removed)
+                if not bitmap:
+                    del self.bitmaps[key]
+
+    def remove_value(self, column: str, value: int) -> None:
+        with self.lock:
+            for dimension, dimension_column in self.dimensions.items():
+                if dimension_column == column:
+                    self.bitmaps.pop((dimension, value), None)
+
+    def get_keys(self, values) -> Iterator[Tuple[str, int]]:
+        for (dimension, column), value in zip(self.dimensions.items(), values):
+            if column in self.arrays:
+                for item in value or ():
+                    yield dimension, item
+            elif value is not None:
+                yield dimension, value
+
+
+class BitmapIndex:
+    """
+    In-process bitmap indexes of the models registered in ``apps.ready()``,
+    e.g. ``register(Inventory, type='type_id', tags='tag_ids')``. Each model's
+    bitmaps are built from the database on first use (or by ``build()`` when
+    a worker boots) and answer ``Expression`` filters without a query.
+    """
+
+    def __init__(self):
+        self.models: Dict[type, ModelBitmaps] = {}
+
+    def register(self, model, **dimensions: str) -> None:
+        self.models[model] = ModelBitmaps(model, dimensions)
+
+    def get(self, model) -> Optional[ModelBitmaps]:
+        return self.models.get(model)
+
+    def build(self) -> None:
+        for bitmaps in self.models.values():
+            bitmaps.build()
+
+    def evaluate(self, model, expression: Expression) -> Bitmap:
+        return self.models[model].evaluate(expression)
+
+    def refresh(self, model, pks: Iterable[int]) -> None:
+        bitmaps = self.models.get(model)
+        if bitmaps is not None and bitmaps.is_built:
+            bitmaps.refresh(pks)
+
+    def remove(self, model, pks: Iterable[int]) -> None:
+        bitmaps = self.models.get(model)
+        if bitmaps is not None and bitmaps.is_built:
+            bitmaps.remove(pks)
+
+    def remove_value(self, model, column: str, value: int) -> None:
+        bitmaps = self.models.get(model)
+        if bitmaps is not None and bitmaps.is_built:
+            bitmaps.remove_value(column, value)
+
+
+bitmap_index = BitmapIndex()
+
+
+def get_name_ids(model) -> Dict[str, int]:
+    """``name -> id`` for a small lookup table, cached until the table changes."""
+    key = f'names:{model._meta.label_lower}:{get_generation(model)}'
+    ids = cache.get(key)
+    if ids is None:
+        ids = dict(model.objects.values_list('name', 'id'))
+        cache.set(key, ids, timeout=None)
+    return ids
+
+
+class BitmapQuerySet:
+    """
+    The rows of ``queryset`` whose ids are in ``bitmap``, in id order, for DRF
+    to paginate: the count comes from the bitmap and a slice loads only its
+    own ids. Rows that no longer match ``queryset`` are left out of the page.
+    """
+
+    def __init__(self, queryset: QuerySet, bitmap: Bitmap):
+        self.queryset = queryset
+        self.bitmap = bitmap
+        self.model = queryset.model
+
+    def count(self) -> int:
+        return len(self.bitmap)
+
+    def __len__(self) -> int:
+        return self.count()
+
+    def __getitem__(self, index):
+        if not isinstance(index, slice):
+            raise TypeError('BitmapQuerySet only supports slicing.')
+        start = index.start or 0
+        limit = index.stop - start if index.stop is not None else None
+        ids = self.bitmap.select(start, limit)
+        objects = self.queryset.in_bulk(ids)
+        return [objects[pk] for pk in ids if pk in objects]
@@ -0,0 +1,85 @@
+import time
+
+from django.core.cache import cache, caches
+from django.core.cache.backends.db import BaseDatabaseCache
+from django.core.cache.backends.filebased import FileBasedCache
+
+
+def get_missing_cache_key(model, pk: int) -> str:
+    return f'missing:{model._meta.label_lower}:{pk}'
+
+
+def get_generation_key(model) -> str:
+    return f'generation:{model._meta.label_lower}'
+
+
+def get_generation(model) -> int:
+    """
+    Return the model's cache generation, bumped on every write to its table.
+
+    A missing counter starts at the current time rather than zero, so a counter
+    that was evicted can never come back with a value used before.
+    """
+    key = get_generation_key(model)
+    generation = cache.get(key)
+    if generation is None:
+        cache.add(key, time.time_ns(), timeout=None)
+        generation = cache.get(key)
+    return generation
+
+
+def get_generations(models) -> str:
+    return ':'.join(str(get_generation(model)) for model in models)
+
+
+def has_atomic_incr() -> bool:
+    """False for the backends whose ``incr()`` is a plain get + set (database and file caches)."""
+    return not isinstance(caches['default'], (BaseDatabaseCache, FileBasedCache))
+
+
+def bump_generation(model) -> None:
+    key = get_generation_key(model)
+    # Two unserialized get + set bumps can land on the same value, and a page cached
+    # between them would outlive the second write; take a lock around them instead.
+    locked = not has_atomic_incr() and wait_for_lock(key, timeout=5)
+    try:
+        cache.incr(key)
+    except ValueError:
+        cache.add(key, time.time_ns(), timeout=None)
+    finally:
+        if locked:
+            release_lock(key)
+
+
+def acquire_lock(key: str, timeout: float) -> bool:
+    return cache.add(f'lock:{key}', True, timeout=timeout)
+
+
+def release_lock(key: str) -> None:
+    cache.delete(f'lock:{key}')
+
+
+def wait_for_lock(key: str, timeout: float, interval: float = 0.002) -> bool:
+    """Take the lock on ``key``, waiting up to ``timeout`` seconds for its holder; ``False`` if it never frees."""
+    deadline = time.monotonic() + timeout
+    while not acquire_lock(key, timeout):
+        if time.monotonic() >= deadline:
+            return False
+        time.sleep(interval)
+    return True
+
+
+def wait_for(key: str, timeout: float, interval: float = 0.05):
+    """
+    Poll the cache for ``key`` while another process holds its lock. ``None``
+    when the lock is released without a value being stored, or on timeout.
+    """
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        time.sleep(interval)
+        value = cache.get(key)
+        if value is not None:
+            return value
+        if cache.get(f'lock:{key}') is None:
+            return None
+    return None
@@ -0,0 +1,167 @@
+import base64
+import json
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional, Tuple
+
+from django.db.models import Q
+from django.utils import timezone
+from django.utils.functional import cached_property
+from django.utils.module_loading import import_string
+
+
+@dataclass
+class ChangeStream:
+    name: str
+    model: type
+    serializer_path: str
+    select_related: Tuple[str, ...] = ()
+    prefetch_related: Tuple[str, ...] = ()
+
+    @cached_property
+    def serializer_class(self):
+        return import_string(self.serializer_path)
+
+    def get_queryset(self):
+        queryset = self.model.objects.all()
+        if self.select_related:
+            queryset = queryset.select_related(*self.select_related)
+        if self.prefetch_related:
+            queryset = queryset.prefetch_related(*self.prefetch_related)
+        return queryset
+
+
+class ChangeFeed:
+    """
+    Registry of the models exposed through ``/changes/``.
+
+    Apps register their models from ``AppConfig.ready()``; deletions of registered
+    models are recorded as ``Tombstone`` rows by ``interview.core.signals``.
+    """
+
+    def __init__(self):
+        self.streams: Dict[str, ChangeStream] = {}
+
+    def register(self, name: str, model: type, serializer_path: str, **kwargs) -> None:
+        self.streams[name] = ChangeStream(name, model, serializer_path, **kwargs)
+
+    def get_stream_name(self, model: type) -> Optional[str]:
+        for stream in self.streams.values():
+            if stream.model is model:
+                return stream.name
+        return None
+
+
+change_feed = ChangeFeed()
+
+
+# Tombstones sort as their own stream, ahead of the registered ones.
+TOMBSTONE_RANK = 0
+
+
+@dataclass(frozen=True)
+class Cursor:
+    updated_at: datetime
+    rank: int
+    id: int
+
+    def encode(self) -> str:
+        payload = json.dumps([self.updated_at.isoformat(), self.rank, self.id])
+        return base64.urlsafe_b64encode(payload.encode()).decode().rstrip('=')
+
+    @classmethod
+    def decode(cls, token: str) -> 'Cursor':
+        try:
+            payload = base64.urlsafe_b64decode(token + '=' * (-len(token) % 4))
+            updated_at, rank, id_ = json.loads(payload)
+            return cls(datetime.fromisoformat(updated_at), int(rank), int(id_))
+        except (ValueError, TypeError):
+            raise ValueError('Invalid since token.')
+
+
+def get_cursor_filter(field: str, rank: int, cursor: Optional[Cursor]) -> Q:
+    """
+    Keyset condition selecting the rows of stream ``rank`` that sort after ``cursor``.
+
+    Rows are ordered by ``(updated_at, stream rank, id)``; within one stream that
+    reduces to ``(updated_at, id)``, which is what the indexes cover.
+    """
+    if cursor is None:
+        return Q()
+    if rank < cursor.rank:
+        return Q(**{f'{field}__gt': cursor.updated_at})
+    if rank > cursor.rank:
+        return Q(**{f'{field}__gte': cursor.updated_at})
+    return Q(**{f'{field}__gt': cursor.updated_at}) | Q(**{field: cursor.updated_at, 'id__gt': cursor.id})
+
+
+def read_changes(cursor: Optional[Cursor], limit: int, settle: timedelta) -> Tuple[List[dict], Optional[Cursor]]:
+    """
+    Return up to ``limit`` changes after ``cursor`` and the cursor to resume from.
+
+    Each stream's keys are read with its own keyset query of at most ``limit``
+    rows and merged in Python; only the rows that make the page are then loaded
+    and serialized. A sync pass therefore costs work proportional to the number
+    of changes, not to the size of the tables. Rows younger than ``settle`` are
+    held back to give transactions that started earlier time to commit.
+    """
+    from interview.core.models import Tombstone
+
+    horizon = timezone.now() - settle
+    sources = {TOMBSTONE_RANK: None}
+    keys = list(
+        Tombstone.objects.filter(
+            get_cursor_filter('deleted_at', TOMBSTONE_RANK, cursor),
+            deleted_at__lte=horizon,
+        ).order_by('deleted_at', 'id').values_list('deleted_at', 'id')[:limit]
+    )
+    keys = [(updated_at, TOMBSTONE_RANK, id_) for updated_at, id_ in keys]
+
+    for rank, stream in enumerate(change_feed.streams.values(), start=TOMBSTONE_RANK + 1):
+        sources[rank] = stream
+        rows = stream.model.objects.filter(
+            get_cursor_filter('updated_at', rank, cursor),
+            updated_at__lte=horizon,
+        ).order_by('updated_at', 'id').values_list('updated_at', 'id')[:limit]
+        keys.extend((updated_at, rank, id_) for updated_at, id_ in rows)
+
+    keys.sort()
+    page = keys[:limit]
+    if not page:
+        return [], cursor
+
+    ids_by_rank = {}
+    for _, rank, id_ in page:
+        ids_by_rank.setdefault(rank, []).append(id_)
+
+    rows_by_rank = {}
+    for rank, ids in ids_by_rank.items():
+        stream = sources[rank]
+        queryset = Tombstone.objects.all() if stream is None else stream.get_queryset()
+        rows_by_rank[rank] = queryset.in_bulk(ids)
+
+    changes = []
+    for _, rank, id_ in page:
+        stream = sources[rank]
+        row = rows_by_rank[rank].get(id_)
+        if row is None:
+            # Deleted between the two reads; its tombstone follows in a later page.
+            continue
+        if stream is None:
+            changes.append({
+                'type': row.stream,
+                'op': 'delete',
+                'id': row.object_id,
+                'updated_at': row.deleted_at,
+            })
+        else:
+            created = cursor is None or row.created_at > cursor.updated_at
+            changes.append({
+                'type': stream.name,
+                'op': 'insert' if created else 'update',
+                'id': row.id,
+                'updated_at': row.updated_at,
+                'data': stream.serializer_class(row).data,
+            })
+
+    return changes, Cursor(*page[-1])
@@ -0,0 +1,200 @@
+import csv
+import datetime
+import json
+import sys
+import time
+from abc import ABC, abstractmethod
+from decimal import Decimal
+from itertools import islice
+from typing import Callable, Iterator, List, Optional, TextIO, Tuple
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+from django.db.models import QuerySet
+
+
+ProgressCallback = Callable[[int, float], None]
+
+
+def to_cell(value):
+    """Scalars are written as they are; lists and objects (from JSON metadata) as JSON text."""
+    if value is None or isinstance(value, (str, int, float, bool, Decimal, datetime.date)):
+        return value
+    return json.dumps(value)
+
+
+class CsvSink:
+    """
+    Writes rows to CSV, optionally split into files of ``rows_per_file`` rows
+    named ``<stem>-0001<suffix>``, ``<stem>-0002<suffix>``... ``-`` writes to stdout.
+    """
+
+    def __init__(self, path: str, columns: List[str], rows_per_file: Optional[int] = None):
+        self.path = path
+        self.columns = columns
+        self.rows_per_file = rows_per_file
+        self.part = 0
+        self.rows_in_file = 0
+        self.file: Optional[TextIO] = None
+        self.writer = None
+
+    def open_next(self) -> None:
+        self.close()
+        self.part += 1
+        self.rows_in_file = 0
+        if self.path == '-':
+            self.file = sys.stdout
+        else:
+            path = self.path
+            if self.rows_per_file:
+                stem, dot, suffix = self.path.rpartition('.')
+                path = f'{stem}-{self.part:04d}.{suffix}' if dot else f'{self.path}-{self.part:04d}'
+            self.file = open(path, 'w', newline='')
+        self.writer = csv.writer(self.file)
+        self.writer.writerow(self.columns)
+
+    def write(self, rows: List[tuple]) -> None:
+        while rows:
+            if self.writer is None or (self.rows_per_file and self.rows_in_file >= self.rows_per_file):
+                self.open_next()
+            room = len(rows) if not self.rows_per_file else self.rows_per_file - self.rows_in_file
+            self.writer.writerows([to_cell(value) for value in row] for row in rows[:room])
+            self.rows_in_file += min(room, len(rows))
+            rows = rows[room:]
+
+    def close(self) -> None:
+        if self.file is not None and self.file is not sys.stdout:
+            self.file.close()
+        self.file = None
+        self.writer = None
+
+
+class ParquetSink:
+    """Writes each chunk as one Parquet row group."""
+
+    def __init__(self, path: str, columns: List[str]):
+        # pyarrow is slow to import, so only Parquet exports load it.
+        import pyarrow
+        import pyarrow.parquet
+
+        self.pyarrow = pyarrow
+        self.columns = columns
+        self.path = path
+        self.writer = None
+
+    def write(self, rows: List[tuple]) -> None:
+        data = {name: [to_cell(row[index]) for row in rows] for index, name in enumerate(self.columns)}
+        table = self.pyarrow.table(data)
+        if self.writer is None:
+            self.writer = self.pyarrow.parquet.ParquetWriter(self.path, table.schema)
+        self.writer.write_table(table.cast(self.writer.schema))
+
+    def close(self) -> None:
+        if self.writer is not None:
+            self.writer.close()
+
+
+def iter_chunks(rows: Iterator[tuple], size: int) -> Iterator[List[tuple]]:
+    while True:
+        chunk = list(islice(rows, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def export_queryset(queryset: QuerySet, columns: List[str], sink, chunk_size: int = 10_000, progress: Optional[ProgressCallback] = None) -> int:
+    """
+    Stream ``queryset.values_list(*columns)`` into ``sink``, ``chunk_size`` rows at a time.
+
+    ``iterator()`` uses a server-side cursor on PostgreSQL, so memory stays bounded
+    by one chunk regardless of the table size.
+    """
+    started = time.perf_counter()
+    total = 0
+    try:
+        for chunk in iter_chunks(queryset.values_list(*columns).iterator(chunk_size=chunk_size), chunk_size):
+            sink.write(chunk)
+            total += len(chunk)
+            if progress is not None:
+                progress(total, time.perf_counter() - started)
+    finally:
+        sink.close()
+    return total
+
+
+def copy_queryset_to_csv(queryset: QuerySet, columns: List[str], stream: TextIO) -> int:
+    """PostgreSQL only: let the server render the CSV with ``COPY (...) TO STDOUT``."""
+    sql, params = queryset.values_list(*columns).query.sql_with_params()
+    with connection.cursor() as cursor:
+        query = cursor.mogrify(sql, params).decode()
+        cursor.copy_expert(f'COPY ({query}) TO STDOUT WITH (FORMAT csv, HEADER)', stream)
+        return cursor.rowcount
+
+
+def open_sink(path: str, columns: List[str], file_format: str, rows_per_file: Optional[int] = None):
+    if file_format == 'parquet':
+        return ParquetSink(path, columns)
+    return CsvSink(path, columns, rows_per_file)
+
+
+def write_export(
+    queryset: QuerySet,
+    columns: List[str],
+    path: str,
+    file_format: str = 'csv',
+    chunk_size: int = 10_000,
+    rows_per_file: Optional[int] = None,
+    use_copy: bool = False,
+    progress: Optional[ProgressCallback] = None,
+) -> int:
+    if use_copy:
+        if file_format != 'csv' or rows_per_file or connection.vendor != 'postgresql':
+            raise RuntimeError('COPY export only writes a single CSV file on PostgreSQL.')
+        if path == '-':
+            return copy_queryset_to_csv(queryset, columns, sys.stdout)
+        with open(path, 'w', newline='') as stream:
+            return copy_queryset_to_csv(queryset, columns, stream)
+
+    return export_queryset(queryset, columns, open_sink(path, columns, file_format, rows_per_file), chunk_size, progress)
+
+
+class ExportCommand(ABC, BaseCommand):
+    """Shared options and progress reporting for the ``export_*`` commands."""
+
+    @abstractmethod
+    def get_export(self, metadata_keys: Optional[List[str]]) -> Tuple[QuerySet, List[str]]:
+        """The queryset to export and its column names."""
+
+    def add_arguments(self, parser):
+        parser.add_argument('output', help='Output path, or - for stdout (CSV only).')
+        parser.add_argument('--format', choices=['csv', 'parquet'], default='csv')
+        parser.add_argument('--chunk-size', type=int, default=10_000)
+        parser.add_argument('--rows-per-file', type=int, help='Split CSV output into numbered files of this many rows.')
+        parser.add_argument('--metadata-keys', help='Comma separated metadata keys to flatten into columns.')
+        parser.add_argument('--copy', action='store_true', help='Use PostgreSQL COPY TO for a single CSV file.')
+
+    def handle(self, *args, **options):
+        metadata_keys = options['metadata_keys'].split(',') if options['metadata_keys'] else None
+        queryset, columns = self.get_export(metadata_keys)
+        # Progress goes to stderr so that CSV on stdout stays clean.
+        started = time.perf_counter()
+
+        def progress(rows: int, elapsed: float) -> None:
+            self.stderr.write(f'{rows:,} rows ({rows / elapsed:,.0f}/s)')
+
+        try:
+            total = write_export(
+                queryset,
+                columns,
+                options['output'],
+                file_format=options['format'],
+                chunk_size=options['chunk_size'],
+                rows_per_file=options['rows_per_file'],
+                use_copy=options['copy'],
+                progress=progress,
+            )
+        except RuntimeError as e:
+            raise CommandError(str(e))
+
+        elapsed = time.perf_counter() - started
+        self.stderr.write(f'Exported {total:,} rows in {elapsed:.1f}s ({total / max(elapsed, 1e-9):,.0f}/s).')
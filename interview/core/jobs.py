@@ -0,0 +1,10 @@
+from django.utils import timezone
+
+from interview.core.models import IdempotencyKey
+from interview.jobs.registry import register
+
+
+@register('core.purge_idempotency_keys')
+def purge_idempotency_keys(payload: dict) -> dict:
+    deleted, _ = IdempotencyKey.objects.filter(expires_at__lte=timezone.now()).delete()
+    return {'deleted': deleted}
@@ -0,0 +1,43 @@
+import gzip
+import json
+import statistics
+import time
+
+import brotli
+from django.core.management.base import BaseCommand
+from django.test import Client
+
+from interview.core.middleware import CompressionMiddleware
+
+
+class Command(BaseCommand):
+    help = 'Compare bytes on the wire and client parse time of plain and ?format=normalized list responses.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('paths', nargs='*', default=['/inventory/?limit=1000', '/orders/'])
+        parser.add_argument('--repeat', type=int, default=20, help='json.loads runs per response.')
+        parser.add_argument('--host', default='localhost', help='Host header; must be in ALLOWED_HOSTS.')
+
+    def handle(self, *args, **options):
+        client = Client(HTTP_HOST=options['host'], HTTP_ACCEPT='application/json')
+        self.stdout.write(f'{"path":<45} {"raw":>10} {"gzip":>10} {"br":>10} {"parse":>9}')
+        for path in options['paths']:
+            for variant in (path, f'{path}{"&" if "?" in path else "?"}format=normalized'):
+                response = client.get(variant)
+                if response.status_code != 200:
+                    self.stderr.write(f'{variant}: {response.status_code}')
+                    continue
+                body = response.content
+                compressed = gzip.compress(body, compresslevel=6)
+                br = len(brotli.compress(body, quality=CompressionMiddleware.brotli_quality))
+
+                timings = []
+                for _ in range(options['repeat']):
+                    started = time.perf_counter()
+                    json.loads(body)
+                    timings.append(time.perf_counter() - started)
+
+                self.stdout.write(
+                    f'{variant:<45} {len(body):>10,} {len(compressed):>10,} '
+                    f'{br:>10,} {statistics.median(timings) * 1000:>7.2f}ms'
+                )
@@ -0,0 +1,60 @@
+import statistics
+import threading
+import time
+import urllib.error
+import urllib.request
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from itertools import cycle
+
+from django.core.management.base import BaseCommand
+
+
+class Command(BaseCommand):
+    help = 'Fire concurrent GET requests at a running server and report throughput and latency percentiles.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('urls', nargs='+', help='URLs to request, round robin.')
+        parser.add_argument('--requests', type=int, default=1000)
+        parser.add_argument('--concurrency', type=int, default=8)
+        parser.add_argument('--gzip', action='store_true', help='Send Accept-Encoding: gzip.')
+
+    def handle(self, *args, **options):
+        headers = {'Accept': 'application/json'}
+        if options['gzip']:
+            headers['Accept-Encoding'] = 'gzip'
+        urls = cycle(options['urls'])
+        lock = threading.Lock()
+        statuses = Counter()
+        latencies = []
+        transferred = 0
+
+        def fetch(url: str) -> None:
+            nonlocal transferred
+            request = urllib.request.Request(url, headers=headers)
+            started = time.perf_counter()
+            try:
+                with urllib.request.urlopen(request) as response:
+                    status, body = response.status, response.read()
+            except urllib.error.HTTPError as e:
+                status, body = e.code, e.read()
+            elapsed = time.perf_counter() - started
+            with lock:
+                statuses[status] += 1
+                latencies.append(elapsed)
+                transferred += len(body)
+
+        started = time.perf_counter()
+        with ThreadPoolExecutor(options['concurrency']) as executor:
+            for _ in executor.map(fetch, (next(urls) for _ in range(options['requests']))):
+                pass
+        elapsed = time.perf_counter() - started
+
+        percentiles = statistics.quantiles(latencies, n=100)
+        self.stdout.write(
+            f'{len(latencies)} requests in {elapsed:.2f}s: {len(latencies) / elapsed:,.0f} req/s, '
+            f'{transferred / len(latencies) / 1024:.1f}KiB/response\n'
+            f'latency p50 {percentiles[49] * 1000:.1f}ms, p95 {percentiles[94] * 1000:.1f}ms, '
+            f'p99 {percentiles[98] * 1000:.1f}ms\n'
+            f'status {dict(statuses)}'
+        )
@@ -0,0 +1,67 @@
+import os
+import statistics
+import subprocess
+import sys
+import time
+from collections import defaultdict
+from typing import List, Tuple
+
+from django.core.management.base import BaseCommand, CommandError
+
+
+BOOT = 'import django; django.setup()'
+LOAD_URLS = 'from django.urls import get_resolver; get_resolver().url_patterns'
+
+
+def parse_importtime(output: str) -> List[Tuple[str, int, int]]:
+    """Parse ``-X importtime`` lines into ``(module, self_us, cumulative_us)``."""
+    modules = []
+    for line in output.splitlines():
+        if not line.startswith('import time:') or 'self [us]' in line:
+            continue
+        self_us, cumulative_us, name = line[len('import time:'):].split('|')
+        modules.append((name.strip(), int(self_us), int(cumulative_us)))
+    return modules
+
+
+class Command(BaseCommand):
+    help = 'Break down where a fresh process spends its time importing modules during Django startup.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--urls', action='store_true', help='Also load the URLconf, as the first request does.')
+        parser.add_argument('--repeat', type=int, default=5, help='Cold starts to time for the wall clock median.')
+        parser.add_argument('--top', type=int, default=15)
+
+    def run(self, code: str, importtime: bool = False) -> Tuple[float, str]:
+        args = [sys.executable, *(['-X', 'importtime'] if importtime else []), '-c', code]
+        started = time.perf_counter()
+        process = subprocess.run(args, capture_output=True, text=True, env=os.environ.copy())
+        elapsed = time.perf_counter() - started
+        if process.returncode != 0:
+            raise CommandError(process.stderr)
+        return elapsed, process.stderr
+
+    def handle(self, *args, **options):
+        code = f'{BOOT}; {LOAD_URLS}' if options['urls'] else BOOT
+        baseline = statistics.median(self.run('pass')[0] for _ in range(options['repeat']))
+        wall = statistics.median(self.run(code)[0] for _ in range(options['repeat']))
+        modules = parse_importtime(self.run(code, importtime=True)[1])
+
+        by_package = defaultdict(int)
+        for name, self_us, _ in modules:
+            by_package[name.split('.')[0]] += self_us
+        total_us = sum(by_package.values())
+
+        self.stdout.write(f'Cold start: {wall * 1000:.0f}ms median of {options["repeat"]} '
+                          f'({(wall - baseline) * 1000:.0f}ms over a bare interpreter), '
+                          f'{len(modules)} modules imported in {total_us / 1000:.0f}ms.')
+
+        self.stdout.write('\nBy top-level package (self time):')
+        for package, self_us in sorted(by_package.items(), key=lambda item: -item[1])[:options['top']]:
+            self.stdout.write(f'  {self_us / 1000:8.1f}ms  {package}')
+
+        # Cumulative time of project modules shows which of our imports drag in the heavy dependencies.
+        self.stdout.write('\nProject modules (cumulative):')
+        project = [item for item in modules if item[0].split('.')[0] in ('interview', 'config')]
+        for name, _, cumulative_us in sorted(project, key=lambda item: -item[2])[:options['top']]:
+            self.stdout.write(f'  {cumulative_us / 1000:8.1f}ms  {name}')
@@ -0,0 +1,51 @@
+import re
+
+import brotli
+from django.middleware import gzip
+from django.utils.cache import patch_vary_headers
+
+
+accepts_brotli = re.compile(r'\bbr\b')
+
+
+class GZipMiddleware(gzip.GZipMiddleware):
+    """
+    Django's ``GZipMiddleware``, but only for bodies of at least ``min_length``
+    bytes: compressing small JSON costs more CPU than it saves on the wire.
+    """
+    min_length = 1024
+
+    def process_response(self, request, response):
+        if not response.streaming and len(response.content) < self.min_length:
+            return response
+        return super().process_response(request, response)
+
+
+class CompressionMiddleware(GZipMiddleware):
+    """
+    Brotli for clients that accept ``br``, gzip for the rest.
+
+    Streaming responses, and clients without ``br``, get ``GZipMiddleware``.
+    """
+    brotli_quality = 5
+
+    def process_response(self, request, response):
+        if (
+            response.streaming
+            or response.has_header('Content-Encoding')
+            or len(response.content) < self.min_length
+            or not accepts_brotli.search(request.META.get('HTTP_ACCEPT_ENCODING', ''))
+        ):
+            return super().process_response(request, response)
+
+        patch_vary_headers(response, ('Accept-Encoding',))
+        compressed = brotli.compress(response.content, quality=self.brotli_quality)
+        if len(compressed) >= len(response.content):
+            return response
+
+        response.content = compressed
+        response['Content-Length'] = str(len(compressed))
+        if response.has_header('ETag'):
+            response['ETag'] = re.sub(r'^"', 'W/"', response['ETag'])
+        response['Content-Encoding'] = 'br'
+        return response
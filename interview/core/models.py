@@ -0,0 +1,46 @@
+from django.db import models
+from django.utils import timezone
+
+
+class Tombstone(models.Model):
+    """Records a deleted row so the change feed can report the deletion."""
+    stream = models.CharField(max_length=64)
+    object_id = models.BigIntegerField()
+    deleted_at = models.DateTimeField(default=timezone.now)
+
+    class Meta:
+        indexes = [
+            models.Index(fields=['deleted_at', 'id']),
+        ]
+
+    def __str__(self) -> str:
+        return f'{self.stream} {self.object_id}'
+
+
+class IdempotencyKey(models.Model):
+    """
+    The stored response of a create sent with an ``Idempotency-Key`` header.
+
+    The unique constraint on ``(key, path)`` is the lock: the request whose
+    insert succeeds runs the create, and duplicates find its row. ``status_code``
+    stays empty until the response has been stored.
+    """
+    key = models.CharField(max_length=255)
+    path = models.CharField(max_length=255)
+    request_hash = models.CharField(max_length=64)
+    status_code = models.PositiveSmallIntegerField(null=True, blank=True)
+    content_type = models.CharField(max_length=255, blank=True)
+    content = models.BinaryField(default=b'', blank=True)
+    created_at = models.DateTimeField(default=timezone.now)
+    expires_at = models.DateTimeField()
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=['key', 'path'], name='unique_idempotency_key'),
+        ]
+        indexes = [
+            models.Index(fields=['expires_at']),
+        ]
+
+    def __str__(self) -> str:
+        return f'{self.path} {self.key}'
@@ -0,0 +1,11 @@
+from rest_framework import pagination
+
+
+class LimitOffsetPagination(pagination.LimitOffsetPagination):
+    """
+    Opt-in limit/offset pagination.
+
+    Without a ``limit`` query parameter (and no ``PAGE_SIZE`` setting) lists are
+    returned unpaginated, so existing clients keep receiving a plain list.
+    """
+    max_limit = 1000
@@ -0,0 +1,182 @@
+import asyncio
+import json
+import logging
+import select
+import threading
+import time
+from collections import defaultdict
+from typing import Any, Dict, Set
+
+from django.conf import settings
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import DEFAULT_DB_ALIAS, connections
+from django.utils.module_loading import import_string
+
+
+logger = logging.getLogger(__name__)
+
+
+class Subscription:
+    """A subscriber's queue, bound to the event loop that created it."""
+
+    def __init__(self, broker: 'InProcessBroker', channel: str, maxsize: int = 1000):
+        self.broker = broker
+        self.channel = channel
+        self.loop = asyncio.get_running_loop()
+        self.queue: asyncio.Queue = asyncio.Queue(maxsize)
+
+    def deliver(self, message: Any) -> None:
+        self.loop.call_soon_threadsafe(self._put, message)
+
+    def _put(self, message: Any) -> None:
+        # A slow consumer loses its oldest events rather than growing without bound.
+        if self.queue.full():
+            self.queue.get_nowait()
+        self.queue.put_nowait(message)
+
+    async def get(self) -> Any:
+        return await self.queue.get()
+
+    def close(self) -> None:
+        self.broker.unsubscribe(self)
+
+
+class InProcessBroker:
+    """
+    Pub/sub between the threads and event loop of a single process.
+
+    Publishing is safe from sync code (signal handlers running in Django's
+    thread pool); subscribers receive messages on their own event loop. Set
+    ``EVENT_BROKER`` to the dotted path of another class with the same
+    ``publish``/``subscribe``/``has_subscribers`` interface to fan out across
+    processes.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._subscriptions: Dict[str, Set[Subscription]] = defaultdict(set)
+
+    def publish(self, channel: str, message: Any) -> None:
+        with self._lock:
+            subscriptions = list(self._subscriptions.get(channel, ()))
+        for subscription in subscriptions:
+            subscription.deliver(message)
+
+    def subscribe(self, channel: str) -> Subscription:
+        subscription = Subscription(self, channel)
+        with self._lock:
+            self._subscriptions[channel].add(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription) -> None:
+        with self._lock:
+            self._subscriptions[subscription.channel].discard(subscription)
+
+    def has_subscribers(self, channel: str) -> bool:
+        return bool(self._subscriptions.get(channel))
+
+
+class PostgresBroker(InProcessBroker):
+    """
+    Pub/sub across processes through PostgreSQL ``LISTEN``/``NOTIFY`` on the
+    default database.
+
+    ``publish`` sends the message as a JSON ``NOTIFY``, which reaches the
+    subscribers of every process listening on that database, this one
+    included; dates arrive as ISO strings. A process listens to each channel
+    on its own connection, opened by the channel's first subscription and
+    closed after its last, from which a thread hands notifications to the
+    local subscribers. A dropped connection is reopened.
+
+    Publishers cannot see other processes' subscribers, so ``has_subscribers``
+    is always true and every event costs a ``NOTIFY``. PostgreSQL limits
+    payloads to 8000 bytes.
+    """
+    poll_interval = 1.0
+    reconnect_delay = 1.0
+
+    def __init__(self):
+        super().__init__()
+        self._connections = {}
+
+    def publish(self, channel: str, message: Any) -> None:
+        with connections[DEFAULT_DB_ALIAS].cursor() as cursor:
+            cursor.execute('SELECT pg_notify(%s, %s)', [channel, json.dumps(message, cls=DjangoJSONEncoder)])
+
+    def subscribe(self, channel: str) -> Subscription:
+        subscription = Subscription(self, channel)
+        with self._lock:
+            if channel not in self._connections:
+                connection = self._listen(channel)
+                self._connections[channel] = connection
+                threading.Thread(target=self._read, args=(channel, connection), daemon=True).start()
+            self._subscriptions[channel].add(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription) -> None:
+        with self._lock:
+            subscriptions = self._subscriptions[subscription.channel]
+            subscriptions.discard(subscription)
+            if not subscriptions:
+                del self._subscriptions[subscription.channel]
+                connection = self._connections.pop(subscription.channel, None)
+                if connection is not None:
+                    # The channel's thread sees its connection is no longer current and stops.
+                    connection.close()
+
+    def has_subscribers(self, channel: str) -> bool:
+        return True
+
+    def _listen(self, channel: str):
+        import psycopg2
+
+        # Subscriptions are made from the event loop, where Django's own
+        # connection methods refuse to run; this connection is ours alone.
+        connection = psycopg2.connect(**connections[DEFAULT_DB_ALIAS].get_connection_params())
+        connection.autocommit = True
+        with connection.cursor() as cursor:
+            cursor.execute(f'LISTEN {connections[DEFAULT_DB_ALIAS].ops.quote_name(channel)}')
+        return connection
+
+    def _read(self, channel: str, connection) -> None:
+        while connection is not None:
+            try:
+                if select.select([connection], [], [], self.poll_interval)[0]:
+                    connection.poll()
+                    while connection.notifies:
+                        InProcessBroker.publish(self, channel, json.loads(connection.notifies.pop(0).payload))
+                continue
+            except Exception:
+                # Also raised when unsubscribe() closes the connection under us.
+                if self._connections.get(channel) is not connection:
+                    return
+                logger.exception('Lost the %s event connection; reconnecting.', channel)
+            connection = self._reconnect(channel, connection)
+
+    def _reconnect(self, channel: str, broken):
+        """A new listening connection for ``channel``, or None once its subscribers are gone."""
+        while True:
+            time.sleep(self.reconnect_delay)
+            with self._lock:
+                if self._connections.get(channel) is not broken:
+                    return None
+                try:
+                    connection = self._listen(channel)
+                except Exception:
+                    logger.exception('Could not reconnect the %s event connection; retrying.', channel)
+                    continue
+                self._connections[channel] = connection
+                return connection
+
+
+_broker = None
+_broker_lock = threading.Lock()
+
+
+def get_broker():
+    global _broker
+    if _broker is None:
+        with _broker_lock:
+            if _broker is None:
+                _broker = import_string(settings.EVENT_BROKER)()
+    return _broker
@@ -0,0 +1,110 @@
+import re
+from collections import Counter
+from contextlib import contextmanager
+from typing import Dict, Iterator, List, Optional, Union
+
+from django.conf import settings
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+
+Budget = Union[int, Dict[str, int]]
+
+literal_pattern = re.compile(r"'(?:[^']|'')*'|\b\d+(?:\.\d+)?\b")
+in_list_pattern = re.compile(r'IN \((?:\?, )*\?\)')
+
+
+class QueryBudgetExceeded(Exception):
+    pass
+
+
+def query_budget(max_queries: Budget):
+    """
+    Give a view a query budget, like setting ``max_queries`` on a class-based
+    view: a number, or one per action/HTTP method (``{'list': 3, 'post': 5}``).
+    """
+
+    def decorator(view):
+        view.max_queries = max_queries
+        return view
+
+    return decorator
+
+
+def get_view_budget(view_func, method: str) -> Optional[int]:
+    view_class = getattr(view_func, 'cls', None) or getattr(view_func, 'view_class', None)
+    budget = getattr(view_func, 'max_queries', None)
+    if budget is None:
+        budget = getattr(view_class, 'max_queries', None)
+    if not isinstance(budget, dict):
+        return budget
+
+    method = method.lower()
+    # Viewsets map methods to actions (``get`` -> ``list`` or ``retrieve``).
+    action = (getattr(view_func, 'actions', None) or {}).get(method, method)
+    return budget.get(action, budget.get(method))
+
+
+def normalize_sql(sql: str) -> str:
+    """The query with its literals replaced by ``?``, so repeats with other values group together."""
+    return in_list_pattern.sub('IN (...)', literal_pattern.sub('?', sql))
+
+
+def format_report(label: str, queries: List[dict], budget: int) -> str:
+    counts = Counter(normalize_sql(query['sql']) for query in queries)
+    lines = [f'{label} ran {len(queries)} queries, over its budget of {budget}.']
+    duplicated = [(count, sql) for sql, count in counts.most_common() if count > 1]
+    if duplicated:
+        lines.append('Duplicated SQL:')
+        lines.extend(f'  {count}x {sql}' for count, sql in duplicated)
+    lines.append('Queries:')
+    lines.extend(f'  {index}. {query["sql"]}' for index, query in enumerate(queries, start=1))
+    return '\n'.join(lines)
+
+
+def check_budget(label: str, queries: List[dict], budget: Optional[int]) -> None:
+    if budget is not None and len(queries) > budget:
+        raise QueryBudgetExceeded(format_report(label, queries, budget))
+
+
+@contextmanager
+def max_queries(budget: int, label: str = 'Block') -> Iterator[CaptureQueriesContext]:
+    """Fail with a report of the duplicated SQL when the block runs more than ``budget`` queries."""
+    with CaptureQueriesContext(connection) as context:
+        yield context
+    check_budget(label, context.captured_queries, budget)
+
+
+class QueryBudgetMiddleware:
+    """
+    Fail requests to views that run more queries than their ``max_queries``.
+
+    Active when ``DEBUG`` is on, or when ``enforce`` is set (the pytest
+    ``query_budgets`` fixture does). Views without a budget are not checked,
+    and queries run by middleware before the view (sessions, auth) are not
+    counted against it.
+    """
+    enforce: Optional[bool] = None
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def is_enforced(self) -> bool:
+        return settings.DEBUG if self.enforce is None else self.enforce
+
+    def __call__(self, request):
+        if not self.is_enforced():
+            return self.get_response(request)
+
+        with CaptureQueriesContext(connection) as context:
+            response = self.get_response(request)
+        budget = getattr(request, 'query_budget', None)
+        if budget is not None:
+            queries = context.captured_queries[request.query_budget_offset - context.initial_queries:]
+            check_budget(f'{request.method} {request.path}', queries, budget)
+        return response
+
+    def process_view(self, request, view_func, view_args, view_kwargs) -> None:
+        if self.is_enforced():
+            request.query_budget = get_view_budget(view_func, request.method)
+            request.query_budget_offset = len(connection.queries_log)
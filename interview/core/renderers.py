@@ -0,0 +1,55 @@
+from typing import Any, Dict, List
+
+from rest_framework.renderers import JSONRenderer
+
+
+def normalize(rows: List[dict], fields: Dict[str, str]) -> dict:
+    """
+    Move the nested objects named in ``fields`` out of ``rows`` into side tables.
+
+    ``fields`` maps a dotted path (``'inventory.type'``) to the name of its side
+    table. Each nested object is replaced by its ``id`` and listed once under
+    ``included[<table>]``, in the order it was first seen.
+    """
+    included = {table: {} for table in fields.values()}
+
+    def collapse(obj: dict, prefix: str) -> dict:
+        obj = dict(obj)
+        for name, value in obj.items():
+            table = fields.get(f'{prefix}{name}')
+            if table is None:
+                continue
+            if isinstance(value, list):
+                obj[name] = [include(table, item, f'{prefix}{name}.') for item in value]
+            elif isinstance(value, dict):
+                obj[name] = include(table, value, f'{prefix}{name}.')
+        return obj
+
+    def include(table: str, value: dict, prefix: str) -> Any:
+        pk = value['id']
+        if pk not in included[table]:
+            included[table][pk] = collapse(value, prefix)
+        return pk
+
+    results = [collapse(row, '') for row in rows]
+    return {'results': results, 'included': {table: list(objs.values()) for table, objs in included.items()}}
+
+
+class NormalizedJSONRenderer(JSONRenderer):
+    """
+    ``?format=normalized``: JSON where the related objects listed in the view's
+    ``normalized_fields`` are emitted once under ``included`` and referenced by
+    id from the rows. Anything that is not a list (details, errors) is rendered
+    as plain JSON.
+    """
+    format = 'normalized'
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        view = (renderer_context or {}).get('view')
+        fields = getattr(view, 'normalized_fields', None)
+        if fields:
+            if isinstance(data, list):
+                data = normalize(data, fields)
+            elif isinstance(data, dict) and isinstance(data.get('results'), list):
+                data = {**data, **normalize(data['results'], fields)}
+        return super().render(data, accepted_media_type, renderer_context)
@@ -0,0 +1,22 @@
+from rest_framework import serializers
+
+from interview.core.tags import get_tag_lookup
+
+
+class TagListField(serializers.Field):
+    """
+    Renders ``tag_ids`` as tag objects from ``get_tag_lookup`` instead of
+    querying the join table. The lookup is read once per serializer.
+    """
+
+    def __init__(self, tag_model, **kwargs):
+        kwargs.setdefault('source', 'tag_ids')
+        kwargs.setdefault('read_only', True)
+        self.tag_model = tag_model
+        self.lookup = None
+        super().__init__(**kwargs)
+
+    def to_representation(self, value):
+        if self.lookup is None:
+            self.lookup = get_tag_lookup(self.tag_model)
+        return [self.lookup[pk] for pk in value if pk in self.lookup]
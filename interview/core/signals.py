@@ -0,0 +1,165 @@
+from contextlib import contextmanager
+from threading import local
+from typing import Iterator
+
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models.signals import m2m_changed, post_delete, post_save
+from django.dispatch import receiver
+from django.utils import timezone
+
+from interview.core.behaviors import TimestampedModel
+from interview.core.bitmaps import bitmap_index
+from interview.core.cache import bump_generation, get_missing_cache_key
+from interview.core.changes import change_feed
+from interview.core.models import Tombstone
+from interview.core.tags import tag_arrays
+
+
+@receiver(post_save)
+def forget_missing_object(sender, instance, created: bool, **kwargs) -> None:
+    if created and isinstance(instance, TimestampedModel):
+        cache.delete(get_missing_cache_key(sender, instance.pk))
+
+
+# The post_delete receivers are connected per model by ``connect_delete_receivers``.
+
+@receiver(post_save)
+def bump_generation_on_write(sender, instance, **kwargs) -> None:
+    if isinstance(instance, TimestampedModel):
+        bump_generation(sender)
+
+
+@receiver(m2m_changed)
+def bump_generation_on_m2m_change(sender, instance, action: str, model, **kwargs) -> None:
+    if action.startswith('post_') and isinstance(instance, TimestampedModel):
+        bump_generation(type(instance))
+        bump_generation(model)
+
+
+pending = local()
+
+
+@contextmanager
+def batch_tombstones() -> Iterator[None]:
+    """
+    Record the tombstones of the deletes in the block, cascades included, with
+    one ``INSERT`` as it exits rather than one per row. Use it inside the
+    deletes' transaction.
+    """
+    if getattr(pending, 'tombstones', None) is not None:
+        yield
+        return
+
+    tombstones = pending.tombstones = []
+    try:
+        yield
+    finally:
+        pending.tombstones = None
+    Tombstone.objects.bulk_create(tombstones)
+
+
+def record_tombstone(sender, instance, **kwargs) -> None:
+    stream = change_feed.get_stream_name(sender)
+    if stream is None:
+        return
+
+    tombstone = Tombstone(stream=stream, object_id=instance.pk)
+    tombstones = getattr(pending, 'tombstones', None)
+    if tombstones is None:
+        tombstone.save()
+    else:
+        tombstones.append(tombstone)
+
+
+@receiver(m2m_changed)
+def touch_on_m2m_change(sender, instance, action: str, reverse: bool, model, pk_set, **kwargs) -> None:
+    # Tag changes only touch the join table; move the owning rows' updated_at so
+    # they show up in the change feed and their ETags change.
+    if action not in ('post_add', 'post_remove', 'post_clear'):
+        return
+
+    now = timezone.now()
+    if not reverse:
+        if change_feed.get_stream_name(type(instance)) is not None:
+            type(instance).objects.filter(pk=instance.pk).update(updated_at=now)
+            instance.updated_at = now
+    elif pk_set and change_feed.get_stream_name(model) is not None:
+        model.objects.filter(pk__in=pk_set).update(updated_at=now)
+
+
+@receiver(m2m_changed)
+def sync_tag_ids(sender, instance, action: str, reverse: bool, pk_set, **kwargs) -> None:
+    entry = tag_arrays.get(sender)
+    if entry is None:
+        return
+
+    model, field, array_field = entry
+    if action == 'pre_clear' and reverse:
+        # After the clear the join table no longer says which rows had the tag.
+        instance._tag_owner_ids = list(
+            sender.objects.filter(**{f'{field.m2m_reverse_field_name()}_id': instance.pk})
+            .values_list(f'{field.m2m_field_name()}_id', flat=True)
+        )
+        return
+    if action not in ('post_add', 'post_remove', 'post_clear'):
+        return
+
+    if not reverse:
+        pks = [instance.pk]
+    elif action == 'post_clear':
+        pks = getattr(instance, '_tag_owner_ids', [])
+    else:
+        pks = list(pk_set or ())
+    if not pks:
+        return
+
+    tag_arrays.refresh(sender, pks)
+    if not reverse:
+        setattr(instance, array_field, model.objects.values_list(array_field, flat=True).get(pk=instance.pk))
+    transaction.on_commit(lambda: bitmap_index.refresh(model, pks))
+
+
+def remove_deleted_tag_ids(sender, instance, **kwargs) -> None:
+    # Deleting a tag removes its join rows without sending m2m_changed.
+    owners = tag_arrays.get_owners(sender)
+    if owners:
+        tag_arrays.remove(sender, instance.pk)
+        for model, array_field in owners:
+            transaction.on_commit(
+                lambda model=model, array_field=array_field, pk=instance.pk: bitmap_index.remove_value(model, array_field, pk)
+            )
+
+
+# The bitmap index only reads committed rows, so it follows writes once their transaction commits.
+
+@receiver(post_save)
+def refresh_bitmaps_on_save(sender, instance, **kwargs) -> None:
+    if bitmap_index.get(sender) is not None:
+        pk = instance.pk
+        transaction.on_commit(lambda: bitmap_index.refresh(sender, [pk]))
+
+
+def remove_deleted_from_bitmaps(sender, instance, **kwargs) -> None:
+    if bitmap_index.get(sender) is not None:
+        pk = instance.pk
+        transaction.on_commit(lambda: bitmap_index.remove(sender, [pk]))
+
+
+def connect_delete_receivers(*models) -> None:
+    """
+    Connect the post_delete receivers to the ``models`` that need them, once
+    their app has registered them with the change feed, tag arrays and bitmap
+    index. A receiver without a sender would count as a delete listener for
+    every model, and Django then loads and deletes every cascaded row (m2m join
+    rows included) one by one instead of in a single ``DELETE``.
+    """
+    for model in models:
+        if issubclass(model, TimestampedModel):
+            post_delete.connect(bump_generation_on_write, sender=model)
+        if change_feed.get_stream_name(model) is not None:
+            post_delete.connect(record_tombstone, sender=model)
+        if tag_arrays.get_owners(model):
+            post_delete.connect(remove_deleted_tag_ids, sender=model)
+        if bitmap_index.get(model) is not None:
+            post_delete.connect(remove_deleted_from_bitmaps, sender=model)
@@ -0,0 +1,73 @@
+import asyncio
+import json
+from typing import Any, Callable, Dict, List
+from urllib.parse import parse_qs
+
+from django.core.serializers.json import DjangoJSONEncoder
+
+from interview.core.pubsub import get_broker
+
+
+class EventStream:
+    """
+    ASGI app streaming one broker channel to the client as server-sent events.
+
+    ``get_filter`` receives the parsed query string and returns a predicate over
+    messages (or raises ``ValueError`` for a 400). Messages are dicts with an
+    ``event`` name and a ``data`` payload.
+    """
+
+    def __init__(self, channel: str, get_filter: Callable[[Dict[str, List[str]]], Callable[[dict], bool]], heartbeat: float = 15):
+        self.channel = channel
+        self.get_filter = get_filter
+        self.heartbeat = heartbeat
+
+    async def __call__(self, scope: dict, receive: Callable, send: Callable) -> None:
+        try:
+            matches = self.get_filter(parse_qs(scope.get('query_string', b'').decode()))
+        except ValueError as e:
+            await self.send_error(send, 400, str(e))
+            return
+
+        subscription = get_broker().subscribe(self.channel)
+        disconnected = asyncio.ensure_future(self.wait_for_disconnect(receive))
+        try:
+            await send({
+                'type': 'http.response.start',
+                'status': 200,
+                'headers': [
+                    (b'content-type', b'text/event-stream'),
+                    (b'cache-control', b'no-cache'),
+                    (b'x-accel-buffering', b'no'),
+                ],
+            })
+            await send({'type': 'http.response.body', 'body': b': connected\n\n', 'more_body': True})
+
+            while not disconnected.done():
+                message = asyncio.ensure_future(subscription.get())
+                done, _ = await asyncio.wait({message, disconnected}, timeout=self.heartbeat, return_when=asyncio.FIRST_COMPLETED)
+                if message not in done:
+                    message.cancel()
+                    if not disconnected.done():
+                        await send({'type': 'http.response.body', 'body': b': keepalive\n\n', 'more_body': True})
+                    continue
+
+                event = message.result()
+                if matches(event):
+                    await send({'type': 'http.response.body', 'body': self.format(event), 'more_body': True})
+        finally:
+            disconnected.cancel()
+            subscription.close()
+
+    def format(self, event: dict) -> bytes:
+        data = json.dumps(event['data'], cls=DjangoJSONEncoder)
+        return f'event: {event["event"]}\ndata: {data}\n\n'.encode()
+
+    async def wait_for_disconnect(self, receive: Callable) -> None:
+        while (await receive())['type'] != 'http.disconnect':
+            pass
+
+    async def send_error(self, send: Callable, status: int, detail: Any) -> None:
+        body = json.dumps({'error': detail}).encode()
+        await send({'type': 'http.response.start', 'status': status, 'headers': [(b'content-type', b'application/json')]})
+        await send({'type': 'http.response.body', 'body': body})
@@ -0,0 +1,108 @@
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+from django.contrib.postgres.expressions import ArraySubquery
+from django.core.cache import cache
+from django.db.models import F, Func, OuterRef, QuerySet, Value
+from django.utils import timezone
+
+from interview.core.cache import bump_generation, get_generation
+
+
+class TagArrays:
+    """
+    Models that mirror a ``tags`` many-to-many into a sorted ``tag_ids`` array.
+
+    ``interview.core.signals`` keeps the arrays in step with the join table, so
+    reads and ``?tags=`` filters (``&&``/``@>`` on a GIN index) never need the join.
+    """
+
+    def __init__(self):
+        self.by_through = {}
+        self.by_tag_model = {}
+
+    def register(self, model, field_name: str = 'tags', array_field: str = 'tag_ids') -> None:
+        field = model._meta.get_field(field_name)
+        self.by_through[field.remote_field.through] = (model, field, array_field)
+        self.by_tag_model.setdefault(field.related_model, []).append((model, array_field))
+
+    def get(self, through) -> Optional[Tuple]:
+        return self.by_through.get(through)
+
+    def get_owners(self, tag_model) -> List[Tuple]:
+        return self.by_tag_model.get(tag_model, [])
+
+    def refresh(self, through, pks: Iterable[int]) -> None:
+        """Recompute the arrays of the owners ``pks`` from the join table in one ``UPDATE``."""
+        model, field, array_field = self.by_through[through]
+        owner_column = f'{field.m2m_field_name()}_id'
+        tag_column = f'{field.m2m_reverse_field_name()}_id'
+        tag_ids = through.objects.filter(**{owner_column: OuterRef('pk')}).order_by(tag_column).values(tag_column)
+        model.objects.filter(pk__in=list(pks)).update(**{array_field: ArraySubquery(tag_ids)})
+
+    def remove(self, tag_model, pk: int) -> None:
+        for model, array_field in self.get_owners(tag_model):
+            updated = model.objects.filter(**{f'{array_field}__contains': [pk]}).update(
+                updated_at=timezone.now(),
+                **{array_field: Func(F(array_field), Value(pk), function='array_remove')},
+            )
+            if updated:
+                bump_generation(model)
+
+
+tag_arrays = TagArrays()
+
+
+def get_tag_lookup(tag_model) -> Dict[int, dict]:
+    """``id -> {'id', 'name', 'is_active'}`` for every tag, cached until the tag table changes."""
+    key = f'tags:{tag_model._meta.label_lower}:{get_generation(tag_model)}'
+    lookup = cache.get(key)
+    if lookup is None:
+        lookup = {row['id']: row for row in tag_model.objects.values('id', 'name', 'is_active')}
+        cache.set(key, lookup, timeout=None)
+    return lookup
+
+
+def get_names(query_params, name: str) -> Set[str]:
+    return {part.strip() for value in query_params.getlist(name) for part in value.split(',') if part.strip()}
+
+
+def parse_tag_filter(tag_model, query_params) -> Tuple[Optional[List[int]], str, List[int]]:
+    """
+    The ids of the ``?tags=`` (``None`` without the parameter, empty when it
+    can match nothing), the ``?tags_match=`` mode and the ids of the
+    ``?tags_exclude=`` tags.
+    """
+    names = get_names(query_params, 'tags')
+    excluded = get_names(query_params, 'tags_exclude')
+    match = query_params.get('tags_match', 'any')
+    if not names and not excluded:
+        return None, match, []
+    if match not in ('any', 'all'):
+        raise ValueError('tags_match must be "any" or "all".')
+
+    ids = {tag['name']: pk for pk, tag in get_tag_lookup(tag_model).items()}
+    excluded_ids = [ids[name] for name in excluded if name in ids]
+    if not names:
+        return None, match, excluded_ids
+
+    tag_ids = [ids[name] for name in names if name in ids]
+    if match == 'all' and len(tag_ids) < len(names):
+        tag_ids = []
+    return tag_ids, match, excluded_ids
+
+
+def filter_by_tags(queryset: QuerySet, tag_model, query_params, array_field: str = 'tag_ids') -> QuerySet:
+    """
+    ``?tags=Comedy,Drama`` keeps rows with any of the named tags;
+    ``&tags_match=all`` only rows with all of them. ``?tags_exclude=Horror``
+    drops rows with any of the named tags.
+    """
+    tag_ids, match, excluded_ids = parse_tag_filter(tag_model, query_params)
+    if tag_ids is not None:
+        if not tag_ids:
+            return queryset.none()
+        lookup = 'contains' if match == 'all' else 'overlap'
+        queryset = queryset.filter(**{f'{array_field}__{lookup}': tag_ids})
+    if excluded_ids:
+        queryset = queryset.exclude(**{f'{array_field}__overlap': excluded_ids})
+    return queryset
@@ -0,0 +1,106 @@
+import pytest
+
+from interview.core.querybudget import QueryBudgetExceeded, QueryBudgetMiddleware, get_view_budget, normalize_sql
+from interview.inventory.models import InventoryTag
+from interview.inventory.views import InventoryTagViewSet
+
+
+pytestmark = pytest.mark.django_db
+
+
+def test_view_under_budget_passes(client, settings):
+    settings.DEBUG = True
+    assert client.get('/inventory/tags/').status_code == 200
+
+
+def test_view_over_budget_raises_in_debug(client, settings, monkeypatch):
+    monkeypatch.setattr(QueryBudgetMiddleware, 'enforce', None)
+    monkeypatch.setattr(InventoryTagViewSet, 'max_queries', {'list': 0})
+    settings.DEBUG = True
+    with pytest.raises(QueryBudgetExceeded, match=r'GET /inventory/tags/ ran 1 queries, over its budget of 0'):
+        client.get('/inventory/tags/')
+
+
+def test_view_over_budget_passes_without_debug_or_fixture(client, settings, monkeypatch):
+    monkeypatch.setattr(QueryBudgetMiddleware, 'enforce', None)
+    monkeypatch.setattr(InventoryTagViewSet, 'max_queries', {'list': 0})
+    settings.DEBUG = False
+    assert client.get('/inventory/tags/').status_code == 200
+
+
+def test_autouse_fixture_catches_over_budget_view(client, settings, monkeypatch):
+    # pytest-django runs tests with DEBUG off; the query_budgets fixture enforces budgets anyway.
+    monkeypatch.setattr(InventoryTagViewSet, 'max_queries', {'create': 1})
+    assert not settings.DEBUG
+    with pytest.raises(QueryBudgetExceeded, match='over its budget of 1'):
+        client.post('/inventory/tags/', {'name': 'Drama'}, content_type='application/json')
+
+
+def test_max_queries_reports_duplicated_sql(max_queries):
+    with pytest.raises(QueryBudgetExceeded) as exc_info:
+        with max_queries(1, label='Lookups'):
+            list(InventoryTag.objects.filter(name='Action'))
+            list(InventoryTag.objects.filter(name='Drama'))
+
+    report = str(exc_info.value)
+    assert report.startswith('Lookups ran 2 queries, over its budget of 1.')
+    assert 'Duplicated SQL:\n  2x SELECT' in report
+    assert "= ?" in report
+
+
+def test_get_view_budget_by_action_and_method():
+    class View:
+        max_queries = {'list': 3, 'post': 5}
+
+    def viewset():
+        pass
+
+    viewset.cls = View
+    viewset.actions = {'get': 'list', 'post': 'create'}
+    assert get_view_budget(viewset, 'GET') == 3
+    assert get_view_budget(viewset, 'POST') == 5
+    assert get_view_budget(viewset, 'DELETE') is None
+
+
+def test_normalize_sql_groups_literals_and_in_lists():
+    assert normalize_sql("SELECT 1 FROM t WHERE a = 'x' AND id IN (1, 2, 3)") == normalize_sql(
+        "SELECT 7 FROM t WHERE a = 'y' AND id IN (4, 5)"
+    )
+
+
+def test_postgres_broker_delivers_events_published_by_another_process():
+    import asyncio
+    import subprocess
+    import sys
+
+    from django.conf import settings
+    from django.db import connection
+
+    from interview.core.pubsub import PostgresBroker
+
+    if connection.vendor != 'postgresql':
+        pytest.skip('PostgresBroker needs PostgreSQL.')
+
+    publisher = (
+        'import sys, django; django.setup(); '
+        'from django.db import connection; connection.settings_dict["NAME"] = sys.argv[1]; '
+        'from interview.core.pubsub import PostgresBroker; '
+        'PostgresBroker().publish("test_events", {"event": "order.created", "data": {"id": 1, "start_date": "2030-01-01"}})'
+    )
+    broker = PostgresBroker()
+
+    async def receive():
+        subscription = broker.subscribe('test_events')
+        try:
+            await asyncio.to_thread(
+                subprocess.run,
+                [sys.executable, '-c', publisher, connection.settings_dict['NAME']],
+                cwd=settings.BASE_DIR.parent,
+                check=True,
+            )
+            return await asyncio.wait_for(subscription.get(), timeout=10)
+        finally:
+            subscription.close()
+
+    assert asyncio.run(receive()) == {'event': 'order.created', 'data': {'id': 1, 'start_date': '2030-01-01'}}
+    assert broker._connections == {}
@@ -0,0 +1,66 @@
+import time
+
+from rest_framework import throttling
+
+from interview.core.cache import acquire_lock, release_lock
+
+
+class TokenBucketThrottle(throttling.SimpleRateThrottle):
+    """
+    Token bucket on top of DRF's rate settings: ``'600/min'`` lets a client
+    burst up to 600 requests and refills 10 tokens a second.
+
+    Each client costs one ``(tokens, timestamp)`` entry in the shared cache,
+    instead of the per-request timestamp history kept by DRF's sliding window.
+    The entry is read and written under a per-client lock, so concurrent
+    requests cannot all spend the same token; a request that cannot take the
+    lock within ``lock_wait`` seconds is throttled.
+    """
+    lock_wait = 0.05
+    lock_timeout = 1
+
+    def allow_request(self, request, view) -> bool:
+        if self.rate is None:
+            return True
+
+        self.key = self.get_cache_key(request, view)
+        if self.key is None:
+            return True
+
+        self.tokens = 0
+        if not self.acquire():
+            return False
+        try:
+            now = self.timer()
+            tokens, updated_at = self.cache.get(self.key, (self.num_requests, now))
+            self.tokens = min(self.num_requests, tokens + (now - updated_at) * self.num_requests / self.duration)
+            if self.tokens < 1:
+                return False
+
+            self.cache.set(self.key, (self.tokens - 1, now), self.duration)
+            return True
+        finally:
+            release_lock(self.key)
+
+    def acquire(self) -> bool:
+        deadline = time.monotonic() + self.lock_wait
+        while not acquire_lock(self.key, self.lock_timeout):
+            if time.monotonic() >= deadline:
+                return False
+            time.sleep(0.002)
+        return True
+
+    def wait(self) -> float:
+        return (1 - self.tokens) * self.duration / self.num_requests
+
+
+class AnonTokenBucketThrottle(throttling.AnonRateThrottle, TokenBucketThrottle):
+    pass
+
+
+class UserTokenBucketThrottle(throttling.UserRateThrottle, TokenBucketThrottle):
+    pass
+
+
+class ScopedTokenBucketThrottle(throttling.ScopedRateThrottle, TokenBucketThrottle):
+    pass
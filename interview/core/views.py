@@ -1,3 +1,553 @@
-from django.shortcuts import render
+import hashlib
+from contextlib import nullcontext
+from datetime import datetime, timedelta
+from typing import List, Optional
 
-# Create your views here.
+from django.conf import settings
+from django.core.cache import cache
+from django.db import IntegrityError, transaction
+from django.db.models import Count, Max
+from django.db.models.signals import post_save
+from django.http import HttpResponse
+from django.utils import timezone
+from rest_framework import viewsets
+from rest_framework.decorators import action
+from rest_framework.exceptions import APIException, NotFound, ValidationError
+from rest_framework.request import Request
+from rest_framework.response import Response
+from rest_framework.serializers import Serializer
+from rest_framework.views import APIView
+
+from interview.core.bitmaps import All, Any, BitmapQuerySet, Not, Term, bitmap_index, get_name_ids
+from interview.core.cache import acquire_lock, get_generation, get_generations, get_missing_cache_key, release_lock, wait_for
+from interview.core.changes import Cursor, read_changes
+from interview.core.models import IdempotencyKey
+from interview.core.pagination import LimitOffsetPagination
+from interview.core.renderers import NormalizedJSONRenderer
+from interview.core.signals import batch_tombstones
+from interview.core.tags import filter_by_tags, get_names, parse_tag_filter
+
+
+class PreconditionFailed(APIException):
+    status_code = 412
+    default_detail = 'The resource has been modified since it was last fetched.'
+    default_code = 'precondition_failed'
+
+
+class ConditionalUpdateMixin:
+    """
+    Optimistic concurrency for ``TimestampedModel`` resources.
+
+    Responses carry the row's ``updated_at`` as an ``ETag``. Writes that send it
+    back in ``If-Match`` are applied with a single ``UPDATE ... WHERE id = %s AND
+    updated_at = %s`` and rejected with 412 when another writer got there first.
+    Requests without ``If-Match`` keep the last-write-wins behaviour.
+    """
+
+    def get_etag(self, instance) -> str:
+        return f'"{instance.updated_at.isoformat()}"'
+
+    def get_etag_headers(self, instance) -> dict:
+        return {'ETag': self.get_etag(instance)}
+
+    def get_if_match(self, request: Request) -> Optional[str]:
+        value = request.headers.get('If-Match', '').strip()
+        if not value or value == '*':
+            return None
+        return value
+
+    def is_not_modified(self, request: Request, etag: str) -> bool:
+        if_none_match = request.headers.get('If-None-Match', '')
+        candidates = [value.strip().removeprefix('W/') for value in if_none_match.split(',')]
+        return etag in candidates or '*' in candidates
+
+    def parse_etag(self, etag: str) -> Optional[datetime]:
+        if etag.startswith('W/'):
+            etag = etag[2:]
+        try:
+            return datetime.fromisoformat(etag.strip('"'))
+        except ValueError:
+            return None
+
+    def get_expected_version(self, request: Request, instance) -> Optional[datetime]:
+        etag = self.get_if_match(request)
+        if etag is None:
+            return None
+
+        expected = self.parse_etag(etag)
+        if expected is None or expected != instance.updated_at:
+            raise PreconditionFailed()
+
+        return expected
+
+    def save_conditionally(self, request: Request, serializer: Serializer) -> None:
+        instance = serializer.instance
+        expected = self.get_expected_version(request, instance)
+        if expected is None:
+            serializer.save()
+            return
+
+        model = type(instance)
+        m2m_fields = {}
+        fields = {}
+        for name, value in serializer.validated_data.items():
+            if model._meta.get_field(name).many_to_many:
+                m2m_fields[name] = value
+            else:
+                fields[name] = value
+
+        # A lone UPDATE is atomic already; only pair it with m2m writes in a transaction.
+        with transaction.atomic() if m2m_fields else nullcontext():
+            if not model.update_if_unmodified(instance.pk, expected, **fields):
+                raise PreconditionFailed()
+            for name, value in m2m_fields.items():
+                getattr(instance, name).set(value)
+
+        # Re-read through the view's queryset, whose select_related brings the
+        # response's relations along instead of loading each one lazily.
+        serializer.instance = self.get_queryset().get(pk=instance.pk)
+        # The conditional UPDATE bypasses Model.save(); notify receivers as save() would.
+        post_save.send(
+            sender=model,
+            instance=serializer.instance,
+            created=False,
+            update_fields=frozenset(fields),
+            raw=False,
+            using=serializer.instance._state.db,
+        )
+
+    def delete_conditionally(self, request: Request, instance) -> None:
+        expected = self.get_expected_version(request, instance)
+        if expected is None:
+            instance.delete()
+            return
+
+        if not type(instance).delete_if_unmodified(instance.pk, expected):
+            raise PreconditionFailed()
+
+
+class IdempotentCreateMixin:
+    """
+    ``Idempotency-Key`` support for creates, so clients can retry a ``POST``
+    without creating duplicates.
+
+    The first request with a key inserts an ``IdempotencyKey`` row, runs the
+    create and stores the rendered response for ``idempotency_ttl``. Retries
+    get the stored response back, marked ``Idempotent-Replayed: true``, without
+    running the create. The row's unique constraint settles concurrent
+    duplicates, which get 409 while the first is still running; so does reusing
+    a key with a different body. Keys that are not 1-255 printable ASCII
+    characters get 422. A create that raises releases its key.
+    """
+    idempotency_ttl = timedelta(hours=24)
+    # A key still without a response after this long (e.g. its worker died) can be claimed again.
+    idempotency_lock_timeout = timedelta(seconds=60)
+
+    def create(self, request: Request, *args, **kwargs) -> Response:
+        key = request.headers.get('Idempotency-Key', '').strip()
+        if not key:
+            return super().create(request, *args, **kwargs)
+        if len(key) > 255 or not (key.isascii() and key.isprintable()):
+            return Response({'error': 'Idempotency-Key must be 1-255 printable ASCII characters.'}, status=422)
+
+        record, response = self.claim_idempotency_key(key, request.path, hashlib.sha256(request.body).hexdigest())
+        if response is not None:
+            return response
+
+        try:
+            response = super().create(request, *args, **kwargs)
+        except Exception:
+            record.delete()
+            raise
+
+        def store(rendered):
+            IdempotencyKey.objects.filter(pk=record.pk).update(
+                status_code=rendered.status_code,
+                content_type=rendered.get('Content-Type', ''),
+                content=rendered.content,
+            )
+
+        response.add_post_render_callback(store)
+        return response
+
+    def claim_idempotency_key(self, key: str, path: str, request_hash: str):
+        """The claimed key, or the response to send instead of running the create."""
+        now = timezone.now()
+        try:
+            with transaction.atomic():
+                record = IdempotencyKey.objects.create(
+                    key=key, path=path, request_hash=request_hash, expires_at=now + self.idempotency_ttl
+                )
+            return record, None
+        except IntegrityError:
+            pass
+
+        record = IdempotencyKey.objects.filter(key=key, path=path).first()
+        if record is None:
+            # Released by a failed create in the meantime.
+            return self.claim_idempotency_key(key, path, request_hash)
+
+        abandoned = record.status_code is None and record.created_at <= now - self.idempotency_lock_timeout
+        if record.expires_at <= now or abandoned:
+            # Take the key over; the ``created_at`` check lets only one duplicate do so.
+            claimed = IdempotencyKey.objects.filter(pk=record.pk, created_at=record.created_at).update(
+                request_hash=request_hash,
+                status_code=None,
+                content_type='',
+                content=b'',
+                created_at=now,
+                expires_at=now + self.idempotency_ttl,
+            )
+            if claimed:
+                return record, None
+        elif record.request_hash != request_hash:
+            return None, Response({'error': 'This Idempotency-Key was used with a different request.'}, status=409)
+        elif record.status_code is not None:
+            response = HttpResponse(bytes(record.content), status=record.status_code, content_type=record.content_type)
+            response['Idempotent-Replayed'] = 'true'
+            return None, response
+
+        return None, Response(
+            {'error': 'A request with this Idempotency-Key is still in progress.'},
+            status=409,
+            headers={'Retry-After': '1'},
+        )
+
+
+class BatchRetrieveMixin:
+    """
+    Fetch many objects by id in one ``id__in`` query: ``?ids=1,2,3``.
+
+    Results keep the order of the requested ids; ids that do not exist are
+    reported under ``missing`` instead of failing the whole request.
+    """
+    max_batch_size = 500
+
+    def get_batch_response(self, request: Request) -> Response:
+        try:
+            ids = self.parse_ids(request.query_params.get('ids', ''))
+        except ValueError as e:
+            return Response({'error': str(e)}, status=400)
+
+        objects = self.get_queryset().in_bulk(ids)
+        found = [objects[pk] for pk in ids if pk in objects]
+        missing = [pk for pk in ids if pk not in objects]
+        serializer = self.serializer_class(found, many=True)
+
+        return Response({'results': serializer.data, 'missing': missing}, status=200)
+
+    def parse_ids(self, value: str) -> List[int]:
+        ids = []
+        seen = set()
+        for part in value.split(','):
+            part = part.strip()
+            if not part:
+                continue
+            try:
+                pk = int(part)
+            except ValueError:
+                raise ValueError(f'Invalid id: {part!r}')
+            if pk not in seen:
+                seen.add(pk)
+                ids.append(pk)
+
+        if not ids:
+            raise ValueError('The ids query parameter is required.')
+        if len(ids) > self.max_batch_size:
+            raise ValueError(f'At most {self.max_batch_size} ids can be requested at once.')
+
+        return ids
+
+
+class BatchRetrieveView(BatchRetrieveMixin, APIView):
+    queryset = None
+    serializer_class = None
+
+    def get(self, request: Request, *args, **kwargs) -> Response:
+        return self.get_batch_response(request)
+
+    def get_queryset(self):
+        return self.queryset.all()
+
+
+class CachedListMixin:
+    """
+    Cache whole list responses as rendered bytes when ``cache_list_responses`` is set.
+
+    Keys combine the model's generation counter (bumped by the write signals in
+    ``interview.core.signals``), the negotiated media type and the query string,
+    so a hit skips the ORM, the serializer and the renderer entirely and any
+    write to the model retires every cached page at once. Nested resources list
+    the models they embed in ``list_cache_models`` so writes to those count too.
+
+    Misses are single-flight: the first request for a key takes a lock in the
+    shared cache and builds the page, while identical requests arriving
+    meanwhile wait up to ``coalesce_timeout`` seconds for its result instead of
+    running the same query (``0`` disables this).
+    """
+    cache_list_responses = False
+    list_cache_timeout = 300
+    list_cache_models = ()
+    coalesce_timeout = 10
+
+    def list(self, request: Request, *args, **kwargs):
+        if not self.cache_list_responses:
+            return super().list(request, *args, **kwargs)
+
+        # The key is built before the queryset runs, so a write racing with this
+        # request bumps the generation past whatever gets stored here.
+        key = self.get_list_cache_key(request)
+        cached = cache.get(key)
+        leader = False
+        if cached is None and self.coalesce_timeout:
+            leader = acquire_lock(key, self.coalesce_timeout)
+            if not leader:
+                cached = wait_for(key, self.coalesce_timeout)
+        if cached is not None:
+            content, content_type = cached
+            return HttpResponse(content, content_type=content_type)
+
+        try:
+            response = super().list(request, *args, **kwargs)
+        except Exception:
+            if leader:
+                release_lock(key)
+            raise
+
+        if response.status_code == 200:
+            def store(rendered):
+                cache.set(key, (rendered.content, rendered['Content-Type']), timeout=self.list_cache_timeout)
+                if leader:
+                    release_lock(key)
+
+            response.add_post_render_callback(store)
+        elif leader:
+            release_lock(key)
+        return response
+
+    def get_list_cache_key(self, request: Request) -> str:
+        model = self.get_queryset().model
+        params = sorted(request.query_params.lists())
+        digest = hashlib.md5(f'{request.accepted_media_type}|{params}'.encode()).hexdigest()
+        return f'list:{model._meta.label_lower}:{get_generations([model, *self.list_cache_models])}:{digest}'
+
+
+class NormalizedListMixin:
+    """
+    Offer ``?format=normalized`` (see ``NormalizedJSONRenderer``) on views that
+    declare ``normalized_fields``, e.g. ``{'type': 'types', 'tags': 'tags'}``.
+    """
+    normalized_fields = None
+
+    def get_renderers(self):
+        renderers = super().get_renderers()
+        if self.normalized_fields:
+            renderers.append(NormalizedJSONRenderer())
+        return renderers
+
+
+class TagFilterMixin:
+    """``?tags=Comedy,Drama[&tags_match=all][&tags_exclude=Horror]`` on views whose model mirrors its tags in ``tag_ids``."""
+    tag_model = None
+
+    def get_queryset(self):
+        return self.filter_tags(super().get_queryset())
+
+    def filter_tags(self, queryset):
+        if self.tag_model is None:
+            return queryset
+        try:
+            return filter_by_tags(queryset, self.tag_model, self.request.query_params)
+        except ValueError as e:
+            raise ValidationError({'error': str(e)})
+
+
+class BitmapFilterMixin:
+    """
+    With ``settings.BITMAP_INDEX`` on, answer paginated list requests from the
+    in-process bitmap index (see ``interview.core.bitmaps``) instead of SQL.
+
+    Applies when every query parameter is one the index can answer: the
+    ``?tags=``/``?tags_match=``/``?tags_exclude=`` of ``TagFilterMixin`` and the
+    name filters in ``bitmap_filters`` (``{param: (dimension, name model)}``),
+    besides pagination and rendering parameters. The count comes from the
+    bitmap and only the requested page of ids is loaded, through the regular
+    queryset, so rows that stopped matching are never returned. Any other
+    parameter falls back to the SQL filters.
+    """
+    bitmap_filters = {}
+    bitmap_passthrough_params = ('limit', 'offset', 'format')
+
+    def filter_queryset(self, queryset):
+        queryset = super().filter_queryset(queryset)
+        expression = self.get_bitmap_expression()
+        if expression is None:
+            return queryset
+        return BitmapQuerySet(queryset, bitmap_index.evaluate(queryset.model, expression))
+
+    def get_bitmap_expression(self):
+        request = self.request
+        if (
+            not settings.BITMAP_INDEX
+            or request.method != 'GET'
+            or bitmap_index.get(self.queryset.model) is None
+            or self.paginator is None
+            or self.paginator.get_limit(request) is None
+        ):
+            return None
+
+        params = {*self.bitmap_passthrough_params, *self.bitmap_filters}
+        if getattr(self, 'tag_model', None) is not None:
+            params.update(('tags', 'tags_match', 'tags_exclude'))
+        if any(param not in params for param in request.query_params):
+            return None
+
+        terms = []
+        for param, (dimension, model) in self.bitmap_filters.items():
+            names = get_names(request.query_params, param)
+            if names:
+                ids = get_name_ids(model)
+                terms.append(Any(*[Term(dimension, ids[name]) for name in names if name in ids]))
+
+        if getattr(self, 'tag_model', None) is not None:
+            try:
+                tag_ids, match, excluded_ids = parse_tag_filter(self.tag_model, request.query_params)
+            except ValueError as e:
+                raise ValidationError({'error': str(e)})
+            if tag_ids is not None:
+                tags = [Term('tags', pk) for pk in tag_ids]
+                terms.append(All(*tags) if match == 'all' and tags else Any(*tags))
+            terms.extend(Not(Term('tags', pk)) for pk in excluded_ids)
+        return All(*terms)
+
+
+class ModelViewSet(ConditionalUpdateMixin, IdempotentCreateMixin, BatchRetrieveMixin, CachedListMixin, NormalizedListMixin, viewsets.ModelViewSet):
+    """
+    Shared CRUD for the model resources, routed as ``<prefix>/``, ``<prefix>/<id>/``
+    and ``<prefix>/batch/``.
+
+    Subclasses only declare ``queryset``, ``serializer_class`` and the relations to
+    ``select_related``/``prefetch_related``. On top of DRF's viewset this adds:
+
+    - opt-in ``?limit=&offset=`` pagination;
+    - ``ETag``/``If-None-Match`` conditional GET on detail routes, and on list
+      routes when ``conditional_list`` is set (only safe for flat resources,
+      since changes to nested relations do not touch the parent's ``updated_at``);
+    - ``If-Match`` conditional writes (see ``ConditionalUpdateMixin``);
+    - ``Idempotency-Key`` on creates (see ``IdempotentCreateMixin``);
+    - negatively cached 404s for unknown ids, kept for ``missing_ttl`` seconds;
+    - pre-rendered list caching when ``cache_list_responses`` is set (see
+      ``CachedListMixin``);
+    - ``?format=normalized`` side tables when ``normalized_fields`` is set (see
+      ``NormalizedListMixin``).
+    """
+    lookup_field = 'id'
+    lookup_value_regex = r'\d+'
+    pagination_class = LimitOffsetPagination
+    http_method_names = ['get', 'post', 'patch', 'delete', 'head', 'options']
+    select_related = ()
+    prefetch_related = ()
+    conditional_list = False
+    missing_ttl = 60
+
+    def get_queryset(self):
+        queryset = super().get_queryset()
+        if self.select_related:
+            queryset = queryset.select_related(*self.select_related)
+        if self.prefetch_related:
+            queryset = queryset.prefetch_related(*self.prefetch_related)
+        if not queryset.ordered:
+            queryset = queryset.order_by('pk')
+        return queryset
+
+    def get_object(self):
+        pk = self.kwargs[self.lookup_field]
+        key = get_missing_cache_key(self.queryset.model, pk)
+        if cache.get(key):
+            raise NotFound()
+
+        lookup = {self.lookup_field: pk}
+        instance = next(iter(self.get_queryset().filter(**lookup)[:1]), None)
+        if instance is None:
+            # get_queryset() carries the list filters (?tags=, ?type=, ...); only
+            # cache the 404 when the row is missing from the unfiltered queryset.
+            if not self.queryset.filter(**lookup).exists():
+                cache.set(key, True, timeout=self.missing_ttl)
+            raise NotFound()
+
+        self.check_object_permissions(self.request, instance)
+        return instance
+
+    def list(self, request: Request, *args, **kwargs) -> Response:
+        headers = {}
+        if self.conditional_list:
+            etag = self.get_list_etag()
+            headers['ETag'] = etag
+            if self.is_not_modified(request, etag):
+                return Response(status=304, headers=headers)
+
+        response = super().list(request, *args, **kwargs)
+        for key, value in headers.items():
+            response[key] = value
+        return response
+
+    def get_list_etag(self) -> str:
+        if self.cache_list_responses:
+            return f'"{get_generation(self.get_queryset().model)}"'
+
+        stats = self.get_queryset().order_by().aggregate(count=Count('pk'), updated_at=Max('updated_at'))
+        updated_at = stats['updated_at'].isoformat() if stats['updated_at'] else ''
+        return f'"{stats["count"]}-{updated_at}"'
+
+    def retrieve(self, request: Request, *args, **kwargs) -> Response:
+        instance = self.get_object()
+        headers = self.get_etag_headers(instance)
+        if self.is_not_modified(request, headers['ETag']):
+            return Response(status=304, headers=headers)
+
+        serializer = self.get_serializer(instance)
+        return Response(serializer.data, status=200, headers=headers)
+
+    def perform_update(self, serializer: Serializer) -> None:
+        self.save_conditionally(self.request, serializer)
+        self.headers.update(self.get_etag_headers(serializer.instance))
+
+    def perform_destroy(self, instance) -> None:
+        # The cascade's tombstones go in with one INSERT, in the same transaction as the deletes.
+        with transaction.atomic(savepoint=False), batch_tombstones():
+            self.delete_conditionally(self.request, instance)
+
+    @action(detail=False, methods=['get'])
+    def batch(self, request: Request, *args, **kwargs) -> Response:
+        return self.get_batch_response(request)
+
+
+class ChangeFeedView(APIView):
+    """
+    Incremental sync: ``GET /changes/?since=<token>&limit=<n>``.
+
+    Returns inserts, updates and deletes of the registered models ordered by
+    ``(updated_at, id)``. Pass the returned ``next`` token as ``since`` to resume;
+    omit ``since`` to start from the beginning.
+    """
+    default_limit = 100
+    max_limit = 1000
+    settle = timedelta(seconds=2)
+
+    def get(self, request: Request, *args, **kwargs) -> Response:
+        since = request.query_params.get('since')
+        try:
+            cursor = Cursor.decode(since) if since else None
+            limit = int(request.query_params.get('limit', self.default_limit))
+        except ValueError as e:
+            return Response({'error': str(e)}, status=400)
+        if not 0 < limit <= self.max_limit:
+            return Response({'error': f'limit must be between 1 and {self.max_limit}.'}, status=400)
+
+        changes, next_cursor = read_changes(cursor, limit, self.settle)
+
+        return Response({
+            'results': changes,
+            'next': next_cursor.encode() if next_cursor else None,
+            'has_more': len(changes) == limit,
+        }, status=200)
@@ -4,3 +4,22 @@ from django.apps import AppConfig
 class InventoryConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'interview.inventory'
+
+    def ready(self) -> None:
+        from interview.core.bitmaps import bitmap_index
+        from interview.core.changes import change_feed
+        from interview.core.signals import connect_delete_receivers
+        from interview.core.tags import tag_arrays
+        from interview.inventory.models import Inventory, InventoryTag
+
+        tag_arrays.register(Inventory)
+        bitmap_index.register(Inventory, type='type_id', language='language_id', tags='tag_ids')
+
+        change_feed.register(
+            'inventory',
+            Inventory,
+            'interview.inventory.serializers.InventorySerializer',
+            select_related=('type', 'language'),
+        )
+        change_feed.register('inventory_tag', InventoryTag, 'interview.inventory.serializers.InventoryTagSerializer')
+        connect_delete_receivers(*self.get_models())
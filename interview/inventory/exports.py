@@ -0,0 +1,25 @@
+from typing import List, Optional, Tuple
+
+from django.db.models import F, QuerySet
+from django.db.models.fields.json import KeyTransform
+
+from interview.inventory.models import Inventory
+
+
+def get_metadata_columns(source: str, keys: Optional[List[str]] = None) -> dict:
+    """Flatten metadata ``keys`` (default: the ``InventoryMetaData`` fields) into ``metadata_<key>`` columns."""
+    if not keys:
+        from interview.inventory.schemas import InventoryMetaData
+
+        keys = list(InventoryMetaData.__fields__)
+    return {f'metadata_{key}': KeyTransform(key, source) for key in keys}
+
+
+def get_inventory_export(metadata_keys: Optional[List[str]] = None) -> Tuple[QuerySet, List[str]]:
+    columns = {
+        'type_name': F('type__name'),
+        'language_name': F('language__name'),
+        **get_metadata_columns('metadata', metadata_keys),
+    }
+    queryset = Inventory.objects.order_by('id').values('id', 'name', 'created_at', 'updated_at', **columns)
+    return queryset, ['id', 'name', 'created_at', 'updated_at', *columns]
@@ -0,0 +1,123 @@
+import hashlib
+from typing import Dict, List
+
+from django.core.cache import cache
+from django.core.exceptions import EmptyResultSet
+from django.db import connection
+from django.db.models import IntegerField, QuerySet
+from django.db.models.fields.json import KeyTextTransform
+from django.db.models.functions import Cast
+
+from interview.core.cache import get_generations
+from interview.core.tags import get_tag_lookup
+from interview.inventory.models import Inventory, InventoryLanguage, InventoryTag, InventoryType
+
+
+FACET_CACHE_TIMEOUT = 300
+# Parameters that change the page or its rendering, not the counts.
+FACET_IGNORED_PARAMS = ('limit', 'offset', 'facets', 'format', 'include', 'metadata_keys')
+
+
+def get_names(query_params, name: str) -> List[str]:
+    return [part.strip() for value in query_params.getlist(name) for part in value.split(',') if part.strip()]
+
+
+def filter_inventory(queryset: QuerySet, query_params) -> QuerySet:
+    """
+    ``?type=Movie,Series``, ``?language=English`` (any of the names) and
+    ``?year_min=1990&year_max=1999`` on the metadata year.
+    """
+    types = get_names(query_params, 'type')
+    if types:
+        queryset = queryset.filter(type__name__in=types)
+    languages = get_names(query_params, 'language')
+    if languages:
+        queryset = queryset.filter(language__name__in=languages)
+
+    year_min = query_params.get('year_min')
+    year_max = query_params.get('year_max')
+    if year_min or year_max:
+        try:
+            year_min = int(year_min) if year_min else None
+            year_max = int(year_max) if year_max else None
+        except ValueError:
+            raise ValueError('year_min and year_max must be integers.')
+        queryset = queryset.alias(year=Cast(KeyTextTransform('year', 'metadata'), IntegerField()))
+        if year_min is not None:
+            queryset = queryset.filter(year__gte=year_min)
+        if year_max is not None:
+            queryset = queryset.filter(year__lte=year_max)
+    return queryset
+
+
+def count_facets(queryset: QuerySet, bucket_size: int) -> Dict[str, Dict]:
+    """
+    Count the rows of ``queryset`` per type, language, metadata year bucket
+    and tag in one statement: one pass grouped by ``GROUPING SETS`` for the
+    columns and one over the unnested ``tag_ids``.
+    """
+    rows = queryset.order_by().annotate(
+        year=Cast(KeyTextTransform('year', 'metadata'), IntegerField()),
+    ).values('type_id', 'language_id', 'tag_ids', 'year')
+    counts = {'type': {}, 'language': {}, 'year': {}, 'tag': {}}
+    try:
+        sql, params = rows.query.sql_with_params()
+    except EmptyResultSet:
+        # ``.none()``, e.g. an unknown tag name, compiles to no SQL at all.
+        return counts
+    with connection.cursor() as cursor:
+        cursor.execute(
+            f'''
+            SELECT CASE WHEN GROUPING(type_id) = 0 THEN 'type' WHEN GROUPING(language_id) = 0 THEN 'language' ELSE 'year' END,
+                   COALESCE(type_id, language_id, year / {bucket_size:d} * {bucket_size:d}), count(*)
+            FROM ({sql}) AS filtered
+            GROUP BY GROUPING SETS ((type_id), (language_id), (year / {bucket_size:d}))
+            UNION ALL
+            SELECT 'tag', tag_id, count(*) FROM ({sql}) AS filtered, unnest(filtered.tag_ids) AS tag_id GROUP BY tag_id
+            ''',
+            [*params, *params],
+        )
+        for facet, value, count in cursor.fetchall():
+            # Titles without a year form a NULL group of their own.
+            if value is not None:
+                counts[facet][value] = count
+    return counts
+
+
+def get_facets(queryset: QuerySet, query_params, bucket_size: int = 10) -> Dict[str, List[dict]]:
+    """
+    Facet counts for the filtered ``queryset``, each facet sorted by count.
+
+    Results are cached per filter until the next write to the inventory, so
+    repeated UI refreshes with the same filters do not re-count.
+    """
+    params = sorted((key, values) for key, values in query_params.lists() if key not in FACET_IGNORED_PARAMS)
+    digest = hashlib.md5(f'{bucket_size}|{params}'.encode()).hexdigest()
+    key = f'facets:inventory:{get_generations([Inventory, InventoryTag, InventoryType, InventoryLanguage])}:{digest}'
+    facets = cache.get(key)
+    if facets is not None:
+        return facets
+
+    counts = count_facets(queryset, bucket_size)
+    types = dict(InventoryType.objects.filter(pk__in=counts['type']).values_list('id', 'name'))
+    languages = dict(InventoryLanguage.objects.filter(pk__in=counts['language']).values_list('id', 'name'))
+    tags = get_tag_lookup(InventoryTag)
+
+    def by_count(items: List[dict]) -> List[dict]:
+        return sorted(items, key=lambda item: -item['count'])
+
+    facets = {
+        'type': by_count([{'id': pk, 'name': types.get(pk), 'count': count} for pk, count in counts['type'].items()]),
+        'language': by_count([
+            {'id': pk, 'name': languages.get(pk), 'count': count} for pk, count in counts['language'].items()
+        ]),
+        'tag': by_count([
+            {'id': pk, 'name': tags[pk]['name'], 'count': count} for pk, count in counts['tag'].items() if pk in tags
+        ]),
+        'year': sorted(
+            [{'from': start, 'to': start + bucket_size - 1, 'count': count} for start, count in counts['year'].items()],
+            key=lambda item: item['from'],
+        ),
+    }
+    cache.set(key, facets, timeout=FACET_CACHE_TIMEOUT)
+    return facets
@@ -0,0 +1,237 @@
+import csv
+import io
+import json
+from dataclasses import dataclass, field
+from itertools import islice
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from django.core.cache import cache
+from django.db import connection, transaction
+
+from interview.core.cache import bump_generation, get_missing_cache_key
+from interview.inventory.models import Inventory, InventoryLanguage, InventoryTag, InventoryType
+from interview.inventory.schemas import validate_metadata_many
+
+
+TAG_SEPARATOR = '|'
+
+
+@dataclass
+class ImportRecord:
+    line: int
+    name: str
+    type: str
+    language: str
+    tags: List[str]
+    metadata: Any
+    error: Optional[str] = None
+
+
+@dataclass
+class ImportResult:
+    read: int = 0
+    created: int = 0
+    skipped: int = 0
+    errors: List[Tuple[int, Any]] = field(default_factory=list)
+
+
+def parse_cell(value: str) -> Any:
+    try:
+        return json.loads(value)
+    except ValueError:
+        return value
+
+
+def read_csv(file) -> Iterator[ImportRecord]:
+    """
+    Rows need ``name``, ``type`` and ``language`` columns (``type_name`` and
+    ``language_name``, as written by ``export_inventory``, work too) and either a
+    JSON ``metadata`` column or flattened ``metadata_<key>`` columns. ``tags`` is
+    an optional ``|``-separated list of tag names.
+    """
+    for line, row in enumerate(csv.DictReader(file), start=2):
+        if row.get('metadata'):
+            metadata = parse_cell(row['metadata'])
+        else:
+            metadata = {
+                key[len('metadata_'):]: parse_cell(value)
+                for key, value in row.items()
+                if key.startswith('metadata_') and value != ''
+            }
+        yield ImportRecord(
+            line=line,
+            name=(row.get('name') or '').strip(),
+            type=(row.get('type') or row.get('type_name') or '').strip(),
+            language=(row.get('language') or row.get('language_name') or '').strip(),
+            tags=[tag.strip() for tag in (row.get('tags') or '').split(TAG_SEPARATOR) if tag.strip()],
+            metadata=metadata,
+        )
+
+
+def read_ndjson(file) -> Iterator[ImportRecord]:
+    """One JSON object per line with ``name``, ``type``, ``language``, ``tags`` (a list) and ``metadata``."""
+    for line, text in enumerate(file, start=1):
+        if not text.strip():
+            continue
+        try:
+            data = json.loads(text)
+        except ValueError as e:
+            yield ImportRecord(line=line, name='', type='', language='', tags=[], metadata=None, error=str(e))
+            continue
+        if not isinstance(data, dict):
+            yield ImportRecord(line=line, name='', type='', language='', tags=[], metadata=None, error='expected an object')
+            continue
+        tags = data.get('tags') or []
+        if not isinstance(tags, list):
+            yield ImportRecord(line=line, name='', type='', language='', tags=[], metadata=None, error='tags must be a list')
+            continue
+        yield ImportRecord(
+            line=line,
+            name=str(data.get('name') or '').strip(),
+            type=str(data.get('type') or '').strip(),
+            language=str(data.get('language') or '').strip(),
+            tags=[str(tag).strip() for tag in tags if str(tag).strip()],
+            metadata=data.get('metadata'),
+        )
+
+
+class NameMap:
+    """
+    ``name -> id`` for a lookup table, loaded with one query up front.
+
+    Names that are not known yet are created in bulk the first time they are
+    resolved; ``ignore_conflicts`` plus a re-read of the new names keeps this
+    safe against a concurrent import creating the same rows.
+    """
+
+    def __init__(self, model):
+        self.model = model
+        self.ids = dict(model.objects.values_list('name', 'id'))
+
+    def resolve(self, names: Iterable[str]) -> None:
+        missing = {name for name in names if name not in self.ids}
+        if not missing:
+            return
+
+        self.model.objects.bulk_create([self.model(name=name) for name in missing], ignore_conflicts=True)
+        self.ids.update(self.model.objects.filter(name__in=missing).values_list('name', 'id'))
+        bump_generation(self.model)
+
+    def __getitem__(self, name: str) -> int:
+        return self.ids[name]
+
+
+def copy_rows(model, columns: List[str], rows: List[tuple]) -> None:
+    """Load rows with ``COPY ... FROM STDIN`` on PostgreSQL, ``bulk_create`` elsewhere."""
+    if connection.vendor != 'postgresql':
+        model.objects.bulk_create([model(**dict(zip(columns, row))) for row in rows])
+        return
+
+    buffer = io.StringIO()
+    csv.writer(buffer).writerows(rows)
+    buffer.seek(0)
+    table = connection.ops.quote_name(model._meta.db_table)
+    column_list = ', '.join(connection.ops.quote_name(model._meta.get_field(column).column) for column in columns)
+    with connection.cursor() as cursor:
+        cursor.cursor.copy_expert(f'COPY {table} ({column_list}) FROM STDIN WITH (FORMAT csv)', buffer)
+
+
+def get_record_error(record: ImportRecord) -> Optional[str]:
+    if record.error:
+        return record.error
+    for attr in ('name', 'type', 'language'):
+        if not getattr(record, attr):
+            return f'{attr} is required'
+    return None
+
+
+def import_batch(records: List[ImportRecord], maps: Dict[str, NameMap], result: ImportResult) -> None:
+    # Earlier batches are committed by now, so this also skips repeats from earlier in the file.
+    existing = set(
+        Inventory.objects.filter(name__in={record.name for record in records if record.name}).values_list('name', flat=True)
+    )
+    batch = []
+    for record in records:
+        error = get_record_error(record)
+        if error:
+            result.errors.append((record.line, error))
+        elif record.name in existing:
+            result.skipped += 1
+        else:
+            existing.add(record.name)
+            batch.append(record)
+
+    metadata, errors = validate_metadata_many(record.metadata for record in batch)
+    valid = []
+    for index, record in enumerate(batch):
+        if index in errors:
+            existing.discard(record.name)
+            result.errors.append((record.line, errors[index]))
+        else:
+            valid.append((record, metadata[index]))
+    if not valid:
+        return
+
+    with transaction.atomic():
+        maps['type'].resolve(record.type for record, _ in valid)
+        maps['language'].resolve(record.language for record, _ in valid)
+        maps['tags'].resolve(tag for record, _ in valid for tag in record.tags)
+
+        inventories = Inventory.objects.bulk_create([
+            Inventory(
+                name=record.name,
+                type_id=maps['type'][record.type],
+                language_id=maps['language'][record.language],
+                tag_ids=sorted({maps['tags'][tag] for tag in record.tags}),
+                metadata=values,
+            )
+            for record, values in valid
+        ])
+        links = {
+            (inventory.pk, maps['tags'][tag])
+            for inventory, (record, _) in zip(inventories, valid)
+            for tag in record.tags
+        }
+        if links:
+            copy_rows(Inventory.tags.through, ['inventory_id', 'inventorytag_id'], sorted(links))
+
+    # bulk_create skips post_save, so do what the write signals would have done.
+    cache.delete_many([get_missing_cache_key(Inventory, inventory.pk) for inventory in inventories])
+    bump_generation(Inventory)
+    bump_generation(InventoryTag)
+    result.created += len(inventories)
+
+
+def read_records(path: str, file_format: Optional[str] = None) -> Iterator[ImportRecord]:
+    """Stream records from a ``.csv`` or ``.ndjson``/``.jsonl`` file, guessing the format from the suffix."""
+    if file_format is None:
+        file_format = 'csv' if path.lower().endswith('.csv') else 'ndjson'
+    reader = read_csv if file_format == 'csv' else read_ndjson
+    with open(path, newline='' if file_format == 'csv' else None, encoding='utf-8') as file:
+        yield from reader(file)
+
+
+def import_inventory(records: Iterable[ImportRecord], batch_size: int = 1000) -> Iterator[ImportResult]:
+    """
+    Create inventory from ``records`` in batches of ``batch_size``, yielding the
+    running totals after each batch.
+
+    Imports are idempotent by name: titles that already exist, or appear earlier
+    in the same file, are skipped. Invalid rows are reported and skipped without
+    failing the rest of the batch.
+    """
+    maps = {
+        'type': NameMap(InventoryType),
+        'language': NameMap(InventoryLanguage),
+        'tags': NameMap(InventoryTag),
+    }
+    result = ImportResult()
+
+    records = iter(records)
+    while True:
+        chunk = list(islice(records, batch_size))
+        if not chunk:
+            break
+        result.read += len(chunk)
+        import_batch(chunk, maps, result)
+        yield result
@@ -0,0 +1,28 @@
+from interview.jobs.registry import get_job_path, register
+
+# Handlers import their helpers when they run: this module is loaded by every
+# process at startup (see JobsConfig.ready), the exports and imports are not.
+
+
+@register('inventory.export')
+def export_inventory(payload: dict) -> dict:
+    from interview.core.export import write_export
+    from interview.inventory.exports import get_inventory_export
+
+    path = get_job_path(payload['path'])
+    path.parent.mkdir(parents=True, exist_ok=True)
+    queryset, columns = get_inventory_export(payload.get('metadata_keys'))
+    rows = write_export(queryset, columns, str(path), file_format=payload.get('format', 'csv'))
+    return {'rows': rows, 'path': payload['path']}
+
+
+@register('inventory.import')
+def import_inventory_file(payload: dict) -> dict:
+    from interview.inventory.imports import import_inventory, read_records
+
+    result = None
+    for result in import_inventory(read_records(str(get_job_path(payload['path'])), payload.get('format')), payload.get('batch_size', 1000)):
+        pass
+    if result is None:
+        return {'created': 0, 'skipped': 0, 'errors': []}
+    return {'created': result.created, 'skipped': result.skipped, 'errors': result.errors[:100]}
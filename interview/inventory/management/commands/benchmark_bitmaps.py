@@ -0,0 +1,105 @@
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+
+from interview.core.bitmaps import All, Any, Not, Term, bitmap_index
+from interview.core.cache import bump_generation
+from interview.inventory.models import Inventory, InventoryLanguage, InventoryTag, InventoryType
+
+
+class Command(BaseCommand):
+    help = (
+        'Seed N inventory titles, build the bitmap index and compare tag/type/language filters '
+        'answered from bitmaps with the same filters in SQL (count plus one page). '
+        'PostgreSQL only; run against a scratch database.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--titles', type=int, default=1_000_000)
+        parser.add_argument('--repeat', type=int, default=5)
+        parser.add_argument('--offset', type=int, default=10_000)
+
+    def handle(self, *args, **options):
+        if connection.vendor != 'postgresql':
+            raise CommandError('This benchmark needs PostgreSQL.')
+
+        types = [InventoryType.objects.create(name=f'benchmark-bitmaps-{i}') for i in range(4)]
+        languages = [InventoryLanguage.objects.create(name=f'benchmark-bitmaps-{i}') for i in range(8)]
+        tags = [InventoryTag.objects.create(name=f'benchmark-bitmaps-{i}') for i in range(20)]
+        table = Inventory._meta.db_table
+        try:
+            with connection.cursor() as cursor:
+                cursor.execute(
+                    f'''
+                    INSERT INTO {table} (name, type_id, language_id, metadata, tag_ids, created_at, updated_at)
+                    SELECT 'benchmark-bitmaps', (%s::bigint[])[1 + n %% 4], (%s::bigint[])[1 + n %% 8], '{{}}',
+                           ARRAY[(%s::bigint[])[1 + n %% 20], (%s::bigint[])[1 + n %% 7]], now(), now()
+                    FROM generate_series(1, %s) AS n
+                    ''',
+                    [
+                        [t.pk for t in types], [lang.pk for lang in languages],
+                        [t.pk for t in tags], [t.pk for t in tags], options['titles'],
+                    ],
+                )
+                cursor.execute(f'ANALYZE {table}')
+
+            bitmaps = bitmap_index.get(Inventory)
+            started = time.perf_counter()
+            bitmaps.build()
+            chunks = sum(len(bitmap.chunks) for bitmap in bitmaps.bitmaps.values())
+            self.stdout.write(
+                f'built {len(bitmaps.bitmaps)} bitmaps over {len(bitmaps.universe):,} titles '
+                f'in {time.perf_counter() - started:.1f}s, {chunks} chunks'
+            )
+
+            tag, other_tag, excluded = tags[0].pk, tags[1].pk, tags[2].pk
+            cases = (
+                ('tag', Term('tags', tag), {'tag_ids__overlap': [tag]}, {}),
+                ('tag OR tag', Term('tags', tag) | Term('tags', other_tag), {'tag_ids__overlap': [tag, other_tag]}, {}),
+                (
+                    'type AND language AND tag',
+                    All(Term('type', types[0].pk), Term('language', languages[0].pk), Term('tags', tag)),
+                    {'type_id': types[0].pk, 'language_id': languages[0].pk, 'tag_ids__contains': [tag]},
+                    {},
+                ),
+                (
+                    'type AND NOT tag',
+                    Term('type', types[1].pk) & Not(Term('tags', excluded)),
+                    {'type_id': types[1].pk},
+                    {'tag_ids__overlap': [excluded]},
+                ),
+                (
+                    'any of 8 languages',
+                    Any(*[Term('language', lang.pk) for lang in languages]),
+                    {'language_id__in': [lang.pk for lang in languages]},
+                    {},
+                ),
+            )
+            offset = options['offset']
+            for label, expression, filters, excludes in cases:
+                def from_bitmaps():
+                    result = bitmaps.evaluate(expression)
+                    return len(result), result.select(offset, 20)
+
+                def from_sql():
+                    queryset = Inventory.objects.filter(**filters).exclude(**excludes).order_by('pk')
+                    return queryset.count(), list(queryset.values_list('pk', flat=True)[offset:offset + 20])
+
+                if from_bitmaps() != from_sql():
+                    raise CommandError(f'{label}: the bitmap and SQL results differ.')
+                bitmap_ms = min(self.timed(from_bitmaps) for _ in range(options['repeat']))
+                sql_ms = min(self.timed(from_sql) for _ in range(options['repeat']))
+                self.stdout.write(f'{label:<28} bitmaps {bitmap_ms:>8.3f}ms  sql {sql_ms:>9.1f}ms')
+        finally:
+            with connection.cursor() as cursor:
+                cursor.execute(f"DELETE FROM {table} WHERE name = 'benchmark-bitmaps'")
+            bump_generation(Inventory)
+            InventoryTag.objects.filter(pk__in=[t.pk for t in tags]).delete()
+            InventoryLanguage.objects.filter(pk__in=[lang.pk for lang in languages]).delete()
+            InventoryType.objects.filter(pk__in=[t.pk for t in types]).delete()
+
+    def timed(self, func) -> float:
+        started = time.perf_counter()
+        func()
+        return (time.perf_counter() - started) * 1000
@@ -0,0 +1,76 @@
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+from django.http import QueryDict
+
+from interview.core.cache import bump_generation
+from interview.inventory.facets import count_facets, filter_inventory, get_facets
+from interview.inventory.models import Inventory, InventoryLanguage, InventoryTag, InventoryType
+
+
+QUERIES = (
+    '',
+    'type=benchmark-facets-0',
+    'type=benchmark-facets-0&language=benchmark-facets-1',
+    'year_min=1990&year_max=1999',
+    'type=benchmark-facets-0&year_min=1980',
+)
+
+
+class Command(BaseCommand):
+    help = (
+        'Seed N inventory titles, then time the facet counts of the inventory list for a few filters, '
+        'uncached and cached. PostgreSQL only; run against a scratch database.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--titles', type=int, default=1_000_000)
+        parser.add_argument('--repeat', type=int, default=3)
+
+    def handle(self, *args, **options):
+        if connection.vendor != 'postgresql':
+            raise CommandError('This benchmark needs PostgreSQL.')
+
+        types = [InventoryType.objects.create(name=f'benchmark-facets-{i}') for i in range(4)]
+        languages = [InventoryLanguage.objects.create(name=f'benchmark-facets-{i}') for i in range(8)]
+        tags = [InventoryTag.objects.create(name=f'benchmark-facets-{i}') for i in range(20)]
+        table = Inventory._meta.db_table
+        try:
+            with connection.cursor() as cursor:
+                started = time.perf_counter()
+                cursor.execute(
+                    f'''
+                    INSERT INTO {table} (name, type_id, language_id, metadata, tag_ids, created_at, updated_at)
+                    SELECT 'benchmark-facets', (%s::bigint[])[1 + n %% 4], (%s::bigint[])[1 + n %% 8],
+                           jsonb_build_object('year', 1920 + n %% 100),
+                           ARRAY[(%s::bigint[])[1 + n %% 20], (%s::bigint[])[1 + n %% 7]], now(), now()
+                    FROM generate_series(1, %s) AS n
+                    ''',
+                    [
+                        [t.pk for t in types], [lang.pk for lang in languages],
+                        [t.pk for t in tags], [t.pk for t in tags], options['titles'],
+                    ],
+                )
+                cursor.execute(f'ANALYZE {table}')
+            self.stdout.write(f'seeded {options["titles"]:,} titles in {time.perf_counter() - started:.1f}s')
+
+            for query in QUERIES:
+                params = QueryDict(query)
+                queryset = filter_inventory(Inventory.objects.all(), params)
+                uncached = min(self.timed(lambda: count_facets(queryset, 10)) for _ in range(options['repeat']))
+                get_facets(queryset, params)
+                cached = min(self.timed(lambda: get_facets(queryset, params)) for _ in range(options['repeat']))
+                self.stdout.write(f'{query or "(no filter)":<55} {uncached:>8.1f}ms uncached {cached:>6.2f}ms cached')
+        finally:
+            with connection.cursor() as cursor:
+                cursor.execute(f"DELETE FROM {table} WHERE name = 'benchmark-facets'")
+            bump_generation(Inventory)
+            InventoryTag.objects.filter(pk__in=[t.pk for t in tags]).delete()
+            InventoryLanguage.objects.filter(pk__in=[lang.pk for lang in languages]).delete()
+            InventoryType.objects.filter(pk__in=[t.pk for t in types]).delete()
+
+    def timed(self, func) -> float:
+        started = time.perf_counter()
+        func()
+        return (time.perf_counter() - started) * 1000
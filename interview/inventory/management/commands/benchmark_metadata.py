@@ -0,0 +1,58 @@
+import json
+import time
+from typing import Callable
+
+from django.core.management.base import BaseCommand
+
+from interview.inventory.schemas import InventoryMetaData, validate_metadata, validate_metadata_many
+
+
+SAMPLE = {
+    'year': 1999,
+    'actors': ['Keanu Reeves', 'Laurence Fishburne', 'Carrie-Anne Moss'],
+    'imdb_rating': 8.7,
+    'rotten_tomatoes_rating': 87,
+}
+
+
+def validate_legacy(items: list) -> None:
+    # What POST /inventory/ used to do: build the model, copy it out with
+    # .dict(), then let serializers.JSONField json-encode it again.
+    for data in items:
+        json.dumps(InventoryMetaData(**data).dict(), default=float)
+
+
+def validate_single(items: list) -> None:
+    for data in items:
+        validate_metadata(data)
+
+
+def validate_batch(items: list) -> None:
+    validate_metadata_many(items)
+
+
+class Command(BaseCommand):
+    help = 'Measure InventoryMetaData validation throughput for single and batch inputs.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--items', type=int, default=100_000)
+        parser.add_argument('--repeat', type=int, default=3)
+
+    def handle(self, *args, **options):
+        items = [dict(SAMPLE, year=1900 + i % 120) for i in range(options['items'])]
+
+        for label, func in (
+            ('legacy model + dict + json', validate_legacy),
+            ('validate_metadata (single)', validate_single),
+            ('validate_metadata_many (batch)', validate_batch),
+        ):
+            elapsed = self.measure(func, items, options['repeat'])
+            self.stdout.write(f'{label:<32} {len(items) / elapsed:>12,.0f} items/s')
+
+    def measure(self, func: Callable[[list], None], items: list, repeat: int) -> float:
+        best = float('inf')
+        for _ in range(repeat):
+            started = time.perf_counter()
+            func(items)
+            best = min(best, time.perf_counter() - started)
+        return best
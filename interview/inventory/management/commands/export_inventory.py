@@ -0,0 +1,9 @@
+from interview.core.export import ExportCommand
+from interview.inventory.exports import get_inventory_export
+
+
+class Command(ExportCommand):
+    help = 'Stream inventory with its type, language and flattened metadata to CSV or Parquet.'
+
+    def get_export(self, metadata_keys):
+        return get_inventory_export(metadata_keys)
@@ -0,0 +1,35 @@
+import time
+
+from django.core.management.base import BaseCommand
+
+from interview.inventory.imports import import_inventory, read_records
+
+
+class Command(BaseCommand):
+    help = 'Bulk import inventory from a CSV or NDJSON file, skipping titles that already exist.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('path')
+        parser.add_argument('--format', choices=['csv', 'ndjson'], help='Defaults to the file suffix.')
+        parser.add_argument('--batch-size', type=int, default=1000)
+        parser.add_argument('--max-errors', type=int, default=20, help='How many invalid rows to print.')
+
+    def handle(self, *args, **options):
+        records = read_records(options['path'], options['format'])
+        started = time.perf_counter()
+        result = None
+        for result in import_inventory(records, options['batch_size']):
+            elapsed = time.perf_counter() - started
+            self.stdout.write(f'read {result.read} rows ({result.read / elapsed:,.0f}/s), created {result.created}')
+
+        if result is None:
+            self.stdout.write('Nothing to import.')
+            return
+
+        for line, error in result.errors[:options['max_errors']]:
+            self.stderr.write(f'line {line}: {error}')
+
+        self.stdout.write(self.style.SUCCESS(
+            f'Created {result.created}, skipped {result.skipped} existing, {len(result.errors)} invalid '
+            f'in {time.perf_counter() - started:.1f}s.'
+        ))
@@ -0,0 +1,25 @@
+# Generated by Django 4.1.7 on 2026-10-19 13:28
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("inventory", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="inventory",
+            index=models.Index(
+                fields=["updated_at", "id"], name="inventory_i_updated_806441_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="inventorytag",
+            index=models.Index(
+                fields=["updated_at", "id"], name="inventory_i_updated_6094b7_idx"
+            ),
+        ),
+    ]
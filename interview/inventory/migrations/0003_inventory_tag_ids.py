@@ -0,0 +1,41 @@
+# Generated by Django 4.1.7 on 2026-10-19 13:48
+
+import django.contrib.postgres.fields
+import django.contrib.postgres.indexes
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("inventory", "0002_change_feed_indexes"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="inventory",
+            name="tag_ids",
+            field=django.contrib.postgres.fields.ArrayField(
+                base_field=models.BigIntegerField(),
+                blank=True,
+                default=list,
+                editable=False,
+                size=None,
+            ),
+        ),
+        migrations.RunSQL(
+            """
+            UPDATE inventory_inventory SET tag_ids = ARRAY(
+                SELECT inventorytag_id FROM inventory_inventory_tags
+                WHERE inventory_id = inventory_inventory.id ORDER BY inventorytag_id
+            );
+            """,
+            migrations.RunSQL.noop,
+        ),
+        migrations.AddIndex(
+            model_name="inventory",
+            index=django.contrib.postgres.indexes.GinIndex(
+                fields=["tag_ids"], name="inventory_tag_ids_gin"
+            ),
+        ),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 4.1.7 on 2026-10-19 14:22
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("inventory", "0003_inventory_tag_ids"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="inventory",
+            index=models.Index(fields=["name"], name="inventory_name_idx"),
+        ),
+    ]
@@ -1,9 +1,16 @@
+from django.contrib.postgres.fields import ArrayField
+from django.contrib.postgres.indexes import GinIndex
 from django.db import models
 
 from interview.core.behaviors import IsActiveModel, NameModel, TimestampedModel, UniqueNameModel
 
 
 class InventoryTag(UniqueNameModel, TimestampedModel, IsActiveModel, models.Model):
+
+    class Meta:
+        indexes = [
+            models.Index(fields=['updated_at', 'id']),
+        ]
         
     def __str__(self) -> str:
         return self.name
@@ -39,10 +46,18 @@ class Inventory(NameModel, TimestampedModel, models.Model):
         related_name='inventories'
     )
     tags = models.ManyToManyField(InventoryTag, related_name='inventories')
+    # Sorted copy of the tags' ids, kept in sync by interview.core.signals.
+    tag_ids = ArrayField(models.BigIntegerField(), default=list, blank=True, editable=False)
     metadata = models.JSONField()
     
     class Meta:
         verbose_name_plural = 'Inventories'
+        indexes = [
+            models.Index(fields=['updated_at', 'id']),
+            GinIndex(fields=['tag_ids'], name='inventory_tag_ids_gin'),
+            # Imports look up each batch's names to skip titles that already exist.
+            models.Index(fields=['name'], name='inventory_name_idx'),
+        ]
 
     def __str__(self) -> str:
         return self.name
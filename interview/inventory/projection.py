@@ -0,0 +1,73 @@
+from typing import List, Optional
+
+from django.db.models import Prefetch, QuerySet
+from django.db.models.fields.json import KeyTransform
+from django.db.models.functions import JSONObject
+from rest_framework.exceptions import ValidationError
+
+from interview.inventory.models import Inventory
+
+
+MAX_METADATA_KEYS = 20
+
+
+def get_metadata_keys(query_params) -> Optional[List[str]]:
+    """
+    The metadata a list returns: ``None`` for all of it (``?include=metadata``),
+    otherwise the keys named by ``?metadata_keys=year,imdb_rating`` (none by default).
+    """
+    includes = {part.strip() for value in query_params.getlist('include') for part in value.split(',')}
+    if 'metadata' in includes:
+        return None
+
+    keys = list(dict.fromkeys(
+        part.strip() for value in query_params.getlist('metadata_keys') for part in value.split(',') if part.strip()
+    ))
+    if len(keys) > MAX_METADATA_KEYS:
+        raise ValueError(f'At most {MAX_METADATA_KEYS} metadata keys can be requested at once.')
+    return keys
+
+
+def project_metadata(queryset: QuerySet, keys: Optional[List[str]]) -> QuerySet:
+    """
+    Leave ``metadata`` out of the inventory query unless ``keys`` is ``None``;
+    the listed keys are extracted in SQL into a ``metadata_projection`` object.
+    """
+    if keys is None:
+        return queryset
+    queryset = queryset.defer('metadata')
+    if keys:
+        queryset = queryset.annotate(
+            metadata_projection=JSONObject(**{key: KeyTransform(key, 'metadata') for key in keys})
+        )
+    return queryset
+
+
+def get_inventory_prefetch(keys: Optional[List[str]]) -> Prefetch:
+    """The inventory of listed orders, loaded in one query with the same metadata projection."""
+    return Prefetch('inventory', queryset=project_metadata(Inventory.objects.select_related('type', 'language'), keys))
+
+
+class MetadataProjectionMixin:
+    """
+    List responses leave ``Inventory.metadata`` out unless asked for:
+    ``?include=metadata`` returns it whole and ``?metadata_keys=year,imdb_rating``
+    only those keys. Views apply ``project_metadata``/``get_inventory_prefetch``
+    to their list queryset; ``InventorySerializer`` follows the
+    ``metadata_keys`` it finds in the serializer context.
+    """
+
+    def is_list_request(self) -> bool:
+        return self.request.method == 'GET' and getattr(self, 'action', 'list') == 'list'
+
+    def get_metadata_keys(self) -> Optional[List[str]]:
+        try:
+            return get_metadata_keys(self.request.query_params)
+        except ValueError as e:
+            raise ValidationError({'error': str(e)})
+
+    def get_serializer_context(self):
+        context = super().get_serializer_context()
+        if self.is_list_request():
+            context['metadata_keys'] = self.get_metadata_keys()
+        return context
@@ -1,10 +1,53 @@
-
 from decimal import Decimal
-from pydantic import BaseModel
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from pydantic import BaseModel, ValidationError, validate_model
 
 
 class InventoryMetaData(BaseModel):
     year: int
     actors: list[str]
     imdb_rating: Decimal
-    rotten_tomatoes_rating: int
\ No newline at end of file
+    rotten_tomatoes_rating: int
+
+
+def validate_metadata(data: Any) -> Dict[str, Any]:
+    """
+    Validate ``data`` against ``InventoryMetaData`` and return the coerced values.
+
+    Uses pydantic's ``validate_model`` directly, so no model instance is built and
+    no ``.dict()`` copy is made. Decimals are returned as floats, ready to be
+    stored in a ``JSONField``.
+    """
+    if not isinstance(data, dict):
+        raise TypeError('metadata must be an object')
+
+    values, _, errors = validate_model(InventoryMetaData, data)
+    if errors is not None:
+        raise errors
+
+    for key, value in values.items():
+        if isinstance(value, Decimal):
+            values[key] = float(value)
+    return values
+
+
+def validate_metadata_many(items: Iterable[Any]) -> Tuple[List[Optional[Dict[str, Any]]], Dict[int, List[dict]]]:
+    """
+    Validate a sequence of metadata payloads in one pass.
+
+    Returns the validated values in input order (``None`` for invalid items) and
+    the errors of each invalid item keyed by its index.
+    """
+    results = []
+    errors = {}
+    for index, data in enumerate(items):
+        try:
+            results.append(validate_metadata(data))
+        except ValidationError as e:
+            results.append(None)
+            errors[index] = e.errors()
+        except TypeError as e:
+            results.append(None)
+            errors[index] = [{'loc': (), 'msg': str(e), 'type': 'type_error'}]
+    return results, errors
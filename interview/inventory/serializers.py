@@ -1,5 +1,6 @@
 from rest_framework import serializers
 
+from interview.core.serializers import TagListField
 from interview.inventory.models import Inventory, InventoryLanguage, InventoryTag, InventoryType
 
 
@@ -24,12 +25,80 @@ class InventoryTypeSerializer(serializers.ModelSerializer):
         fields = ['id', 'name']
 
 
+class NamedRelationSerializer(serializers.ModelSerializer):
+    """
+    A type or language nested in an inventory. Writes refer to it by name and
+    create it when the name is new, so the name's unique check does not apply;
+    the validated value is the model instance itself.
+    """
+
+    class Meta:
+        fields = ['id', 'name']
+        extra_kwargs = {'name': {'validators': []}}
+
+    def to_internal_value(self, data):
+        data = super().to_internal_value(data)
+        instance, _ = self.Meta.model.objects.get_or_create(name=data['name'])
+        return instance
+
+
+class InventoryTypeNameSerializer(NamedRelationSerializer):
+
+    class Meta(NamedRelationSerializer.Meta):
+        model = InventoryType
+
+
+class InventoryLanguageNameSerializer(NamedRelationSerializer):
+
+    class Meta(NamedRelationSerializer.Meta):
+        model = InventoryLanguage
+
+
+class InventoryMetaDataField(serializers.Field):
+    """
+    Validates metadata against ``InventoryMetaData`` exactly once and stores the
+    coerced values as they come out of pydantic.
+
+    pydantic is imported on first write rather than with the module, so
+    processes that only read never load it.
+    """
+    
+    def to_internal_value(self, data):
+        from pydantic import ValidationError
+
+        from interview.inventory.schemas import validate_metadata
+
+        try:
+            return validate_metadata(data)
+        except ValidationError as e:
+            raise serializers.ValidationError({
+                '.'.join(str(part) for part in error['loc']): [error['msg']] for error in e.errors()
+            })
+        except TypeError as e:
+            raise serializers.ValidationError(str(e))
+    
+    def to_representation(self, value):
+        return value
+
+
 class InventorySerializer(serializers.ModelSerializer):
-    type = InventoryTypeSerializer()
-    language = InventoryLanguageSerializer()
-    tags = InventoryTagSerializer(many=True)
-    metadata = serializers.JSONField()
+    type = InventoryTypeNameSerializer()
+    language = InventoryLanguageNameSerializer()
+    tags = TagListField(InventoryTag)
+    metadata = InventoryMetaDataField()
     
     class Meta:
         model = Inventory
-        fields = ['id', 'name', 'type', 'language', 'tags', 'metadata']
\ No newline at end of file
+        fields = ['id', 'name', 'type', 'language', 'tags', 'metadata']
+
+    def get_fields(self):
+        # List views put the metadata their request asked for in the context
+        # (see interview.inventory.projection): none, some keys, or all of it.
+        fields = super().get_fields()
+        keys = self.context.get('metadata_keys')
+        if 'metadata_keys' in self.context and keys is not None:
+            if keys:
+                fields['metadata'] = serializers.JSONField(source='metadata_projection', read_only=True)
+            else:
+                del fields['metadata']
+        return fields
\ No newline at end of file
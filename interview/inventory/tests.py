@@ -0,0 +1,148 @@
+import pytest
+from django.core.cache import cache
+
+from interview.inventory.models import InventoryLanguage, InventoryTag, InventoryType
+from interview.inventory.views import InventoryLanguageViewSet, InventoryTagViewSet, InventoryTypeViewSet, InventoryViewSet
+
+
+pytestmark = pytest.mark.django_db
+
+LOOKUP_ROUTES = [
+    ('/inventory/tags/', InventoryTagViewSet, InventoryTag),
+    ('/inventory/languages/', InventoryLanguageViewSet, InventoryLanguage),
+    ('/inventory/types/', InventoryTypeViewSet, InventoryType),
+]
+
+
+@pytest.mark.parametrize('query', ['', '?limit=20', '?limit=20&include=metadata', '?limit=20&facets=1&tags=Action&type=Movie'])
+def test_inventory_list_within_budget(client, max_queries, inventory, query):
+    with max_queries(InventoryViewSet.max_queries['list']):
+        response = client.get(f'/inventory/{query}')
+    assert response.status_code == 200
+
+
+def test_inventory_retrieve_within_budget(client, max_queries, inventory):
+    with max_queries(InventoryViewSet.max_queries['retrieve']):
+        response = client.get(f'/inventory/{inventory.pk}/')
+    assert response.status_code == 200
+
+
+def test_inventory_batch_within_budget(client, max_queries, inventory):
+    with max_queries(InventoryViewSet.max_queries['batch']):
+        response = client.get(f'/inventory/batch/?ids={inventory.pk}')
+    assert response.status_code == 200
+
+
+def test_inventory_update_within_budget(client, max_queries, inventory):
+    with max_queries(InventoryViewSet.max_queries['partial_update']):
+        response = client.patch(f'/inventory/{inventory.pk}/', {'name': 'The Matrix Reloaded'}, content_type='application/json')
+    assert response.status_code == 200
+
+
+def test_inventory_conditional_update_within_budget(client, max_queries, inventory):
+    etag = client.get(f'/inventory/{inventory.pk}/')['ETag']
+    cache.clear()
+    with max_queries(InventoryViewSet.max_queries['partial_update']):
+        response = client.patch(
+            f'/inventory/{inventory.pk}/', {'name': 'The Matrix Reloaded'}, content_type='application/json', HTTP_IF_MATCH=etag
+        )
+    assert response.status_code == 200
+    assert response['ETag'] != etag
+
+
+@pytest.mark.parametrize('conditional', [False, True])
+def test_inventory_delete_within_budget(client, max_queries, order, conditional):
+    from interview.core.models import Tombstone
+    from interview.order.models import Order
+
+    inventory = order.inventory
+    Order.objects.create(inventory=inventory, start_date='2030-03-01', embargo_date='2030-04-01')
+    headers = {'HTTP_IF_MATCH': client.get(f'/inventory/{inventory.pk}/')['ETag']} if conditional else {}
+    cache.clear()
+    with max_queries(InventoryViewSet.max_queries['destroy']):
+        response = client.delete(f'/inventory/{inventory.pk}/', **headers)
+    assert response.status_code == 204
+    assert sorted(Tombstone.objects.values_list('stream', flat=True)) == ['inventory', 'order', 'order']
+
+
+NEW_INVENTORY = {
+    'name': 'Blade Runner',
+    'type': {'name': 'Movie'},
+    'language': {'name': 'English'},
+    'metadata': {'year': 1982, 'actors': ['Harrison Ford'], 'imdb_rating': 8.1, 'rotten_tomatoes_rating': 89},
+}
+
+
+@pytest.mark.parametrize('existing', [False, True])
+def test_inventory_create_within_budget(client, max_queries, db, existing):
+    if existing:
+        InventoryType.objects.create(name='Movie')
+        InventoryLanguage.objects.create(name='English')
+    with max_queries(InventoryViewSet.max_queries['create']):
+        response = client.post('/inventory/', NEW_INVENTORY, content_type='application/json')
+    assert response.status_code == 201
+    assert response.json()['type']['name'] == 'Movie'
+    assert InventoryType.objects.count() == InventoryLanguage.objects.count() == 1
+
+
+def test_inventory_update_with_new_type_within_budget(client, max_queries, inventory):
+    with max_queries(InventoryViewSet.max_queries['partial_update']):
+        response = client.patch(f'/inventory/{inventory.pk}/', {'type': {'name': 'Series'}}, content_type='application/json')
+    assert response.status_code == 200
+    assert response.json()['type']['name'] == 'Series'
+
+
+def test_inventory_create_replays_idempotency_key(client, db):
+    from interview.inventory.models import Inventory
+
+    first = client.post('/inventory/', NEW_INVENTORY, content_type='application/json', HTTP_IDEMPOTENCY_KEY='blade-runner')
+    replay = client.post('/inventory/', NEW_INVENTORY, content_type='application/json', HTTP_IDEMPOTENCY_KEY='blade-runner')
+    assert first.status_code == replay.status_code == 201
+    assert replay['Idempotent-Replayed'] == 'true'
+    assert replay.json() == first.json()
+    assert Inventory.objects.count() == 1
+
+
+def test_inventory_create_rejects_reused_or_malformed_keys(client, db):
+    client.post('/inventory/', NEW_INVENTORY, content_type='application/json', HTTP_IDEMPOTENCY_KEY='blade-runner')
+    response = client.post(
+        '/inventory/', {**NEW_INVENTORY, 'name': 'Alien'}, content_type='application/json', HTTP_IDEMPOTENCY_KEY='blade-runner'
+    )
+    assert response.status_code == 409
+
+    for key in ['x' * 256, 'bl\u00e4de', 'blade\trunner']:
+        response = client.post('/inventory/', NEW_INVENTORY, content_type='application/json', HTTP_IDEMPOTENCY_KEY=key)
+        assert response.status_code == 422, key
+
+
+@pytest.mark.parametrize('prefix, view, model', LOOKUP_ROUTES)
+def test_lookup_reads_within_budget(client, max_queries, inventory, prefix, view, model):
+    pk = model.objects.get().pk
+    for action, path in (('list', prefix), ('retrieve', f'{prefix}{pk}/'), ('batch', f'{prefix}batch/?ids={pk}')):
+        with max_queries(view.max_queries[action]):
+            response = client.get(path)
+        assert response.status_code == 200, action
+
+
+@pytest.mark.parametrize('prefix, view, model', LOOKUP_ROUTES)
+def test_lookup_writes_within_budget(client, max_queries, inventory, prefix, view, model):
+    with max_queries(view.max_queries['create']):
+        response = client.post(prefix, {'name': 'New'}, content_type='application/json')
+    assert response.status_code == 201
+
+    path = f'{prefix}{response.json()["id"]}/'
+    with max_queries(view.max_queries['partial_update']):
+        response = client.patch(path, {'name': 'Renamed'}, content_type='application/json')
+    assert response.status_code == 200
+
+    cache.clear()
+    with max_queries(view.max_queries['partial_update']):
+        response = client.patch(path, {'name': 'Renamed again'}, content_type='application/json', HTTP_IF_MATCH=response['ETag'])
+    assert response.status_code == 200
+
+
+@pytest.mark.parametrize('prefix, view, model', LOOKUP_ROUTES)
+def test_lookup_create_with_idempotency_key_within_budget(client, max_queries, prefix, view, model):
+    with max_queries(view.max_queries['create']):
+        response = client.post(prefix, {'name': 'New'}, content_type='application/json', HTTP_IDEMPOTENCY_KEY='create-new')
+    assert response.status_code == 201
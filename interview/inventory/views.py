@@ -1,221 +1,78 @@
-from rest_framework.response import Response
+from rest_framework.exceptions import ValidationError
 from rest_framework.request import Request
-from rest_framework.views import APIView
+from rest_framework.response import Response
 
+from interview.core.views import BitmapFilterMixin, ModelViewSet, TagFilterMixin
+from interview.inventory.facets import filter_inventory, get_facets
 from interview.inventory.models import Inventory, InventoryLanguage, InventoryTag, InventoryType
-from interview.inventory.schemas import InventoryMetaData
+from interview.inventory.projection import MetadataProjectionMixin, project_metadata
 from interview.inventory.serializers import InventoryLanguageSerializer, InventorySerializer, InventoryTagSerializer, InventoryTypeSerializer
 
 
-class InventoryListCreateView(APIView):
+class InventoryViewSet(MetadataProjectionMixin, BitmapFilterMixin, TagFilterMixin, ModelViewSet):
     queryset = Inventory.objects.all()
     serializer_class = InventorySerializer
-    
-    def post(self, request: Request, *args, **kwargs) -> Response:
-        try:
-            metadata = InventoryMetaData(**request.data['metadata'])
-        except Exception as e:
-            return Response({'error': str(e)}, status=400)
-        
-        request.data['metadata'] = metadata.dict()
-        serializer = self.serializer_class(data=request.data)
-        if not serializer.is_valid():
-            return Response(serializer.errors, status=400)
-        
-        serializer.save()
-        
-        return Response(serializer.data, status=201)
-    
-    def get(self, request: Request, *args, **kwargs) -> Response:
-        serializer = self.serializer_class(self.get_queryset(), many=True)
-        
-        return Response(serializer.data, status=200)
-    
-    def get_queryset(self):
-        return self.queryset.all()
-    
+    select_related = ('type', 'language')
+    tag_model = InventoryTag
+    normalized_fields = {'type': 'types', 'language': 'languages', 'tags': 'tags'}
+    bitmap_filters = {'type': ('type', InventoryType), 'language': ('language', InventoryLanguage)}
+    bitmap_passthrough_params = ('limit', 'offset', 'format', 'facets', 'year_bucket', 'include', 'metadata_keys')
+    # Writes naming a new type or language create it with get_or_create (up to 4 queries each, counting
+    # savepoints). Destroy cascades to the orders, whose tombstones go in with one INSERT (see batch_tombstones).
+    max_queries = {'list': 6, 'retrieve': 2, 'batch': 2, 'create': 14, 'partial_update': 7, 'destroy': 9}
 
-class InventoryRetrieveUpdateDestroyView(APIView):
-    queryset = Inventory.objects.all()
-    serializer_class = InventorySerializer
-    
-    def get(self, request: Request, *args, **kwargs) -> Response:
-        inventory = self.get_queryset(id=kwargs['id'])
-        serializer = self.serializer_class(inventory)
-        
-        return Response(serializer.data, status=200)
-    
-    def patch(self, request: Request, *args, **kwargs) -> Response:
-        inventory = self.get_queryset(id=kwargs['id'])
-        serializer = self.serializer_class(inventory, data=request.data, partial=True)
-        if not serializer.is_valid():
-            return Response(serializer.errors, status=400)
-        
-        serializer.save()
-        
-        return Response(serializer.data, status=200)
-    
-    def delete(self, request: Request, *args, **kwargs) -> Response:
-        inventory = self.get_queryset(id=kwargs['id'])
-        inventory.delete()
-        
-        return Response(status=204)
-    
-    def get_queryset(self, **kwargs):
-        return self.queryset.get(**kwargs)
+    def get_queryset(self):
+        try:
+            queryset = filter_inventory(super().get_queryset(), self.request.query_params)
+        except ValueError as e:
+            raise ValidationError({'error': str(e)})
+        if self.is_list_request():
+            queryset = project_metadata(queryset, self.get_metadata_keys())
+        return queryset
+
+    def list(self, request: Request, *args, **kwargs) -> Response:
+        """
+        Filter with ``?type=``, ``?language=``, ``?tags=`` and ``?year_min=``/``?year_max=``;
+        add ``?facets=1`` (and optionally ``?year_bucket=<years>``) for counts per facet value.
+        Metadata is left out unless asked for with ``?include=metadata`` or ``?metadata_keys=``.
+        """
+        if request.query_params.get('facets') not in ('1', 'true'):
+            return super().list(request, *args, **kwargs)
 
+        try:
+            bucket_size = int(request.query_params.get('year_bucket', 10))
+        except ValueError:
+            return Response({'error': 'year_bucket must be an integer.'}, status=400)
+        if bucket_size < 1:
+            return Response({'error': 'year_bucket must be positive.'}, status=400)
 
-class InventoryTagListCreateView(APIView):
-    queryset = InventoryTag.objects.all()
-    serializer_class = InventoryTagSerializer
-    
-    def post(self, request: Request, *args, **kwargs) -> Response:
-        serializer = self.serializer_class(data=request.data)
-        if not serializer.is_valid():
-            return Response(serializer.errors, status=400)
-        
-        serializer.save()
-        
-        return Response(serializer.data, status=201)
-    
-    def get(self, request: Request, *args, **kwargs) -> Response:
-        serializer = self.serializer_class(self.get_queryset(), many=True)
-        
-        return Response(serializer.data, status=200)
-    
-    def get_queryset(self):
-        return self.queryset.all()
+        response = super().list(request, *args, **kwargs)
+        if response.status_code != 200:
+            return response
+        data = response.data if isinstance(response.data, dict) else {'results': response.data}
+        response.data = {**data, 'facets': get_facets(self.get_queryset(), request.query_params, bucket_size)}
+        return response
 
 
-class InventoryTagRetrieveUpdateDestroyView(APIView):
+class InventoryTagViewSet(ModelViewSet):
     queryset = InventoryTag.objects.all()
     serializer_class = InventoryTagSerializer
-    
-    def get(self, request: Request, *args, **kwargs) -> Response:
-        inventory_tag = self.get_queryset(id=kwargs['id'])
-        serializer = self.serializer_class(inventory_tag)
-        
-        return Response(serializer.data, status=200)
-    
-    def patch(self, request: Request, *args, **kwargs) -> Response:
-        inventory_tag = self.get_queryset(id=kwargs['id'])
-        serializer = self.serializer_class(inventory_tag, data=request.data, partial=True)
-        if not serializer.is_valid():
-            return Response(serializer.errors, status=400)
-        
-        serializer.save()
-        
-        return Response(serializer.data, status=200)
-    
-    def delete(self, request: Request, *args, **kwargs) -> Response:
-        inventory_tag = self.get_queryset(id=kwargs['id'])
-        inventory_tag.delete()
-        
-        return Response(status=204)
-
-    def get_queryset(self, **kwargs):
-        return self.queryset.get(**kwargs)
+    conditional_list = True
+    cache_list_responses = True
+    max_queries = {'list': 1, 'retrieve': 1, 'batch': 1, 'create': 6, 'partial_update': 4}
 
 
-class InventoryLanguageListCreateView(APIView):
+class InventoryLanguageViewSet(ModelViewSet):
     queryset = InventoryLanguage.objects.all()
     serializer_class = InventoryLanguageSerializer
-    
-    def post(self, request: Request, *args, **kwargs) -> Response:
-        serializer = self.serializer_class(data=request.data)
-        if not serializer.is_valid():
-            return Response(serializer.errors, status=400)
-        
-        serializer.save()
-        
-        return Response(serializer.data, status=201)
-    
-    def get(self, request: Request, *args, **kwargs) -> Response:
-        serializer = self.serializer_class(self.get_queryset(), many=True)
-        
-        return Response(serializer.data, status=200)
-    
-    def get_queryset(self):
-        return self.queryset.all()
-
-
-class InventoryLanguageRetrieveUpdateDestroyView(APIView):
-    queryset = InventoryLanguage.objects.all()
-    serializer_class = InventoryLanguageSerializer
-    
-    def get(self, request: Request, *args, **kwargs) -> Response:
-        inventory = self.get_queryset(id=kwargs['id'])
-        serializer = self.serializer_class(inventory)
-        
-        return Response(serializer.data, status=200)
-    
-    def patch(self, request: Request, *args, **kwargs) -> Response:
-        inventory = self.get_queryset(id=kwargs['id'])
-        serializer = self.serializer_class(inventory, data=request.data, partial=True)
-        if not serializer.is_valid():
-            return Response(serializer.errors, status=400)
-        
-        serializer.save()
-        
-        return Response(serializer.data, status=200)
-    
-    def delete(self, request: Request, *args, **kwargs) -> Response:
-        inventory = self.get_queryset(id=kwargs['id'])
-        inventory.delete()
-        
-        return Response(status=204)
-    
-    def get_queryset(self, **kwargs):
-        return self.queryset.get(**kwargs)
-    
-
-class InventoryTypeListCreateView(APIView):
-    queryset = InventoryType.objects.all()
-    serializer_class = InventoryTypeSerializer
-    
-    def post(self, request: Request, *args, **kwargs) -> Response:
-        serializer = self.serializer_class(data=request.data)
-        if not serializer.is_valid():
-            return Response(serializer.errors, status=400)
-        
-        serializer.save()
-        
-        return Response(serializer.data, status=201)
-    
-    def get(self, request: Request, *args, **kwargs) -> Response:
-        serializer = self.serializer_class(self.get_queryset(), many=True)
-        
-        return Response(serializer.data, status=200)
-    
-    def get_queryset(self):
-        return self.queryset.all()
+    conditional_list = True
+    cache_list_responses = True
+    max_queries = {'list': 1, 'retrieve': 1, 'batch': 1, 'create': 6, 'partial_update': 4}
 
 
-class InventoryTypeRetrieveUpdateDestroyView(APIView):
+class InventoryTypeViewSet(ModelViewSet):
     queryset = InventoryType.objects.all()
     serializer_class = InventoryTypeSerializer
-    
-    def get(self, request: Request, *args, **kwargs) -> Response:
-        inventory = self.get_queryset(id=kwargs['id'])
-        serializer = self.serializer_class(inventory)
-        
-        return Response(serializer.data, status=200)
-    
-    def patch(self, request: Request, *args, **kwargs) -> Response:
-        inventory = self.get_queryset(id=kwargs['id'])
-        serializer = self.serializer_class(inventory, data=request.data, partial=True)
-        if not serializer.is_valid():
-            return Response(serializer.errors, status=400)
-        
-        serializer.save()
-        
-        return Response(serializer.data, status=200)
-    
-    def delete(self, request: Request, *args, **kwargs) -> Response:
-        inventory = self.get_queryset(id=kwargs['id'])
-        inventory.delete()
-        
-        return Response(status=204)
-    
-    def get_queryset(self, **kwargs):
-        return self.queryset.get(**kwargs)
\ No newline at end of file
+    conditional_list = True
+    cache_list_responses = True
+    max_queries = {'list': 1, 'retrieve': 1, 'batch': 1, 'create': 6, 'partial_update': 4}
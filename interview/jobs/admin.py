@@ -0,0 +1,9 @@
+from django.contrib import admin
+
+from interview.jobs.models import Job
+
+
+@admin.register(Job)
+class JobAdmin(admin.ModelAdmin):
+    list_display = ['id', 'kind', 'status', 'attempts', 'run_at', 'finished_at']
+    list_filter = ['status', 'kind']
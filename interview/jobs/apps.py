@@ -0,0 +1,14 @@
+from django.apps import AppConfig
+from django.utils.module_loading import autodiscover_modules
+
+
+class JobsConfig(AppConfig):
+    default_auto_field = 'django.db.models.BigAutoField'
+    name = 'interview.jobs'
+
+    def ready(self) -> None:
+        from interview.core.signals import connect_delete_receivers
+
+        connect_delete_receivers(*self.get_models())
+        # Job handlers live in each app's ``jobs.py``, like admin registrations.
+        autodiscover_modules('jobs')
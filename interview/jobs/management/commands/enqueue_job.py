@@ -0,0 +1,24 @@
+import json
+
+from django.core.management.base import BaseCommand, CommandError
+
+from interview.jobs.models import Job
+from interview.jobs.registry import get_kinds
+
+
+class Command(BaseCommand):
+    help = 'Queue a job, e.g. from cron: manage.py enqueue_job order.deactivate --payload \'{"ids": [1]}\''
+
+    def add_arguments(self, parser):
+        parser.add_argument('kind', choices=get_kinds())
+        parser.add_argument('--payload', default='{}', help='Job payload as a JSON object.')
+        parser.add_argument('--max-attempts', type=int, default=3)
+
+    def handle(self, *args, **options):
+        try:
+            payload = json.loads(options['payload'])
+        except ValueError as e:
+            raise CommandError(f'Invalid payload: {e}')
+
+        job = Job.enqueue(options['kind'], payload, max_attempts=options['max_attempts'])
+        self.stdout.write(f'Queued {job}.')
@@ -0,0 +1,78 @@
+import multiprocessing
+import os
+import signal
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand
+from django.db import connections
+
+from interview.jobs.models import Job
+from interview.jobs.runner import run_job, setup_worker
+
+
+class Command(BaseCommand):
+    help = 'Run queued jobs in a pool of worker processes.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--processes', type=int, default=os.cpu_count() or 1)
+        parser.add_argument('--poll-interval', type=float, default=1.0, help='Seconds to wait when the queue is empty.')
+        parser.add_argument(
+            '--stale-after', type=int, default=300,
+            help='Requeue (or fail, once out of attempts) running jobs without a heartbeat for this many seconds.',
+        )
+        parser.add_argument('--heartbeat-interval', type=float, default=30.0, help='Seconds between heartbeats for running jobs.')
+        parser.add_argument('--once', action='store_true', help='Exit once the queue is drained.')
+
+    def handle(self, *args, **options):
+        processes = options['processes']
+        poll_interval = options['poll_interval']
+        stale_after = timedelta(seconds=options['stale_after'])
+        heartbeat_interval = options['heartbeat_interval']
+        self.stopping = False
+        signal.signal(signal.SIGTERM, self.stop)
+        signal.signal(signal.SIGINT, self.stop)
+
+        # Children start from a clean interpreter and open their own connections.
+        connections.close_all()
+        context = multiprocessing.get_context('spawn')
+        self.stdout.write(f'Worker started with {processes} processes.')
+
+        with ProcessPoolExecutor(max_workers=processes, mp_context=context, initializer=setup_worker) as pool:
+            # Future -> id of the job it runs, heartbeated until the future completes.
+            running = {}
+            last_heartbeat = time.monotonic()
+            while not self.stopping:
+                requeued = Job.requeue_stale(stale_after)
+                if requeued:
+                    self.stdout.write(f'Requeued or failed {requeued} stale jobs.')
+
+                if running and time.monotonic() - last_heartbeat >= heartbeat_interval:
+                    Job.heartbeat(list(running.values()))
+                    last_heartbeat = time.monotonic()
+
+                claimed = Job.claim(processes - len(running)) if len(running) < processes else []
+                for job_id in claimed:
+                    running[pool.submit(run_job, job_id)] = job_id
+
+                if not running:
+                    if options['once']:
+                        break
+                    time.sleep(poll_interval)
+                    continue
+
+                done, _ = wait(running, timeout=poll_interval, return_when=FIRST_COMPLETED)
+                for future in done:
+                    del running[future]
+                    try:
+                        self.stdout.write(f'Finished {future.result()}.')
+                    except Exception as e:
+                        # The job stays running without heartbeats and is requeued once it is stale.
+                        self.stderr.write(f'Worker process failed: {e!r}')
+
+            wait(running)
+        self.stdout.write('Worker stopped.')
+
+    def stop(self, signum, frame) -> None:
+        self.stopping = True
@@ -0,0 +1,116 @@
+from datetime import timedelta
+from typing import List, Optional
+
+from django.db import models, transaction
+from django.utils import timezone
+
+from interview.core.behaviors import TimestampedModel
+
+
+class Job(TimestampedModel, models.Model):
+
+    class Status(models.TextChoices):
+        QUEUED = 'queued'
+        RUNNING = 'running'
+        SUCCEEDED = 'succeeded'
+        FAILED = 'failed'
+
+    kind = models.CharField(max_length=100)
+    payload = models.JSONField(default=dict, blank=True)
+    status = models.CharField(max_length=16, choices=Status.choices, default=Status.QUEUED)
+    attempts = models.PositiveIntegerField(default=0)
+    max_attempts = models.PositiveIntegerField(default=3)
+    run_at = models.DateTimeField(default=timezone.now)
+    started_at = models.DateTimeField(null=True, blank=True)
+    # Refreshed by the worker while the job runs; see requeue_stale.
+    heartbeat_at = models.DateTimeField(null=True, blank=True)
+    finished_at = models.DateTimeField(null=True, blank=True)
+    result = models.JSONField(null=True, blank=True)
+    error = models.TextField(blank=True)
+
+    retry_delay = timedelta(seconds=30)
+    max_retry_delay = timedelta(hours=1)
+
+    class Meta:
+        indexes = [
+            models.Index(fields=['status', 'run_at']),
+            models.Index(fields=['kind', 'status']),
+        ]
+
+    def __str__(self) -> str:
+        return f'{self.kind} #{self.pk} ({self.status})'
+
+    @classmethod
+    def enqueue(cls, kind: str, payload: Optional[dict] = None, **kwargs) -> 'Job':
+        return cls.objects.create(kind=kind, payload=payload or {}, **kwargs)
+
+    @classmethod
+    def claim(cls, limit: int) -> List[int]:
+        """Atomically move up to ``limit`` due jobs to running and return their ids."""
+        now = timezone.now()
+        with transaction.atomic():
+            ids = list(
+                cls.objects.select_for_update(skip_locked=True)
+                .filter(status=cls.Status.QUEUED, run_at__lte=now)
+                .order_by('run_at', 'id')
+                .values_list('id', flat=True)[:limit]
+            )
+            if ids:
+                cls.objects.filter(pk__in=ids).update(
+                    status=cls.Status.RUNNING,
+                    attempts=models.F('attempts') + 1,
+                    started_at=now,
+                    heartbeat_at=now,
+                    updated_at=now,
+                )
+        return ids
+
+    @classmethod
+    def heartbeat(cls, ids: List[int]) -> None:
+        """Mark running jobs as still alive, so ``requeue_stale`` leaves them to their worker."""
+        now = timezone.now()
+        cls.objects.filter(pk__in=ids, status=cls.Status.RUNNING).update(heartbeat_at=now, updated_at=now)
+
+    @classmethod
+    def requeue_stale(cls, older_than: timedelta) -> int:
+        """
+        Put running jobs whose worker stopped sending heartbeats for
+        ``older_than`` back in the queue, or fail them once they have used up
+        ``max_attempts`` (``claim`` counts every run), so a job that keeps
+        killing its worker is not retried forever.
+        """
+        now = timezone.now()
+        cutoff = now - older_than
+        stale = cls.objects.filter(status=cls.Status.RUNNING).filter(
+            models.Q(heartbeat_at__lt=cutoff) | models.Q(heartbeat_at__isnull=True, started_at__lt=cutoff)
+        )
+        failed = stale.filter(attempts__gte=models.F('max_attempts')).update(
+            status=cls.Status.FAILED,
+            error='The worker stopped responding while running this job.',
+            finished_at=now,
+            updated_at=now,
+        )
+        requeued = stale.filter(attempts__lt=models.F('max_attempts')).update(
+            status=cls.Status.QUEUED,
+            run_at=now,
+            updated_at=now,
+        )
+        return failed + requeued
+
+    def succeed(self, result: Optional[dict]) -> None:
+        self.status = self.Status.SUCCEEDED
+        self.result = result
+        self.error = ''
+        self.finished_at = timezone.now()
+        self.save(update_fields=['status', 'result', 'error', 'finished_at', 'updated_at'])
+
+    def fail(self, error: str) -> None:
+        now = timezone.now()
+        self.error = error
+        self.finished_at = now
+        if self.attempts < self.max_attempts:
+            self.status = self.Status.QUEUED
+            self.run_at = now + min(self.retry_delay * 2 ** (self.attempts - 1), self.max_retry_delay)
+        else:
+            self.status = self.Status.FAILED
+        self.save(update_fields=['status', 'error', 'finished_at', 'run_at', 'updated_at'])
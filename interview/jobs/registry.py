@@ -0,0 +1,49 @@
+from pathlib import Path
+from typing import Callable, Dict, Optional
+
+from django.conf import settings
+
+
+JobHandler = Callable[[dict], Optional[dict]]
+
+_handlers: Dict[str, JobHandler] = {}
+
+
+def register(kind: str) -> Callable[[JobHandler], JobHandler]:
+    """
+    Register ``handler(payload) -> result`` as the implementation of job ``kind``.
+
+    Handlers run in a worker process and may be retried, so they must be
+    idempotent. The returned dict (if any) is stored as the job's result.
+    """
+    def decorator(handler: JobHandler) -> JobHandler:
+        _handlers[kind] = handler
+        return handler
+    return decorator
+
+
+def get_handler(kind: str) -> Optional[JobHandler]:
+    return _handlers.get(kind)
+
+
+def get_kinds() -> list:
+    return sorted(_handlers)
+
+
+def get_job_path(path: str) -> Path:
+    """
+    Resolve a job payload's ``path`` under ``settings.JOB_FILES_DIR``. Payloads
+    come from API clients, so absolute paths and paths leaving the directory
+    (``..``, symlinks) are rejected with ``ValueError``.
+    """
+    if not isinstance(path, str) or not path:
+        raise ValueError('path must be a non-empty string.')
+    relative = Path(path)
+    if relative.is_absolute() or '..' in relative.parts:
+        raise ValueError('path must be relative to the job files directory and cannot contain "..".')
+
+    root = Path(settings.JOB_FILES_DIR).resolve()
+    resolved = (root / relative).resolve()
+    if not resolved.is_relative_to(root):
+        raise ValueError('path must stay inside the job files directory.')
+    return resolved
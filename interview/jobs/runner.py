@@ -0,0 +1,35 @@
+import traceback
+
+
+# Worker processes are spawned from a clean interpreter: this module is imported
+# before Django is set up, so models are only imported inside the functions.
+
+
+def setup_worker() -> None:
+    import django
+
+    django.setup()
+
+
+def run_job(job_id: int) -> str:
+    """Execute one claimed job in the current process and record the outcome."""
+    from django.db import close_old_connections
+
+    from interview.jobs.models import Job
+    from interview.jobs.registry import get_handler
+
+    close_old_connections()
+    job = Job.objects.get(pk=job_id)
+    handler = get_handler(job.kind)
+    try:
+        if handler is None:
+            raise LookupError(f'No handler registered for job kind {job.kind!r}.')
+        result = handler(job.payload)
+    except Exception:
+        job.fail(traceback.format_exc())
+    else:
+        job.succeed(result)
+    finally:
+        close_old_connections()
+
+    return f'{job} after {job.attempts} attempt(s)'
@@ -0,0 +1,28 @@
+from rest_framework import serializers
+
+from interview.jobs.models import Job
+from interview.jobs.registry import get_handler, get_job_path
+
+
+class JobSerializer(serializers.ModelSerializer):
+    
+    class Meta:
+        model = Job
+        fields = [
+            'id', 'kind', 'payload', 'status', 'attempts', 'max_attempts', 'run_at',
+            'started_at', 'finished_at', 'result', 'error', 'created_at',
+        ]
+        read_only_fields = ['status', 'attempts', 'started_at', 'finished_at', 'result', 'error', 'created_at']
+    
+    def validate_kind(self, value: str) -> str:
+        if get_handler(value) is None:
+            raise serializers.ValidationError(f'Unknown job kind {value!r}.')
+        return value
+
+    def validate_payload(self, value: dict) -> dict:
+        if isinstance(value, dict) and 'path' in value:
+            try:
+                get_job_path(value['path'])
+            except ValueError as e:
+                raise serializers.ValidationError(str(e))
+        return value
@@ -0,0 +1,10 @@
+
+from rest_framework.routers import SimpleRouter
+
+from interview.jobs.views import JobViewSet
+
+
+router = SimpleRouter()
+router.register('', JobViewSet, basename='jobs')
+
+urlpatterns = router.urls
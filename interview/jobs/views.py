@@ -0,0 +1,47 @@
+from datetime import timedelta
+
+from django.db.models import Avg, Count, F, Q
+from django.utils import timezone
+from rest_framework.decorators import action
+from rest_framework.request import Request
+from rest_framework.response import Response
+
+from interview.core.views import ModelViewSet
+from interview.jobs.models import Job
+from interview.jobs.serializers import JobSerializer
+
+
+class JobViewSet(ModelViewSet):
+    queryset = Job.objects.order_by('-id')
+    serializer_class = JobSerializer
+    http_method_names = ['get', 'post', 'head', 'options']
+    
+    def get_queryset(self):
+        queryset = super().get_queryset()
+        for field in ('status', 'kind'):
+            value = self.request.query_params.get(field)
+            if value:
+                queryset = queryset.filter(**{field: value})
+        return queryset
+    
+    @action(detail=False, methods=['get'])
+    def stats(self, request: Request, *args, **kwargs) -> Response:
+        """Per job kind: counts by status, mean run time and jobs finished per minute over the last hour."""
+        since = timezone.now() - timedelta(hours=1)
+        rows = Job.objects.values('kind').annotate(
+            queued=Count('id', filter=Q(status=Job.Status.QUEUED)),
+            running=Count('id', filter=Q(status=Job.Status.RUNNING)),
+            succeeded=Count('id', filter=Q(status=Job.Status.SUCCEEDED)),
+            failed=Count('id', filter=Q(status=Job.Status.FAILED)),
+            finished_last_hour=Count('id', filter=Q(status=Job.Status.SUCCEEDED, finished_at__gte=since)),
+            mean_duration=Avg(F('finished_at') - F('started_at'), filter=Q(status=Job.Status.SUCCEEDED)),
+        ).order_by('kind')
+        
+        stats = []
+        for row in rows:
+            mean_duration = row.pop('mean_duration')
+            row['mean_duration_seconds'] = mean_duration.total_seconds() if mean_duration else None
+            row['per_minute'] = row['finished_last_hour'] / 60
+            stats.append(row)
+        
+        return Response(stats, status=200)
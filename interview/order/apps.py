@@ -4,3 +4,24 @@ from django.apps import AppConfig
 class OrderConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'interview.order'
+
+    def ready(self) -> None:
+        from interview.core.bitmaps import bitmap_index
+        from interview.core.changes import change_feed
+        from interview.core.signals import connect_delete_receivers
+        from interview.core.tags import tag_arrays
+        from interview.order import events  # noqa: F401
+        from interview.order.models import Order, OrderArchive, OrderTag
+
+        tag_arrays.register(Order)
+        tag_arrays.register(OrderArchive)
+        bitmap_index.register(Order, tags='tag_ids')
+
+        change_feed.register(
+            'order',
+            Order,
+            'interview.order.serializers.OrderSerializer',
+            select_related=('inventory__type', 'inventory__language'),
+        )
+        change_feed.register('order_tag', OrderTag, 'interview.order.serializers.OrderTagSerializer')
+        connect_delete_receivers(*self.get_models())
@@ -0,0 +1,146 @@
+from datetime import date, timedelta
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from django.db import connection, transaction
+from django.db.models import Q, QuerySet
+from django.utils import timezone
+
+from interview.core.cache import bump_generation
+from interview.core.changes import change_feed
+from interview.core.models import Tombstone
+from interview.order.models import Order, OrderArchive
+
+
+ARCHIVED_FIELDS = ['id', 'inventory_id', 'start_date', 'embargo_date', 'is_active', 'tag_ids', 'created_at', 'updated_at']
+
+
+def get_archivable(expired_before: date, inactive_for: timedelta) -> QuerySet:
+    """Orders inactive for at least ``inactive_for``, or whose embargo ended before ``expired_before``."""
+    return Order.objects.filter(
+        Q(is_active=False, updated_at__lt=timezone.now() - inactive_for) | Q(embargo_date__lt=expired_before)
+    )
+
+
+def archive_orders(
+    expired_before: date,
+    inactive_for: timedelta = timedelta(days=30),
+    chunk_size: int = 5000,
+    after: int = 0,
+) -> Iterator[Tuple[int, int]]:
+    """
+    Move archivable orders and their tag links to ``OrderArchive``, one chunk
+    of ids per transaction, yielding the number moved and the last id reached.
+
+    Rows are copied and then removed with set-based statements rather than
+    ``Model.delete()``, so no per-row signals fire; tombstones are written in
+    bulk instead, so change-feed clients drop the orders from their mirror.
+    Rows locked by other writers are skipped and picked up by the next run.
+    """
+    last_id = after
+    through = Order.tags.through
+    archive_through = OrderArchive.tags.through
+    while True:
+        with transaction.atomic():
+            ids = list(
+                get_archivable(expired_before, inactive_for)
+                .filter(id__gt=last_id)
+                .select_for_update(skip_locked=True)
+                .order_by('id')
+                .values_list('id', flat=True)[:chunk_size]
+            )
+            if not ids:
+                return
+
+            now = timezone.now()
+            OrderArchive.objects.bulk_create(
+                [OrderArchive(archived_at=now, **row) for row in Order.objects.filter(id__in=ids).values(*ARCHIVED_FIELDS)],
+                ignore_conflicts=True,
+            )
+            links = through.objects.filter(order_id__in=ids)
+            archive_through.objects.bulk_create(
+                [
+                    archive_through(orderarchive_id=order_id, ordertag_id=tag_id)
+                    for order_id, tag_id in links.values_list('order_id', 'ordertag_id')
+                ],
+                ignore_conflicts=True,
+            )
+            links._raw_delete(connection.alias)
+            Order.objects.filter(id__in=ids)._raw_delete(connection.alias)
+            stream = change_feed.get_stream_name(Order)
+            if stream is not None:
+                Tombstone.objects.bulk_create([Tombstone(stream=stream, object_id=id_, deleted_at=now) for id_ in ids])
+
+        bump_generation(Order)
+        bump_generation(OrderArchive)
+        last_id = ids[-1]
+        yield len(ids), last_id
+
+
+def get_table_size(model) -> Optional[int]:
+    """Bytes used by ``model``'s table, its partitions and their indexes (PostgreSQL only)."""
+    if connection.vendor != 'postgresql':
+        return None
+    with connection.cursor() as cursor:
+        cursor.execute(
+            '''
+            SELECT coalesce(sum(pg_total_relation_size(oid)), 0) FROM pg_class
+            WHERE oid = %s::regclass OR oid IN (SELECT inhrelid FROM pg_inherits WHERE inhparent = %s::regclass)
+            ''',
+            [model._meta.db_table, model._meta.db_table],
+        )
+        return cursor.fetchone()[0]
+
+
+def include_archived(request) -> bool:
+    return request.query_params.get('include_archived', '').lower() in ('1', 'true', 'yes')
+
+
+def get_archive_queryset() -> QuerySet:
+    return OrderArchive.objects.select_related(
+        'inventory__type',
+        'inventory__language',
+    ).order_by('id')
+
+
+class QuerySetChain:
+    """
+    Read-only concatenation of querysets that DRF can paginate, serialize and
+    ``in_bulk`` like a single queryset. Slices only query the parts they cover.
+    """
+
+    def __init__(self, *querysets: QuerySet):
+        self.querysets = querysets
+        self.model = querysets[0].model
+        self.counts: Optional[List[int]] = None
+
+    def count(self) -> int:
+        if self.counts is None:
+            self.counts = [queryset.count() for queryset in self.querysets]
+        return sum(self.counts)
+
+    def __len__(self) -> int:
+        return self.count()
+
+    def __iter__(self):
+        for queryset in self.querysets:
+            yield from queryset
+
+    def __getitem__(self, index):
+        if not isinstance(index, slice):
+            raise TypeError('QuerySetChain only supports slicing.')
+        self.count()
+        start = index.start or 0
+        stop = index.stop if index.stop is not None else sum(self.counts)
+        items = []
+        for queryset, count in zip(self.querysets, self.counts):
+            if start < count and stop > 0:
+                items.extend(queryset[max(start, 0):min(stop, count)])
+            start -= count
+            stop -= count
+        return items
+
+    def in_bulk(self, ids: List[int]) -> Dict[int, object]:
+        objects = {}
+        for queryset in reversed(self.querysets):
+            objects.update(queryset.in_bulk(ids))
+        return objects
@@ -0,0 +1,98 @@
+from typing import Callable, Dict, Iterable, List, Set
+
+from django.db import transaction
+from django.db.models.signals import m2m_changed, post_init, post_save
+from django.dispatch import receiver
+
+from interview.core.pubsub import get_broker
+from interview.core.sse import EventStream
+from interview.order.models import Order
+
+
+ORDER_EVENTS = 'orders'
+
+
+def publish_order_event(event: str, order: Order) -> None:
+    """
+    Publish ``event`` with ``order`` as it is now, once the current transaction
+    commits (straight away outside one), so rolled-back writes are never announced.
+    """
+    broker = get_broker()
+    if not broker.has_subscribers(ORDER_EVENTS):
+        return
+
+    message = {
+        'event': event,
+        'data': {
+            'id': order.id,
+            'inventory_id': order.inventory_id,
+            'tag_ids': order.tag_ids,
+            'start_date': order.start_date,
+            'embargo_date': order.embargo_date,
+            'is_active': order.is_active,
+        },
+    }
+    transaction.on_commit(lambda: broker.publish(ORDER_EVENTS, message))
+
+
+def publish_orders_deactivated(ids: Iterable[int]) -> None:
+    """``order.deactivated`` for orders deactivated by a set-based ``update()``, which sends no signals."""
+    if not get_broker().has_subscribers(ORDER_EVENTS):
+        return
+
+    for order in Order.objects.filter(pk__in=list(ids)):
+        publish_order_event('order.deactivated', order)
+
+
+@receiver(post_init, sender=Order)
+def remember_is_active(sender, instance: Order, **kwargs) -> None:
+    instance._loaded_is_active = instance.is_active
+
+
+@receiver(post_save, sender=Order)
+def publish_order_saved(sender, instance: Order, created: bool, **kwargs) -> None:
+    if created:
+        event = 'order.created'
+    elif instance._loaded_is_active and not instance.is_active:
+        event = 'order.deactivated'
+    else:
+        event = 'order.updated'
+
+    instance._loaded_is_active = instance.is_active
+    publish_order_event(event, instance)
+
+
+@receiver(m2m_changed, sender=Order.tags.through)
+def publish_order_tags_changed(sender, instance, action: str, reverse: bool, pk_set, **kwargs) -> None:
+    if action not in ('post_add', 'post_remove', 'post_clear') or not get_broker().has_subscribers(ORDER_EVENTS):
+        return
+
+    orders = Order.objects.filter(pk__in=pk_set or ()) if reverse else [instance]
+    for order in orders:
+        publish_order_event('order.updated', order)
+
+
+def parse_ids(values: List[str]) -> Set[int]:
+    try:
+        return {int(part) for value in values for part in value.split(',') if part.strip()}
+    except ValueError:
+        raise ValueError('ids must be integers.')
+
+
+def get_order_filter(query: Dict[str, List[str]]) -> Callable[[dict], bool]:
+    """``?tags=1,2`` matches orders with any of the tags, ``?inventory=3`` orders of that inventory."""
+    tag_ids = parse_ids(query.get('tags', []))
+    inventory_ids = parse_ids(query.get('inventory', []))
+
+    def matches(event: dict) -> bool:
+        data = event['data']
+        if inventory_ids and data['inventory_id'] not in inventory_ids:
+            return False
+        if tag_ids and tag_ids.isdisjoint(data['tag_ids']):
+            return False
+        return True
+
+    return matches
+
+
+order_events = EventStream(ORDER_EVENTS, get_order_filter)
@@ -0,0 +1,51 @@
+from datetime import date
+from typing import Iterator, Optional, Tuple
+
+from django.db import transaction
+from django.db.models import Q
+from django.utils import timezone
+
+from interview.core.cache import bump_generation
+from interview.order.events import publish_orders_deactivated
+from interview.order.models import Order
+
+
+Cursor = Tuple[date, int]
+
+
+def expire_orders(as_of: date, chunk_size: int = 5000, after: Optional[Cursor] = None) -> Iterator[Tuple[int, Cursor]]:
+    """
+    Deactivate active orders whose ``embargo_date`` is before ``as_of``.
+
+    Works through the matching rows in ``(embargo_date, id)`` order, one chunk
+    per transaction: the keys of the next chunk are locked with ``SKIP LOCKED``
+    (rows held by other writers are left for the next run) and the chunk is
+    expired with a single set-based ``UPDATE`` (followed by an
+    ``order.deactivated`` event per order when anyone is subscribed). Locks are therefore held for one
+    chunk at a time. Yields the number of rows expired and the cursor reached
+    after each chunk; a run interrupted at any point can simply be restarted,
+    or resumed from the last reported cursor with ``after``.
+    """
+    cursor = after
+    while True:
+        candidates = Order.objects.filter(is_active=True, embargo_date__lt=as_of)
+        if cursor is not None:
+            candidates = candidates.filter(
+                Q(embargo_date__gt=cursor[0]) | Q(embargo_date=cursor[0], id__gt=cursor[1])
+            )
+
+        with transaction.atomic():
+            keys = list(
+                candidates.select_for_update(skip_locked=True)
+                .order_by('embargo_date', 'id')
+                .values_list('embargo_date', 'id')[:chunk_size]
+            )
+            if not keys:
+                return
+            ids = [id_ for _, id_ in keys]
+            expired = Order.objects.filter(id__in=ids).update(is_active=False, updated_at=timezone.now())
+            publish_orders_deactivated(ids)
+
+        bump_generation(Order)
+        cursor = keys[-1]
+        yield expired, cursor
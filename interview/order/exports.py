@@ -0,0 +1,18 @@
+from typing import List, Optional, Tuple
+
+from django.db.models import F, QuerySet
+
+from interview.inventory.exports import get_metadata_columns
+from interview.order.models import Order
+
+
+def get_order_export(metadata_keys: Optional[List[str]] = None) -> Tuple[QuerySet, List[str]]:
+    fields = ['id', 'start_date', 'embargo_date', 'is_active', 'created_at', 'updated_at', 'inventory_id']
+    columns = {
+        'inventory_name': F('inventory__name'),
+        'type_name': F('inventory__type__name'),
+        'language_name': F('inventory__language__name'),
+        **get_metadata_columns('inventory__metadata', metadata_keys),
+    }
+    queryset = Order.objects.order_by('id').values(*fields, **columns)
+    return queryset, [*fields, *columns]
@@ -0,0 +1,53 @@
+from datetime import date, timedelta
+
+from django.db import transaction
+from django.utils import timezone
+
+from interview.core.cache import bump_generation
+from interview.jobs.registry import get_job_path, register
+from interview.order.events import publish_orders_deactivated
+from interview.order.expiry import expire_orders
+from interview.order.models import Order
+
+
+@register('order.deactivate')
+def deactivate_orders(payload: dict) -> dict:
+    with transaction.atomic():
+        ids = list(
+            Order.objects.select_for_update().filter(pk__in=payload['ids'], is_active=True).values_list('id', flat=True)
+        )
+        deactivated = Order.objects.filter(pk__in=ids).update(is_active=False, updated_at=timezone.now())
+        # update() sends no signals, so announce the deactivations as expire_orders does.
+        publish_orders_deactivated(ids)
+    bump_generation(Order)
+    return {'deactivated': deactivated}
+
+
+@register('order.expire_embargoed')
+def expire_embargoed_orders(payload: dict) -> dict:
+    as_of = date.fromisoformat(payload['date']) if payload.get('date') else timezone.localdate()
+    expired = sum(count for count, _ in expire_orders(as_of, payload.get('chunk_size', 5000)))
+    return {'expired': expired, 'date': as_of.isoformat()}
+
+
+@register('order.export')
+def export_orders(payload: dict) -> dict:
+    from interview.core.export import write_export
+    from interview.order.exports import get_order_export
+
+    path = get_job_path(payload['path'])
+    path.parent.mkdir(parents=True, exist_ok=True)
+    queryset, columns = get_order_export(payload.get('metadata_keys'))
+    rows = write_export(queryset, columns, str(path), file_format=payload.get('format', 'csv'))
+    return {'rows': rows, 'path': payload['path']}
+
+
+@register('order.archive')
+def archive_old_orders(payload: dict) -> dict:
+    from interview.order.archive import archive_orders
+
+    expired_before = date.fromisoformat(payload['expired_before']) if payload.get('expired_before') else timezone.localdate() - timedelta(days=90)
+    archived = sum(
+        count for count, _ in archive_orders(expired_before, timedelta(days=payload.get('inactive_days', 30)), payload.get('chunk_size', 5000))
+    )
+    return {'archived': archived, 'expired_before': expired_before.isoformat()}
@@ -0,0 +1,43 @@
+import time
+from datetime import date, timedelta
+
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+
+from interview.order.archive import archive_orders, get_table_size
+from interview.order.models import Order, OrderArchive
+
+
+class Command(BaseCommand):
+    help = 'Move inactive and long-expired orders to the order archive in batches, and report the hot table size.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--expired-before', type=date.fromisoformat, help='Archive embargoes that ended before this day (default: 90 days ago).')
+        parser.add_argument('--inactive-days', type=int, default=30, help='Archive orders inactive for this many days.')
+        parser.add_argument('--chunk-size', type=int, default=5000)
+        parser.add_argument('--after', type=int, default=0, help='Resume after this order id.')
+        parser.add_argument('--pause', type=float, default=0, help='Seconds to sleep between chunks.')
+
+    def handle(self, *args, **options):
+        expired_before = options['expired_before'] or timezone.localdate() - timedelta(days=90)
+        rows_before = Order.objects.count()
+        size_before = get_table_size(Order)
+
+        started = time.perf_counter()
+        total = 0
+        for moved, last_id in archive_orders(expired_before, timedelta(days=options['inactive_days']), options['chunk_size'], options['after']):
+            total += moved
+            self.stdout.write(f'archived {total} orders ({total / (time.perf_counter() - started):,.0f}/s), last id {last_id}')
+            if options['pause']:
+                time.sleep(options['pause'])
+
+        rows_after = Order.objects.count()
+        self.stdout.write(self.style.SUCCESS(f'Archived {total} orders in {time.perf_counter() - started:.1f}s.'))
+        self.stdout.write(
+            f'hot orders: {rows_before:,} -> {rows_after:,} '
+            f'({100 * (rows_before - rows_after) / max(rows_before, 1):.0f}% smaller), '
+            f'{OrderArchive.objects.count():,} archived in total'
+        )
+        if size_before is not None:
+            # Freed pages are reused by new rows; VACUUM FULL or REINDEX returns them to the OS.
+            self.stdout.write(f'hot table + indexes: {size_before / 2**20:,.1f}MiB -> {get_table_size(Order) / 2**20:,.1f}MiB')
@@ -0,0 +1,82 @@
+import time
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand
+from django.db import connection
+from django.utils import timezone
+
+from interview.inventory.models import Inventory, InventoryLanguage, InventoryType
+from interview.order.expiry import expire_orders
+from interview.order.models import Order
+
+
+class Command(BaseCommand):
+    help = (
+        'Seed N synthetic orders, time expire_orders over them and remove them again. '
+        'Run against a scratch database.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--orders', type=int, default=10_000_000)
+        parser.add_argument('--chunk-size', type=int, default=5000)
+
+    def handle(self, *args, **options):
+        today = timezone.localdate()
+        inventory_type = InventoryType.objects.create(name='benchmark-expiry')
+        language = InventoryLanguage.objects.create(name='benchmark-expiry')
+        inventory = Inventory.objects.create(name='benchmark-expiry', type=inventory_type, language=language, metadata={})
+        try:
+            started = time.perf_counter()
+            self.seed(inventory, options['orders'], today)
+            self.stdout.write(f'seeded {options["orders"]:,} orders in {time.perf_counter() - started:.1f}s')
+
+            total = 0
+            slowest = 0.0
+            started = time.perf_counter()
+            chunk_started = started
+            for expired, _ in expire_orders(today, options['chunk_size']):
+                now = time.perf_counter()
+                slowest = max(slowest, now - chunk_started)
+                chunk_started = now
+                total += expired
+            elapsed = time.perf_counter() - started
+
+            self.stdout.write(
+                f'expired {total:,} orders in {elapsed:.1f}s ({total / elapsed:,.0f}/s); '
+                f'slowest chunk {slowest * 1000:.0f}ms'
+            )
+        finally:
+            with connection.cursor() as cursor:
+                cursor.execute(f'DELETE FROM {Order._meta.db_table} WHERE inventory_id = %s', [inventory.pk])
+            inventory.delete()
+            inventory_type.delete()
+            language.delete()
+
+    def seed(self, inventory: Inventory, count: int, today) -> None:
+        # Embargo dates spread 30 days either side of today, so about half expire.
+        if connection.vendor == 'postgresql':
+            with connection.cursor() as cursor:
+                cursor.execute(
+                    f'''
+                    INSERT INTO {Order._meta.db_table}
+                        (created_at, updated_at, is_active, inventory_id, start_date, embargo_date, tag_ids)
+                    SELECT now(), now(), true, %s, %s::date - 60, %s::date + (n %% 60) - 30, '{{}}'::bigint[]
+                    FROM generate_series(1, %s) AS n
+                    ''',
+                    [inventory.pk, today, today, count],
+                )
+            return
+
+        batch = 10_000
+        now = timezone.now()
+        for offset in range(0, count, batch):
+            Order.objects.bulk_create(
+                Order(
+                    inventory=inventory,
+                    start_date=today - timedelta(days=60),
+                    embargo_date=today + timedelta(days=n % 60 - 30),
+                    created_at=now,
+                    updated_at=now,
+                )
+                for n in range(offset, min(offset + batch, count))
+            )
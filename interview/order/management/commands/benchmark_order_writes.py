@@ -0,0 +1,87 @@
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, transaction
+from django.test.utils import CaptureQueriesContext
+
+from interview.inventory.models import Inventory
+from interview.order.models import Order, OrderTag
+from interview.order.serializers import OrderSerializer, OrderWriteSerializer
+
+
+class Rollback(Exception):
+    pass
+
+
+class Command(BaseCommand):
+    help = (
+        'Compare creating N orders through the nested OrderSerializer payload with the id-based '
+        'OrderWriteSerializer, one request per order and as one bulk request. Every run is rolled back.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--orders', type=int, default=500)
+
+    def handle(self, *args, **options):
+        inventories = list(Inventory.objects.select_related('type', 'language')[:20])
+        if not inventories:
+            raise CommandError('This benchmark creates orders for existing inventory; load some inventory first.')
+        tag_ids = list(OrderTag.objects.values_list('id', flat=True)[:3])
+        nested_inventories = [OrderSerializer().fields['inventory'].to_representation(inventory) for inventory in inventories]
+        count = options['orders']
+        rows = [
+            {
+                'inventory_id': inventories[i % len(inventories)].pk,
+                'tag_ids': tag_ids[:i % (len(tag_ids) + 1)],
+                'start_date': '2030-01-01',
+                'embargo_date': '2030-02-01',
+            }
+            for i in range(count)
+        ]
+
+        def nested():
+            # The nested payload cannot be saved by DRF (nested writes are unsupported and the
+            # nested type/language fail their unique-name checks), so this times its validation
+            # followed by the save() a working nested create would still need.
+            for i, row in enumerate(rows):
+                OrderSerializer(data={
+                    'inventory': nested_inventories[i % len(inventories)],
+                    'tags': [],
+                    'start_date': row['start_date'],
+                    'embargo_date': row['embargo_date'],
+                }).is_valid()
+                order = Order.objects.create(
+                    inventory_id=row['inventory_id'], start_date=row['start_date'], embargo_date=row['embargo_date']
+                )
+                order.tags.set(row['tag_ids'])
+
+        def by_ids():
+            for row in rows:
+                serializer = OrderWriteSerializer(data=row)
+                serializer.is_valid(raise_exception=True)
+                serializer.save()
+                serializer.data
+
+        def bulk():
+            serializer = OrderWriteSerializer(data=rows, many=True)
+            serializer.is_valid(raise_exception=True)
+            serializer.save()
+            serializer.data
+
+        for label, func in (('nested, per order', nested), ('ids, per order', by_ids), ('ids, one bulk request', bulk)):
+            elapsed, queries = self.measure(func)
+            self.stdout.write(
+                f'{label:<24} {elapsed * 1000:>9.1f}ms  {count / elapsed:>9,.0f} orders/s  {queries:>6} queries'
+            )
+
+    def measure(self, func):
+        with CaptureQueriesContext(connection) as context:
+            started = time.perf_counter()
+            try:
+                with transaction.atomic():
+                    func()
+                    elapsed = time.perf_counter() - started
+                    raise Rollback()
+            except Rollback:
+                pass
+        return elapsed, len(context.captured_queries)
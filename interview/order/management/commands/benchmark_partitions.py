@@ -0,0 +1,109 @@
+import json
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+from django.utils import timezone
+
+from interview.inventory.models import Inventory, InventoryLanguage, InventoryType
+from interview.order.models import Order
+from interview.order.partitions import (
+    add_months,
+    create_partitions,
+    get_create_partition_sql,
+    get_partition_name,
+    is_partitioned,
+    month_start,
+)
+
+
+class Command(BaseCommand):
+    help = (
+        'Seed N orders over the past months, then compare the partitioned order table with an '
+        'unpartitioned copy: a one-month start_date window, VACUUM and REINDEX of the newest month. '
+        'PostgreSQL only; run against a scratch database.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--orders', type=int, default=10_000_000)
+        parser.add_argument('--months', type=int, default=24)
+
+    def handle(self, *args, **options):
+        if not is_partitioned():
+            raise CommandError('The order table is not partitioned; this benchmark needs PostgreSQL.')
+
+        table = Order._meta.db_table
+        flat = f'{table}_benchmark_flat'
+        this_month = month_start(timezone.localdate())
+        first_month = add_months(this_month, 1 - options['months'])
+        inventory_type = InventoryType.objects.create(name='benchmark-partitions')
+        language = InventoryLanguage.objects.create(name='benchmark-partitions')
+        inventory = Inventory.objects.create(name='benchmark-partitions', type=inventory_type, language=language, metadata={})
+        try:
+            with connection.cursor() as cursor:
+                month = first_month
+                while month < this_month:
+                    cursor.execute(get_create_partition_sql(table, month))
+                    month = add_months(month, 1)
+                create_partitions(this_month)
+
+                started = time.perf_counter()
+                days = (add_months(this_month, 1) - first_month).days
+                cursor.execute(
+                    f'''
+                    INSERT INTO {table} (created_at, updated_at, is_active, inventory_id, start_date, embargo_date, tag_ids)
+                    SELECT now(), now(), true, %s, %s::date + (n %% %s), %s::date + (n %% %s) + 30, '{{}}'::bigint[]
+                    FROM generate_series(1, %s) AS n
+                    ''',
+                    [inventory.pk, first_month, days, first_month, days, options['orders']],
+                )
+                cursor.execute(f'CREATE TABLE {flat} (LIKE {table} INCLUDING DEFAULTS)')
+                cursor.execute(f'INSERT INTO {flat} SELECT * FROM {table} WHERE inventory_id = %s', [inventory.pk])
+                cursor.execute(f'ALTER TABLE {flat} ADD PRIMARY KEY (id)')
+                cursor.execute(f'CREATE INDEX ON {flat} (start_date)')
+                cursor.execute(f'CREATE INDEX ON {flat} (updated_at, id)')
+                cursor.execute(f'ANALYZE {table}')
+                cursor.execute(f'ANALYZE {flat}')
+                self.stdout.write(f'seeded {options["orders"]:,} orders over {options["months"]} months '
+                                  f'in {time.perf_counter() - started:.1f}s')
+
+                window = (this_month, add_months(this_month, 1))
+                for name in (table, flat):
+                    plan = self.explain(cursor, f'SELECT count(*) FROM {name} WHERE start_date >= %s AND start_date < %s', window)
+                    self.stdout.write(
+                        f'{name}: one-month window {plan["Execution Time"]:.1f}ms, '
+                        f'{len(self.scanned_relations(plan["Plan"]))} relation(s) scanned'
+                    )
+
+                # Leave dead tuples in the newest month of both tables, then clean them up.
+                newest = get_partition_name(table, this_month)
+                for name, target in ((table, newest), (flat, flat)):
+                    cursor.execute(
+                        f'UPDATE {name} SET is_active = false WHERE start_date >= %s AND start_date < %s',
+                        window,
+                    )
+                    self.stdout.write(f'VACUUM {target}: {self.timed(cursor, f"VACUUM (ANALYZE) {target}"):.0f}ms')
+                    self.stdout.write(f'REINDEX {target}: {self.timed(cursor, f"REINDEX TABLE {target}"):.0f}ms')
+        finally:
+            with connection.cursor() as cursor:
+                cursor.execute(f'DROP TABLE IF EXISTS {flat}')
+                cursor.execute(f'DELETE FROM {table} WHERE inventory_id = %s', [inventory.pk])
+            inventory.delete()
+            inventory_type.delete()
+            language.delete()
+
+    def explain(self, cursor, sql: str, params) -> dict:
+        cursor.execute(f'EXPLAIN (ANALYZE, FORMAT JSON) {sql}', params)
+        plan = cursor.fetchone()[0]
+        return (json.loads(plan) if isinstance(plan, str) else plan)[0]
+
+    def scanned_relations(self, node: dict) -> set:
+        relations = {node['Relation Name']} if 'Relation Name' in node else set()
+        for child in node.get('Plans', []):
+            relations |= self.scanned_relations(child)
+        return relations
+
+    def timed(self, cursor, sql: str) -> float:
+        started = time.perf_counter()
+        cursor.execute(sql)
+        return (time.perf_counter() - started) * 1000
@@ -0,0 +1,40 @@
+import time
+from datetime import date
+
+from django.core.management.base import BaseCommand, CommandError
+from django.utils import timezone
+
+from interview.order.expiry import expire_orders
+
+
+class Command(BaseCommand):
+    help = 'Deactivate orders whose embargo date has passed, in small resumable chunks.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--date', type=date.fromisoformat, help='Expire embargoes before this day (default: today).')
+        parser.add_argument('--chunk-size', type=int, default=5000)
+        parser.add_argument('--after', help='Resume after a cursor printed by a previous run, as DATE,ID.')
+        parser.add_argument('--pause', type=float, default=0, help='Seconds to sleep between chunks to spare replicas.')
+
+    def handle(self, *args, **options):
+        as_of = options['date'] or timezone.localdate()
+        after = None
+        if options['after']:
+            try:
+                embargo_date, id_ = options['after'].split(',')
+                after = (date.fromisoformat(embargo_date), int(id_))
+            except ValueError:
+                raise CommandError('--after must look like 2023-01-31,12345')
+
+        started = time.perf_counter()
+        total = 0
+        for expired, cursor in expire_orders(as_of, options['chunk_size'], after):
+            total += expired
+            elapsed = time.perf_counter() - started
+            self.stdout.write(
+                f'expired {total} orders ({total / elapsed:,.0f}/s), cursor {cursor[0].isoformat()},{cursor[1]}'
+            )
+            if options['pause']:
+                time.sleep(options['pause'])
+
+        self.stdout.write(self.style.SUCCESS(f'Expired {total} orders with embargo before {as_of}.'))
@@ -0,0 +1,9 @@
+from interview.core.export import ExportCommand
+from interview.order.exports import get_order_export
+
+
+class Command(ExportCommand):
+    help = 'Stream orders joined with their inventory, type and language to CSV or Parquet.'
+
+    def get_export(self, metadata_keys):
+        return get_order_export(metadata_keys)
@@ -0,0 +1,38 @@
+from datetime import date
+
+from django.core.management.base import BaseCommand, CommandError
+
+from interview.order.partitions import add_months, create_partitions, detach_partitions, get_partitions, is_partitioned, month_start
+
+
+class Command(BaseCommand):
+    help = 'Create upcoming monthly order partitions and detach or archive old ones (PostgreSQL).'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--ahead', type=int, default=3, help='Months of partitions to keep ready past this one.')
+        parser.add_argument('--retain', type=int, help='Detach partitions that ended more than this many months ago.')
+        parser.add_argument('--archive-schema', help='Move detached partitions into this schema.')
+        parser.add_argument('--list', action='store_true', help='Only print the current partitions.')
+
+    def handle(self, *args, **options):
+        if not is_partitioned():
+            raise CommandError('The order table is not partitioned; run the migrations on PostgreSQL first.')
+
+        if options['list']:
+            for partition in get_partitions():
+                bounds = 'DEFAULT' if partition.is_default else f'{partition.start} .. {partition.end}'
+                self.stdout.write(f'{partition.name}: {bounds}')
+            return
+
+        this_month = month_start(date.today())
+        for name in create_partitions(add_months(this_month, options['ahead'])):
+            self.stdout.write(f'created {name}')
+
+        if options['retain'] is not None:
+            before = add_months(this_month, -options['retain'])
+            detached = detach_partitions(before, options['archive_schema'])
+            for name in detached:
+                where = f' into {options["archive_schema"]}' if options['archive_schema'] else ''
+                self.stdout.write(f'detached {name}{where}')
+
+        self.stdout.write(self.style.SUCCESS('Order partitions are up to date.'))
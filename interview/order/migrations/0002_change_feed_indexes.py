@@ -0,0 +1,25 @@
+# Generated by Django 4.1.7 on 2026-10-19 13:28
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("order", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="order",
+            index=models.Index(
+                fields=["updated_at", "id"], name="order_order_updated_d7f5d9_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="ordertag",
+            index=models.Index(
+                fields=["updated_at", "id"], name="order_order_updated_5f1a09_idx"
+            ),
+        ),
+    ]
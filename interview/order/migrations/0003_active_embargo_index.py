@@ -0,0 +1,21 @@
+# Generated by Django 4.1.7 on 2026-10-19 13:31
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("order", "0002_change_feed_indexes"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="order",
+            index=models.Index(
+                condition=models.Q(("is_active", True)),
+                fields=["embargo_date", "id"],
+                name="order_active_embargo_idx",
+            ),
+        ),
+    ]
@@ -0,0 +1,83 @@
+"""
+Turn the order table into a table range-partitioned by month of ``start_date``
+on PostgreSQL. Other databases keep the plain table.
+
+The rows are copied into a new partitioned table that replaces the old one, so
+run it in a maintenance window on large tables. The primary key becomes
+``(id, start_date)``, as PostgreSQL requires the partition key in unique
+constraints; ids still come from one sequence and stay unique. For the same
+reason ``order_order_tags.order_id`` can no longer carry a foreign key
+constraint. Django's cascading deletes still clean up the tag links.
+
+Reversing leaves the table partitioned, which Django cannot tell apart.
+"""
+from datetime import date
+
+from django.db import migrations
+
+from interview.order.partitions import add_months, get_create_partition_sql, month_start
+
+# Monthly partitions created past the current month; maintain_order_partitions adds more.
+MONTHS_AHEAD = 3
+
+
+def partition_orders(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+
+    Order = apps.get_model('order', 'Order')
+    table = Order._meta.db_table
+    new_table = f'{table}_partitioned'
+    sequence = f'{table}_id_seq'
+    quote = schema_editor.quote_name
+    fields = Order._meta.local_concrete_fields
+    columns = ', '.join(quote(field.column) for field in fields)
+    definitions = ', '.join(
+        f'{quote(field.column)} {field.db_type(schema_editor.connection)} NOT NULL' for field in fields
+    )
+
+    with schema_editor.connection.cursor() as cursor:
+        cursor.execute(f'SELECT min(start_date), max(start_date), max(id) FROM {quote(table)}')
+        first, last, max_id = cursor.fetchone()
+
+    today = date.today()
+    month = month_start(min(first or today, today))
+    last = add_months(month_start(max(last or today, today)), MONTHS_AHEAD)
+
+    schema_editor.execute(
+        f'CREATE TABLE {quote(new_table)} ({definitions}, PRIMARY KEY (id, start_date)) '
+        f'PARTITION BY RANGE (start_date)'
+    )
+    while month <= last:
+        schema_editor.execute(get_create_partition_sql(table, month, parent=new_table))
+        month = add_months(month, 1)
+    schema_editor.execute(f'CREATE TABLE {quote(f"{table}_default")} PARTITION OF {quote(new_table)} DEFAULT')
+
+    schema_editor.execute(f'INSERT INTO {quote(new_table)} ({columns}) SELECT {columns} FROM {quote(table)}')
+    schema_editor.execute(f'DROP TABLE {quote(table)} CASCADE')
+    schema_editor.execute(f'ALTER TABLE {quote(new_table)} RENAME TO {quote(table)}')
+    schema_editor.execute(
+        f'ALTER TABLE {quote(table)} RENAME CONSTRAINT {quote(f"{new_table}_pkey")} TO {quote(f"{table}_pkey")}'
+    )
+
+    schema_editor.execute(f'CREATE SEQUENCE {quote(sequence)} OWNED BY {quote(table)}.id')
+    schema_editor.execute(f"ALTER TABLE {quote(table)} ALTER COLUMN id SET DEFAULT nextval('{sequence}')")
+    schema_editor.execute('SELECT setval(%s, %s, false)', [sequence, (max_id or 0) + 1])
+
+    # Recreate the constraints and indexes Django created on the old table, under the same names.
+    inventory = Order._meta.get_field('inventory')
+    schema_editor.execute(schema_editor._create_fk_sql(Order, inventory, '_fk_%(to_table)s_%(to_column)s'))
+    schema_editor.execute(schema_editor._create_index_sql(Order, fields=[inventory]))
+    for index in Order._meta.indexes:
+        schema_editor.execute(index.create_sql(Order, schema_editor))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("order", "0003_active_embargo_index"),
+    ]
+
+    operations = [
+        migrations.RunPython(partition_orders, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,48 @@
+# Generated by Django 4.1.7 on 2026-10-19 13:44
+
+from django.db import migrations, models
+import django.db.models.deletion
+import django.utils.timezone
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("inventory", "0002_change_feed_indexes"),
+        ("order", "0004_partition_by_start_date"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="OrderArchive",
+            fields=[
+                ("id", models.BigIntegerField(primary_key=True, serialize=False)),
+                ("start_date", models.DateField()),
+                ("embargo_date", models.DateField()),
+                ("is_active", models.BooleanField()),
+                ("created_at", models.DateTimeField()),
+                ("updated_at", models.DateTimeField()),
+                (
+                    "archived_at",
+                    models.DateTimeField(default=django.utils.timezone.now),
+                ),
+                (
+                    "inventory",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="archived_orders",
+                        to="inventory.inventory",
+                    ),
+                ),
+                (
+                    "tags",
+                    models.ManyToManyField(
+                        related_name="archived_orders", to="order.ordertag"
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name_plural": "Order Archive",
+            },
+        ),
+    ]
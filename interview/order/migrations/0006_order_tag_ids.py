@@ -0,0 +1,56 @@
+# Generated by Django 4.1.7 on 2026-10-19 13:48
+
+import django.contrib.postgres.fields
+import django.contrib.postgres.indexes
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("order", "0005_order_archive"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="order",
+            name="tag_ids",
+            field=django.contrib.postgres.fields.ArrayField(
+                base_field=models.BigIntegerField(),
+                blank=True,
+                default=list,
+                editable=False,
+                size=None,
+            ),
+        ),
+        migrations.AddField(
+            model_name="orderarchive",
+            name="tag_ids",
+            field=django.contrib.postgres.fields.ArrayField(
+                base_field=models.BigIntegerField(),
+                blank=True,
+                default=list,
+                editable=False,
+                size=None,
+            ),
+        ),
+        migrations.RunSQL(
+            """
+            UPDATE order_order SET tag_ids = ARRAY(
+                SELECT ordertag_id FROM order_order_tags
+                WHERE order_id = order_order.id ORDER BY ordertag_id
+            );
+            UPDATE order_orderarchive SET tag_ids = ARRAY(
+                SELECT ordertag_id FROM order_orderarchive_tags
+                WHERE orderarchive_id = order_orderarchive.id ORDER BY ordertag_id
+            );
+            """,
+            migrations.RunSQL.noop,
+        ),
+        migrations.AddIndex(
+            model_name="order",
+            index=django.contrib.postgres.indexes.GinIndex(
+                fields=["tag_ids"], name="order_tag_ids_gin"
+            ),
+        ),
+    ]
@@ -1,16 +1,31 @@
+from datetime import date
+
+from django.contrib.postgres.fields import ArrayField
+from django.contrib.postgres.indexes import GinIndex
 from django.db import models
+from django.utils import timezone
 
 from interview.core.behaviors import IsActiveModel, TimestampedModel, UniqueNameModel
 from interview.inventory.models import Inventory
 
 
 class OrderTag(UniqueNameModel, TimestampedModel, IsActiveModel, models.Model):
+
+    class Meta:
+        indexes = [
+            models.Index(fields=['updated_at', 'id']),
+        ]
         
     def __str__(self) -> str:
         return self.name
     
 
 class Order(TimestampedModel, IsActiveModel, models.Model):
+    """
+    On PostgreSQL the table is range-partitioned by month of ``start_date``
+    (see ``interview.order.partitions``); filter on ``start_date`` where
+    possible so queries only touch the matching partitions.
+    """
     inventory = models.ForeignKey(
         Inventory,
         on_delete=models.CASCADE,
@@ -19,6 +34,51 @@ class Order(TimestampedModel, IsActiveModel, models.Model):
     start_date = models.DateField()
     embargo_date = models.DateField()
     tags = models.ManyToManyField(OrderTag, related_name='orders')
+    # Sorted copy of the tags' ids, kept in sync by interview.core.signals.
+    tag_ids = ArrayField(models.BigIntegerField(), default=list, blank=True, editable=False)
+
+    class Meta:
+        indexes = [
+            models.Index(fields=['updated_at', 'id']),
+            GinIndex(fields=['tag_ids'], name='order_tag_ids_gin'),
+            models.Index(
+                fields=['embargo_date', 'id'],
+                condition=models.Q(is_active=True),
+                name='order_active_embargo_idx',
+            ),
+        ]
     
     def __str__(self) -> str:
-        return f'{self.inventory.name} - {self.start_date}'
\ No newline at end of file
+        return f'{self.inventory.name} - {self.start_date}'
+
+    @classmethod
+    def get_by_start_date(cls, start: date, end: date):
+        """Orders starting in ``[start, end)``: a range PostgreSQL can prune partitions with."""
+        return cls.objects.filter(start_date__gte=start, start_date__lt=end)
+
+class OrderArchive(models.Model):
+    """
+    Cold storage for inactive and long-expired orders, moved out of the order
+    table by ``interview.order.archive.archive_orders``. Rows keep their order
+    id and timestamps.
+    """
+    id = models.BigIntegerField(primary_key=True)
+    inventory = models.ForeignKey(
+        Inventory,
+        on_delete=models.CASCADE,
+        related_name='archived_orders'
+    )
+    start_date = models.DateField()
+    embargo_date = models.DateField()
+    is_active = models.BooleanField()
+    tags = models.ManyToManyField(OrderTag, related_name='archived_orders')
+    tag_ids = ArrayField(models.BigIntegerField(), default=list, blank=True, editable=False)
+    created_at = models.DateTimeField()
+    updated_at = models.DateTimeField()
+    archived_at = models.DateTimeField(default=timezone.now)
+
+    class Meta:
+        verbose_name_plural = 'Order Archive'
+
+    def __str__(self) -> str:
+        return f'{self.inventory.name} - {self.start_date} (archived)'
@@ -0,0 +1,173 @@
+import re
+from datetime import date
+from typing import List, NamedTuple, Optional
+
+from django.db import connection, transaction
+
+from interview.core.cache import bump_generation
+from interview.core.changes import change_feed
+from interview.core.models import Tombstone
+from interview.order.models import Order
+
+
+bound_pattern = re.compile(r"FROM \('([\d-]+)'\) TO \('([\d-]+)'\)")
+
+
+class Partition(NamedTuple):
+    name: str
+    start: Optional[date]
+    end: Optional[date]
+
+    @property
+    def is_default(self) -> bool:
+        return self.start is None
+
+
+def month_start(day: date) -> date:
+    return day.replace(day=1)
+
+
+def add_months(month: date, count: int) -> date:
+    index = month.year * 12 + month.month - 1 + count
+    return date(index // 12, index % 12 + 1, 1)
+
+
+def get_partition_name(table: str, month: date) -> str:
+    return f'{table}_p{month:%Y_%m}'
+
+
+def get_create_partition_sql(table: str, month: date, parent: Optional[str] = None) -> str:
+    """``CREATE TABLE`` for the partition of ``table`` holding ``start_date``s in ``month``."""
+    quote = connection.ops.quote_name
+    return (
+        f'CREATE TABLE IF NOT EXISTS {quote(get_partition_name(table, month))} '
+        f'PARTITION OF {quote(parent or table)} '
+        f"FOR VALUES FROM ('{month.isoformat()}') TO ('{add_months(month, 1).isoformat()}')"
+    )
+
+
+def is_partitioned() -> bool:
+    if connection.vendor != 'postgresql':
+        return False
+    with connection.cursor() as cursor:
+        cursor.execute('SELECT 1 FROM pg_partitioned_table WHERE partrelid = %s::regclass', [Order._meta.db_table])
+        return cursor.fetchone() is not None
+
+
+def get_partitions() -> List[Partition]:
+    with connection.cursor() as cursor:
+        cursor.execute(
+            '''
+            SELECT child.relname, pg_get_expr(child.relpartbound, child.oid)
+            FROM pg_inherits
+            JOIN pg_class child ON child.oid = pg_inherits.inhrelid
+            WHERE pg_inherits.inhparent = %s::regclass
+            ORDER BY child.relname
+            ''',
+            [Order._meta.db_table],
+        )
+        rows = cursor.fetchall()
+
+    partitions = []
+    for name, bound in rows:
+        match = bound_pattern.search(bound)
+        if match:
+            partitions.append(Partition(name, date.fromisoformat(match[1]), date.fromisoformat(match[2])))
+        else:
+            partitions.append(Partition(name, None, None))
+    return partitions
+
+
+def create_partitions(through: date) -> List[str]:
+    """
+    Create the monthly partitions from the current month up to and including
+    ``through``'s month. Orders already in the default partition for a new
+    month are moved into it, since PostgreSQL refuses to create a partition
+    whose rows the default partition holds.
+    """
+    quote = connection.ops.quote_name
+    table = Order._meta.db_table
+    partitions = get_partitions()
+    existing = {partition.name for partition in partitions}
+    default = next((partition.name for partition in partitions if partition.is_default), None)
+    created = []
+    month = month_start(date.today())
+    with connection.cursor() as cursor:
+        while month <= month_start(through):
+            name = get_partition_name(table, month)
+            if name not in existing:
+                bounds = [month, add_months(month, 1)]
+                in_default = False
+                if default:
+                    cursor.execute(
+                        f'SELECT EXISTS (SELECT 1 FROM {quote(default)} WHERE start_date >= %s AND start_date < %s)',
+                        bounds,
+                    )
+                    in_default = cursor.fetchone()[0]
+                with transaction.atomic():
+                    if in_default:
+                        cursor.execute(f'CREATE TABLE {quote(name)} (LIKE {quote(table)} INCLUDING DEFAULTS)')
+                        cursor.execute(
+                            f'WITH moved AS (DELETE FROM {quote(default)} WHERE start_date >= %s AND start_date < %s RETURNING *) '
+                            f'INSERT INTO {quote(name)} SELECT * FROM moved',
+                            bounds,
+                        )
+                        cursor.execute(
+                            f'ALTER TABLE {quote(table)} ATTACH PARTITION {quote(name)} FOR VALUES FROM (%s) TO (%s)',
+                            bounds,
+                        )
+                    else:
+                        cursor.execute(get_create_partition_sql(table, month))
+                created.append(name)
+            month = add_months(month, 1)
+    return created
+
+
+def detach_partitions(before: date, archive_schema: Optional[str] = None) -> List[str]:
+    """
+    Detach the monthly partitions that end on or before ``before``. The tables
+    are kept, and moved to ``archive_schema`` when one is given.
+
+    Their orders are recorded as ``Tombstone`` rows, so the change feed and the
+    bitmap index see them leave. Their tag links are removed (``tag_ids`` keeps
+    the tags) and the detached tables lose their foreign keys, so inventory can
+    still be deleted and ``TRUNCATE``d. (``DETACH ... CONCURRENTLY`` is not
+    offered: PostgreSQL refuses it while the table has a default partition.)
+    """
+    quote = connection.ops.quote_name
+    table = Order._meta.db_table
+    links = Order.tags.through._meta.db_table
+    stream = change_feed.get_stream_name(Order)
+    detached = []
+    with transaction.atomic(), connection.cursor() as cursor:
+        # Django's foreign keys are deferred; check any pending ones now, as
+        # PostgreSQL will not alter a table with deferred checks outstanding.
+        cursor.execute('SET CONSTRAINTS ALL IMMEDIATE')
+        if archive_schema:
+            cursor.execute(f'CREATE SCHEMA IF NOT EXISTS {quote(archive_schema)}')
+        for partition in get_partitions():
+            if partition.is_default or partition.end > before:
+                continue
+            if stream is not None:
+                cursor.execute(
+                    f'INSERT INTO {quote(Tombstone._meta.db_table)} (stream, object_id, deleted_at) '
+                    f'SELECT %s, id, now() FROM {quote(partition.name)}',
+                    [stream],
+                )
+            cursor.execute(
+                f'DELETE FROM {quote(links)} WHERE order_id IN (SELECT id FROM {quote(partition.name)})'
+            )
+            cursor.execute(f'ALTER TABLE {quote(table)} DETACH PARTITION {quote(partition.name)}')
+            cursor.execute(
+                "SELECT conname FROM pg_constraint WHERE conrelid = %s::regclass AND contype = 'f'",
+                [partition.name],
+            )
+            for (constraint,) in cursor.fetchall():
+                cursor.execute(f'ALTER TABLE {quote(partition.name)} DROP CONSTRAINT {quote(constraint)}')
+            if archive_schema:
+                cursor.execute(f'ALTER TABLE {quote(partition.name)} SET SCHEMA {quote(archive_schema)}')
+            detached.append(partition.name)
+
+    if detached:
+        bump_generation(Order)
+    return detached
@@ -1,4 +1,10 @@
+from typing import List
+
+from django.db import transaction
+from django.db.models.signals import post_save
 from rest_framework import serializers
+from interview.core.serializers import TagListField
+from interview.inventory.models import Inventory
 from interview.inventory.serializers import InventorySerializer
 
 from interview.order.models import Order, OrderTag
@@ -12,9 +18,84 @@ class OrderTagSerializer(serializers.ModelSerializer):
 
 
 class OrderSerializer(serializers.ModelSerializer):
-    inventory = InventorySerializer()
-    tags = OrderTagSerializer(many=True)
+    # Orders are created from ids (see OrderWriteSerializer); updates leave the inventory alone.
+    inventory = InventorySerializer(read_only=True)
+    tags = TagListField(OrderTag)
     
     class Meta:
         model = Order
-        fields = ['id', 'inventory', 'start_date', 'embargo_date', 'tags', 'is_active']
\ No newline at end of file
+        fields = ['id', 'inventory', 'start_date', 'embargo_date', 'tags', 'is_active']
+
+
+def get_relation_errors(items: List[dict]) -> List[dict]:
+    """Per item, the inventory and tag ids that do not exist, checked with one ``id__in`` query per relation."""
+    inventory_ids = set(
+        Inventory.objects.filter(id__in={item['inventory_id'] for item in items}).values_list('id', flat=True)
+    )
+    tag_ids = {pk for item in items for pk in item['tag_ids']}
+    if tag_ids:
+        tag_ids = set(OrderTag.objects.filter(id__in=tag_ids).values_list('id', flat=True))
+
+    errors = []
+    for item in items:
+        error = {}
+        if item['inventory_id'] not in inventory_ids:
+            error['inventory_id'] = [f'Invalid pk "{item["inventory_id"]}" - object does not exist.']
+        missing = [pk for pk in item['tag_ids'] if pk not in tag_ids]
+        if missing:
+            error['tag_ids'] = [f'Invalid pk "{pk}" - object does not exist.' for pk in missing]
+        errors.append(error)
+    return errors
+
+
+def create_orders(items: List[dict]) -> List[Order]:
+    """Insert the orders and their tag links with one ``INSERT`` each, in one transaction."""
+    through = Order.tags.through
+    orders = [Order(**{**item, 'tag_ids': sorted(set(item['tag_ids']))}) for item in items]
+    with transaction.atomic():
+        Order.objects.bulk_create(orders)
+        through.objects.bulk_create([through(order_id=order.pk, ordertag_id=pk) for order in orders for pk in order.tag_ids])
+        # bulk_create() skips the save signals; send them as save() would (caches, events, bitmaps).
+        for order in orders:
+            post_save.send(sender=Order, instance=order, created=True, update_fields=None, raw=False, using=order._state.db)
+    return orders
+
+
+class OrderWriteListSerializer(serializers.ListSerializer):
+
+    def to_internal_value(self, data):
+        items = super().to_internal_value(data)
+        errors = get_relation_errors(items)
+        if any(errors):
+            raise serializers.ValidationError(errors)
+        return items
+
+    def create(self, validated_data: List[dict]) -> List[Order]:
+        return create_orders(validated_data)
+
+
+class OrderWriteSerializer(serializers.ModelSerializer):
+    """
+    Creates orders from ids rather than nested objects:
+    ``{"inventory_id": 1, "tag_ids": [2, 3], "start_date": ..., "embargo_date": ...}``,
+    or a list of them to create in one transaction. The response echoes the ids.
+    """
+    inventory_id = serializers.IntegerField()
+    tag_ids = serializers.ListField(child=serializers.IntegerField(), default=list)
+
+    class Meta:
+        model = Order
+        fields = ['id', 'inventory_id', 'start_date', 'embargo_date', 'tag_ids', 'is_active']
+        list_serializer_class = OrderWriteListSerializer
+
+    def to_internal_value(self, data):
+        attrs = super().to_internal_value(data)
+        # A list checks the ids of all its items at once.
+        if not isinstance(self.parent, serializers.ListSerializer):
+            errors = get_relation_errors([attrs])[0]
+            if errors:
+                raise serializers.ValidationError(errors)
+        return attrs
+
+    def create(self, validated_data: dict) -> Order:
+        return create_orders([validated_data])[0]
@@ -0,0 +1,133 @@
+import pytest
+from django.core.cache import cache
+
+from interview.order.models import OrderTag
+from interview.order.views import (
+    OrderBatchRetrieveView,
+    OrderListCreateView,
+    OrderRetrieveUpdateDestroyView,
+    OrderTagListCreateView,
+)
+
+
+pytestmark = pytest.mark.django_db
+
+
+@pytest.mark.parametrize('query', ['', '?limit=20', '?tags=Priority&limit=20', '?include_archived=1&metadata_keys=year'])
+def test_order_list_within_budget(client, max_queries, order, query):
+    with max_queries(OrderListCreateView.max_queries['get']):
+        response = client.get(f'/orders/{query}')
+    assert response.status_code == 200
+
+
+@pytest.mark.parametrize('count', [1, 50])
+def test_order_create_within_budget(client, max_queries, inventory, count):
+    tag = OrderTag.objects.create(name='Priority')
+    item = {'inventory_id': inventory.pk, 'tag_ids': [tag.pk], 'start_date': '2030-01-01', 'embargo_date': '2030-02-01'}
+    body = item if count == 1 else [item] * count
+    with max_queries(OrderListCreateView.max_queries['post']):
+        response = client.post('/orders/', body, content_type='application/json', HTTP_IDEMPOTENCY_KEY=f'orders-{count}')
+    assert response.status_code == 201
+
+
+@pytest.mark.parametrize('query', ['', '&include_archived=1'])
+def test_order_batch_within_budget(client, max_queries, order, query):
+    with max_queries(OrderBatchRetrieveView.max_queries):
+        response = client.get(f'/orders/batch/?ids={order.pk}{query}')
+    assert response.status_code == 200
+
+
+@pytest.mark.parametrize('query', ['', '?include_archived=1'])
+def test_order_retrieve_within_budget(client, max_queries, order, query):
+    with max_queries(OrderRetrieveUpdateDestroyView.max_queries['get']):
+        response = client.get(f'/orders/{order.pk}/{query}')
+    assert response.status_code == 200
+
+
+def test_order_update_and_delete_within_budget(client, max_queries, order):
+    with max_queries(OrderRetrieveUpdateDestroyView.max_queries['patch']):
+        response = client.patch(f'/orders/{order.pk}/', {'is_active': False}, content_type='application/json')
+    assert response.status_code == 200
+
+    with max_queries(OrderRetrieveUpdateDestroyView.max_queries['delete']):
+        response = client.delete(f'/orders/{order.pk}/')
+    assert response.status_code == 204
+
+
+@pytest.mark.parametrize('method, body', [
+    ('put', {'start_date': '2030-01-02', 'embargo_date': '2030-02-02', 'is_active': False}),
+    ('patch', {'is_active': False}),
+])
+@pytest.mark.parametrize('conditional', [False, True])
+def test_order_update_within_budget(client, max_queries, order, method, body, conditional):
+    etag = client.get(f'/orders/{order.pk}/')['ETag']
+    cache.clear()
+    headers = {'HTTP_IF_MATCH': etag} if conditional else {}
+    with max_queries(OrderRetrieveUpdateDestroyView.max_queries[method]):
+        response = getattr(client, method)(f'/orders/{order.pk}/', body, content_type='application/json', **headers)
+    assert response.status_code == 200
+    assert response.json()['is_active'] is False
+    assert response['ETag'] != etag
+
+
+def test_order_conditional_delete_within_budget(client, max_queries, order):
+    etag = client.get(f'/orders/{order.pk}/')['ETag']
+    cache.clear()
+    with max_queries(OrderRetrieveUpdateDestroyView.max_queries['delete']):
+        response = client.delete(f'/orders/{order.pk}/', HTTP_IF_MATCH=etag)
+    assert response.status_code == 204
+
+
+def test_order_tags_within_budget(client, max_queries, order):
+    with max_queries(OrderTagListCreateView.max_queries['get']):
+        response = client.get('/orders/tags/')
+    assert response.status_code == 200
+
+    with max_queries(OrderTagListCreateView.max_queries['post']):
+        response = client.post('/orders/tags/', {'name': 'Rush'}, content_type='application/json')
+    assert response.status_code == 201
+
+
+def test_deactivate_job_publishes_events(order, monkeypatch, django_capture_on_commit_callbacks):
+    from interview.core.pubsub import get_broker
+    from interview.order.jobs import deactivate_orders
+
+    broker = get_broker()
+    published = []
+    monkeypatch.setattr(broker, 'has_subscribers', lambda channel: True)
+    monkeypatch.setattr(broker, 'publish', lambda channel, message: published.append(message))
+
+    with django_capture_on_commit_callbacks(execute=True):
+        assert deactivate_orders({'ids': [order.pk]}) == {'deactivated': 1}
+    assert [(message['event'], message['data']['id']) for message in published] == [('order.deactivated', order.pk)]
+
+    with django_capture_on_commit_callbacks(execute=True):
+        assert deactivate_orders({'ids': [order.pk]}) == {'deactivated': 0}
+    assert len(published) == 1
+
+
+def test_detached_partition_does_not_block_inventory_delete(order):
+    from datetime import date
+
+    from django.db import connection
+
+    from interview.order.models import Order
+    from interview.order.partitions import detach_partitions, get_create_partition_sql, get_partition_name, is_partitioned
+
+    if not is_partitioned():
+        pytest.skip('Order partitioning needs PostgreSQL.')
+
+    table = Order._meta.db_table
+    with connection.cursor() as cursor:
+        cursor.execute(get_create_partition_sql(table, date(2020, 1, 1)))
+    old = Order.objects.create(inventory=order.inventory, start_date='2020-01-15', embargo_date='2020-02-15')
+    old.tags.set(order.tags.all())
+
+    assert detach_partitions(date(2020, 2, 1)) == [get_partition_name(table, date(2020, 1, 1))]
+    assert not Order.tags.through.objects.filter(order_id=old.pk).exists()
+
+    order.inventory.delete()
+    with connection.cursor() as cursor:
+        # Run the deferred foreign key checks the test transaction would otherwise never reach.
+        cursor.execute('SET CONSTRAINTS ALL IMMEDIATE')
+    assert not Order.objects.exists()
@@ -1,9 +1,11 @@
 
 from django.urls import path
-from interview.order.views import OrderListCreateView, OrderTagListCreateView
+from interview.order.views import OrderBatchRetrieveView, OrderListCreateView, OrderRetrieveUpdateDestroyView, OrderTagListCreateView
 
 
 urlpatterns = [
+    path('<int:id>/', OrderRetrieveUpdateDestroyView.as_view(), name='orders-detail'),
+    path('batch/', OrderBatchRetrieveView.as_view(), name='order-batch'),
     path('tags/', OrderTagListCreateView.as_view(), name='order-detail'),
     path('', OrderListCreateView.as_view(), name='order-list'),
 
@@ -1,15 +1,125 @@
-from django.shortcuts import render
+from django.http import Http404
+from django.shortcuts import get_object_or_404, render
 from rest_framework import generics
+from rest_framework.request import Request
+from rest_framework.response import Response
 
-from interview.order.models import Order, OrderTag
-from interview.order.serializers import OrderSerializer, OrderTagSerializer
+from interview.core.views import (
+    BatchRetrieveView,
+    BitmapFilterMixin,
+    CachedListMixin,
+    ConditionalUpdateMixin,
+    IdempotentCreateMixin,
+    NormalizedListMixin,
+    TagFilterMixin,
+)
+from interview.inventory.models import Inventory, InventoryLanguage, InventoryTag, InventoryType
+from interview.inventory.projection import MetadataProjectionMixin, get_inventory_prefetch
+from interview.order.archive import QuerySetChain, get_archive_queryset, include_archived
+from interview.order.models import Order, OrderArchive, OrderTag
+from interview.order.serializers import OrderSerializer, OrderTagSerializer, OrderWriteSerializer
 
 # Create your views here.
-class OrderListCreateView(generics.ListCreateAPIView):
+class OrderListCreateView(
+    IdempotentCreateMixin,
+    MetadataProjectionMixin,
+    BitmapFilterMixin,
+    TagFilterMixin,
+    CachedListMixin,
+    NormalizedListMixin,
+    generics.ListCreateAPIView,
+):
     queryset = Order.objects.all()
     serializer_class = OrderSerializer
+    cache_list_responses = True
+    list_cache_models = (OrderArchive, OrderTag, Inventory, InventoryType, InventoryLanguage, InventoryTag)
+    throttle_scope = 'orders'
+    tag_model = OrderTag
+    bitmap_passthrough_params = ('limit', 'offset', 'format', 'include', 'metadata_keys')
+    normalized_fields = {
+        'tags': 'tags',
+        'inventory': 'inventory',
+        'inventory.type': 'inventory_types',
+        'inventory.language': 'inventory_languages',
+        'inventory.tags': 'inventory_tags',
+    }
+
+    # Orders a single POST of a list can create.
+    max_create_batch_size = 1000
+    max_queries = {'get': 6, 'post': 10}
+
+    def get_serializer_class(self):
+        if self.request.method == 'POST':
+            return OrderWriteSerializer
+        return super().get_serializer_class()
+
+    def get_serializer(self, *args, **kwargs):
+        if isinstance(kwargs.get('data'), list):
+            kwargs.update(many=True, allow_empty=False, max_length=self.max_create_batch_size)
+        return super().get_serializer(*args, **kwargs)
+
+    def get_queryset(self):
+        queryset = super().get_queryset()
+        archive = self.filter_tags(get_archive_queryset()) if include_archived(self.request) else None
+        if self.is_list_request():
+            # Each listed inventory is loaded once, without the metadata the request did not ask for.
+            inventory = get_inventory_prefetch(self.get_metadata_keys())
+            queryset = queryset.prefetch_related(inventory)
+            if archive is not None:
+                archive = archive.select_related(None).prefetch_related(inventory)
+        if archive is not None:
+            return QuerySetChain(queryset.order_by('id'), archive)
+        return queryset
     
 
-class OrderTagListCreateView(generics.ListCreateAPIView):
+class OrderBatchRetrieveView(BatchRetrieveView):
+    queryset = Order.objects.select_related(
+        'inventory__type',
+        'inventory__language',
+    )
+    serializer_class = OrderSerializer
+    max_queries = 4
+
+    def get_queryset(self):
+        queryset = super().get_queryset()
+        if include_archived(self.request):
+            return QuerySetChain(queryset, get_archive_queryset())
+        return queryset
+
+
+class OrderRetrieveUpdateDestroyView(ConditionalUpdateMixin, generics.RetrieveUpdateDestroyAPIView):
+    queryset = Order.objects.select_related(
+        'inventory__type',
+        'inventory__language',
+    )
+    serializer_class = OrderSerializer
+    lookup_field = 'id'
+    max_queries = {'get': 6, 'put': 5, 'patch': 5, 'delete': 5}
+
+    def get_object(self):
+        try:
+            return super().get_object()
+        except Http404:
+            if self.request.method != 'GET' or not include_archived(self.request):
+                raise
+        return get_object_or_404(get_archive_queryset(), id=self.kwargs['id'])
+
+    def retrieve(self, request: Request, *args, **kwargs) -> Response:
+        order = self.get_object()
+        serializer = self.get_serializer(order)
+        
+        return Response(serializer.data, status=200, headers=self.get_etag_headers(order))
+    
+    def perform_update(self, serializer: OrderSerializer) -> None:
+        self.save_conditionally(self.request, serializer)
+        self.headers.update(self.get_etag_headers(serializer.instance))
+    
+    def perform_destroy(self, instance: Order) -> None:
+        self.delete_conditionally(self.request, instance)
+
+
+class OrderTagListCreateView(CachedListMixin, generics.ListCreateAPIView):
     queryset = OrderTag.objects.all()
     serializer_class = OrderTagSerializer
+    cache_list_responses = True
+    max_queries = {'get': 1, 'post': 2}